@@ -0,0 +1,85 @@
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.append('.')
+
+from src.storage.embeddings import (
+    CachedEmbedder,
+    ChromaDefaultEmbedder,
+    Embedder,
+    HashingEmbedder,
+    SentenceTransformerEmbedder,
+)
+
+_VERBS = ["Call", "Email", "Finish", "Review", "Prepare", "Book", "Buy", "Plan", "Clean", "Study"]
+_OBJECTS = ["the quarterly report", "mom", "the dentist", "groceries", "slides for the client",
+            "the gym session", "chapter 4", "flight tickets", "the kitchen", "the sprint retro"]
+
+BACKENDS: Dict[str, Callable[[int], Embedder]] = {
+    "hashing": lambda batch_size: HashingEmbedder(batch_size=batch_size),
+    "default": lambda batch_size: ChromaDefaultEmbedder(batch_size=batch_size),
+    "sentence_transformers": lambda batch_size: SentenceTransformerEmbedder(batch_size=batch_size),
+}
+
+
+def sample_documents(count: int, seed: int = 0) -> List[str]:
+    """Generates distinct task documents shaped like `title + description`."""
+    rng = random.Random(seed)
+    return [f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} #{i}" for i in range(count)]
+
+
+def measure(embed: Callable[[List[str]], object], documents: List[str]) -> float:
+    """Returns the throughput of one call, in documents per second."""
+    started = time.perf_counter()
+    embed(documents)
+    elapsed = time.perf_counter() - started
+    return len(documents) / elapsed if elapsed else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the throughput of the embedding backends.")
+    parser.add_argument("--documents", type=int, default=2000, help="Documents embedded per backend.")
+    parser.add_argument("--batch-size", type=int, default=64, help="Documents per backend call.")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--output", type=Path, default=None, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    documents = sample_documents(args.documents)
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"--- Embedding throughput, {args.documents} documents, batch size {args.batch_size} ---")
+
+    for name in args.backends:
+        try:
+            backend = BACKENDS[name](args.batch_size)
+            backend.embed(documents[:1])  # Loads the model outside the timed runs.
+        except Exception as e:
+            print(f"  {name:<22} skipped: {e}")
+            continue
+
+        # Unbatched calls show what per-task embedding on every write used to cost.
+        single = measure(lambda docs: [backend.embed([doc]) for doc in docs], documents[:200])
+        batched = measure(backend.embed, documents)
+        cached = CachedEmbedder(backend, max_entries=len(documents))
+        cached.embed(documents)
+        cache_hits = measure(cached.embed, documents)
+
+        results[name] = {
+            "dimensions": int(backend.embed(documents[:1]).shape[1]),
+            "single_docs_per_s": round(single, 1),
+            "batched_docs_per_s": round(batched, 1),
+            "cached_docs_per_s": round(cache_hits, 1),
+        }
+        print(f"  {name:<22} single {single:10,.0f}/s   batched {batched:10,.0f}/s   cached {cache_hits:12,.0f}/s")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
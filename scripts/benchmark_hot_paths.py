@@ -0,0 +1,257 @@
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.append('.')
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+
+from src.agent.main_agent import TaskManagerAgent, sanitize_and_extract_json, validate_task_json
+from src.agent.prompt_templates import pydantic_parser
+from src.models.task import Task
+from src.storage.base_store import BaseTaskStore
+from src.storage.embeddings import HashingEmbedder
+from src.storage.sqlite_store import SQLiteTaskStore
+from src.storage.vector_store import ChromaTaskStore
+
+# Canned LLM outputs, including the Markdown fences and chatter real models add.
+CANNED_OUTPUTS = [
+    '```json\n{"title": "Submit quarterly report", "category": "Work", "priority": "High", '
+    '"description": "Include the Q3 numbers", "due_date": "2025-11-14T17:00:00Z"}\n```',
+    'Sure! Here is the task:\n{"title": "Call mom", "category": "Personal", "priority": "Medium", '
+    '"description": null, "due_date": null}',
+    '{"title": "Go for a run", "category": "Fitness", "priority": "Low", "description": "5km in the park", '
+    '"due_date": "2025-11-09T07:00:00Z"}',
+]
+
+Result = Dict[str, float]
+
+
+def measure(func: Callable[[], Any], min_time: float = 0.5, max_runs: int = 10000) -> Result:
+    """Calls `func` repeatedly for at least `min_time` seconds and summarizes the per-call latency."""
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < max_runs and (not timings or time.perf_counter() - started < min_time):
+        call_started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - call_started)
+    timings.sort()
+    mean = statistics.fmean(timings)
+    return {
+        "runs": len(timings),
+        "mean_us": round(mean * 1e6, 2),
+        "p50_us": round(timings[len(timings) // 2] * 1e6, 2),
+        "p95_us": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)] * 1e6, 2),
+        "ops_per_s": round(1 / mean, 1) if mean else float("inf"),
+    }
+
+
+def stub_llm() -> FakeListChatModel:
+    """A chat model that cycles through canned outputs, so no network is needed."""
+    return FakeListChatModel(responses=CANNED_OUTPUTS)
+
+
+def sample_tasks(count: int, start: int = 0) -> List[Task]:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    categories = ["Work", "Personal", "Study", "Fitness", "Other"]
+    priorities = ["Low", "Medium", "High", "Urgent"]
+    return [
+        Task(
+            title=f"Benchmark task {i}",
+            category=categories[i % len(categories)],  # type: ignore[arg-type]
+            priority=priorities[i % len(priorities)],  # type: ignore[arg-type]
+            description=f"Details for task {i}" if i % 2 else None,
+            due_date=base + timedelta(days=i % 365) if i % 3 else None,
+            created_at=base + timedelta(seconds=i),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def create_store(backend: str) -> BaseTaskStore:
+    """A fresh store on an in-memory ChromaDB client, with the model-free hashing embedder."""
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.EphemeralClient(settings=Settings(allow_reset=True))
+    client.reset()
+    chroma_store = ChromaTaskStore(client=client, embedder=HashingEmbedder())
+    return SQLiteTaskStore.for_testing(vector_index=chroma_store) if backend == "sqlite" else chroma_store
+
+
+def bench_parsing() -> Dict[str, Result]:
+    """LLM output sanitization, parsing and `Task` construction."""
+    raw = CANNED_OUTPUTS[0]
+    clean = sanitize_and_extract_json(raw)
+    parsed = pydantic_parser.parse(clean)
+    agent = TaskManagerAgent(llm=stub_llm(), stream_llm_output=False)
+    streaming_agent = TaskManagerAgent(llm=stub_llm())
+    return {
+        "sanitize_and_extract_json": measure(lambda: sanitize_and_extract_json(raw)),
+        # The previous two-pass path, kept as a reference for `validate_task_json`.
+        "pydantic_parser.parse": measure(lambda: pydantic_parser.parse(clean)),
+        "task_construction": measure(lambda: Task(**parsed.model_dump())),
+        "validate_task_json": measure(lambda: validate_task_json(clean)),
+        "agent.parse_llm_response": measure(lambda: agent._parse_llm_response(AIMessage(content=raw))),
+        "agent.create_task_from_text": measure(lambda: agent.create_task_from_text("Submit the quarterly report by Friday")),
+        # The stub streams one character per chunk, so this is a worst case for per-chunk overhead.
+        "agent.create_task_from_text_streamed": measure(
+            lambda: streaming_agent.create_task_from_text("Submit the quarterly report by Friday")
+        ),
+    }
+
+
+def bench_store(backend: str, size: int) -> Dict[str, Result]:
+    """Store hot paths on a store pre-populated with `size` tasks."""
+    store = create_store(backend)
+    tasks = sample_tasks(size)
+    started = time.perf_counter()
+    store.add_tasks(tasks, chunk_size=5000)
+    bulk_seconds = time.perf_counter() - started
+
+    results: Dict[str, Result] = {
+        "add_tasks_bulk": {"runs": 1, "seconds": round(bulk_seconds, 3), "ops_per_s": round(size / bulk_seconds, 1)},
+    }
+    if isinstance(store, ChromaTaskStore):
+        metadata = store._task_to_metadata(tasks[0])
+        results["task_to_metadata"] = measure(lambda: store._task_to_metadata(tasks[0]))
+        results["metadata_to_task"] = measure(lambda: store._metadata_to_task(metadata))
+
+    extra = iter(sample_tasks(100000, start=size))
+    results["add_task"] = measure(lambda: store.add_task(next(extra)), max_runs=500)
+    results["get_task"] = measure(lambda: store.get_task(tasks[size // 2].id))
+    results["list_tasks_page"] = measure(lambda: store.list_tasks(limit=50))
+    results["list_tasks_all"] = measure(lambda: store.list_tasks(), max_runs=20)
+    store.task_exists_by_title("warm up the dedup index")
+    results["task_exists_by_title_hit"] = measure(lambda: store.task_exists_by_title(tasks[size // 2].title))
+    results["task_exists_by_title_miss"] = measure(lambda: store.task_exists_by_title("No such task"))
+    return results
+
+
+def bench_api(requests: int, concurrency: int) -> Dict[str, Result]:
+    """End-to-end load test of the API in-process, with the stub LLM and an in-memory store."""
+    import httpx
+
+    from src.api import endpoints
+    from src.storage.async_store import AsyncTaskStore
+
+    async_store = AsyncTaskStore(create_store("chroma"))
+    # The stub streams one character per chunk, which would dominate the latency.
+    agent = TaskManagerAgent(llm=stub_llm(), stream_llm_output=False)
+    endpoints.app.dependency_overrides[endpoints.get_async_task_store] = lambda: async_store
+    endpoints.app.dependency_overrides[endpoints.get_task_agent] = lambda: agent
+
+    async def load(method: str, url: str, body: Optional[Dict[str, Any]] = None) -> Result:
+        transport = httpx.ASGITransport(app=endpoints.app)
+        latencies: List[float] = []
+        semaphore = asyncio.Semaphore(concurrency)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def one(i: int) -> None:
+                async with semaphore:
+                    started = time.perf_counter()
+                    payload = {"query": f"{body['query']} {i}"} if body else None
+                    response = await client.request(method, url, json=payload)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(requests)))
+            elapsed = time.perf_counter() - started
+        latencies.sort()
+        return {
+            "requests": requests,
+            "concurrency": concurrency,
+            "requests_per_s": round(requests / elapsed, 1),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+            "p95_ms": round(latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1000, 2),
+        }
+
+    try:
+        return {
+            "POST /task/create": asyncio.run(load("POST", "/task/create", {"query": "Submit the quarterly report"})),
+            "GET /tasks?limit=50": asyncio.run(load("GET", "/tasks?limit=50")),
+        }
+    finally:
+        endpoints.app.dependency_overrides.clear()
+        async_store.shutdown()
+
+
+def compare(results: Dict[str, Any], baseline_path: Path) -> None:
+    """Prints the throughput of each benchmark relative to a previous results file."""
+    baseline = json.loads(baseline_path.read_text())["benchmarks"]
+    print(f"\n--- Compared with {baseline_path} (ratio > 1 is faster) ---")
+    for group, entries in results["benchmarks"].items():
+        for name, result in entries.items():
+            previous = baseline.get(group, {}).get(name)
+            key = "ops_per_s" if "ops_per_s" in result else "requests_per_s"
+            if previous and previous.get(key):
+                ratio = result[key] / previous[key]
+                flag = "  <-- regression" if ratio < 0.9 else ""
+                print(f"  {group:<16} {name:<32} {ratio:6.2f}x{flag}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_group(group: str, entries: Dict[str, Result]) -> None:
+    print(f"\n[{group}]")
+    for name, result in entries.items():
+        summary = "  ".join(f"{key}={value}" for key, value in result.items())
+        print(f"  {name:<32} {summary}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the agent, parser, store and API hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Store sizes to test.")
+    parser.add_argument("--backends", nargs="+", default=["chroma", "sqlite"], choices=["chroma", "sqlite"])
+    parser.add_argument("--api-requests", type=int, default=500, help="Requests per API load test. 0 skips it.")
+    parser.add_argument("--api-concurrency", type=int, default=16, help="Concurrent API requests.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", type=Path, default=None, help="A previous results file to compare against.")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "benchmarks": {},
+    }
+    benchmarks = results["benchmarks"]
+
+    benchmarks["parsing"] = bench_parsing()
+    _print_group("parsing", benchmarks["parsing"])
+
+    for backend in args.backends:
+        for size in args.sizes:
+            group = f"{backend}/{size}"
+            benchmarks[group] = bench_store(backend, size)
+            _print_group(group, benchmarks[group])
+
+    if args.api_requests:
+        benchmarks["api"] = bench_api(args.api_requests, args.api_concurrency)
+        _print_group("api", benchmarks["api"])
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
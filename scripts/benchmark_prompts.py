@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.append('.')
+
+from src.agent.prompt_templates import PROMPT_STYLES, format_prompt_date, json_mode_kwargs
+from src.models.task import LLMTaskListSchema, LLMTaskSchema
+
+SAMPLE_QUERIES = [
+    "Remind me to submit the quarterly report by Friday 5pm, it's urgent",
+    "email Bob about the offsite, book flights for next Tuesday, and renew gym membership",
+    "Study chapter 4 of the ML book tomorrow morning",
+    "Buy groceries",
+    "Schedule a dentist appointment sometime next week and ask about the whitening options",
+]
+
+SCHEMAS = {"task": LLMTaskSchema, "task_list": LLMTaskListSchema}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English text), used when no model is available."""
+    return max(1, round(len(text) / 4))
+
+
+def model_token_counter() -> Callable[[str], int]:
+    """Counts tokens with the configured model's tokenizer (a Gemini API call per text)."""
+    from src.llm.client import get_llm_client
+
+    llm = get_llm_client()
+    # The gateway does not count tokens itself; ask the primary model.
+    routes = getattr(llm, "routes", None)
+    model = routes[0].model if routes else llm
+    return model.get_num_tokens
+
+
+def common_prefix_length(texts: List[str]) -> int:
+    return len(os.path.commonprefix(texts))
+
+
+def measure_style(style_name: str, count_tokens: Callable[[str], int], now: datetime) -> Dict[str, Dict[str, float]]:
+    """Prompt size, and how much of it stays identical across calls made on the same day, for one style."""
+    style = PROMPT_STYLES[style_name]
+    results: Dict[str, Dict[str, float]] = {}
+    for kind in ("task", "task_list"):
+        prompt = getattr(style, kind)
+
+        def render(query: str, day: datetime) -> str:
+            return prompt.format(query=query, current_date=format_prompt_date(day, style.date_only))
+
+        # Different queries sent at different times of the same day, as a provider's prefix cache would see them.
+        morning = now.replace(hour=9, minute=0, second=0, microsecond=0)
+        prompts = [render(query, morning + timedelta(minutes=37 * i)) for i, query in enumerate(SAMPLE_QUERIES)]
+        tokens = [count_tokens(text) for text in prompts]
+        mean_chars = statistics.mean(len(text) for text in prompts)
+        shared = common_prefix_length(prompts)
+        results[kind] = {
+            "mean_prompt_tokens": round(statistics.mean(tokens), 1),
+            "mean_prompt_chars": round(mean_chars, 1),
+            "shared_prefix_tokens": count_tokens(prompts[0][:shared]) if shared else 0,
+            "shared_prefix_ratio": round(shared / mean_chars, 3),
+            # Sent as request config rather than prompt text when JSON mode is on.
+            "json_mode_schema_tokens": count_tokens(json.dumps(json_mode_kwargs(SCHEMAS[kind])["response_json_schema"])),
+        }
+    return results
+
+
+def measure_live(style_name: str, json_mode: bool, runs: int) -> Dict[str, float]:
+    """Runs real extractions with the configured LLM and reports the token usage it returns, and latency."""
+    from src.agent.main_agent import TaskManagerAgent
+    from src.llm.client import get_llm_client
+
+    agent = TaskManagerAgent(llm=get_llm_client(), stream_llm_output=False, prompt_style=style_name, json_mode=json_mode)
+    input_tokens: List[int] = []
+    output_tokens: List[int] = []
+    latencies: List[float] = []
+    failures = 0
+    for i in range(runs):
+        query = SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]
+        prompt_value = agent._format_prompt(agent.prompts.task, query, datetime.now(timezone.utc))
+        started = time.perf_counter()
+        try:
+            response = agent._task_llm.invoke(prompt_value)
+            agent._parse_llm_response(response)
+        except Exception as e:
+            failures += 1
+            print(f"    run {i + 1} failed: {e}")
+            continue
+        latencies.append(time.perf_counter() - started)
+        usage = getattr(response, "usage_metadata", None) or {}
+        input_tokens.append(usage.get("input_tokens", 0))
+        output_tokens.append(usage.get("output_tokens", 0))
+    if not latencies:
+        return {"failures": failures}
+    return {
+        "mean_input_tokens": round(statistics.mean(input_tokens), 1),
+        "mean_output_tokens": round(statistics.mean(output_tokens), 1),
+        "p50_latency_ms": round(statistics.median(latencies) * 1000, 1),
+        "failures": failures,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the token cost of the prompt styles.")
+    parser.add_argument("--styles", nargs="+", default=list(PROMPT_STYLES), choices=list(PROMPT_STYLES))
+    parser.add_argument("--count-with-model", action="store_true",
+                        help="Count tokens with the configured model's tokenizer instead of estimating them.")
+    parser.add_argument("--live", type=int, default=0, metavar="RUNS",
+                        help="Also run this many real single-task extractions per style and report usage and latency.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    count_tokens = model_token_counter() if args.count_with_model else estimate_tokens
+    unit = "tokens" if args.count_with_model else "~tokens"
+    now = datetime.now(timezone.utc)
+    results: Dict[str, Dict[str, object]] = {}
+    print(f"--- Prompt size per style ({unit}, {len(SAMPLE_QUERIES)} sample queries) ---")
+
+    for name in args.styles:
+        results[name] = measure_style(name, count_tokens, now)
+        for kind, stats in results[name].items():
+            print(
+                f"  {name:<8} {kind:<10} prompt {stats['mean_prompt_tokens']:7.1f}   "
+                f"shared prefix {stats['shared_prefix_tokens']:5} ({stats['shared_prefix_ratio']:.0%})   "
+                f"JSON-mode schema {stats['json_mode_schema_tokens']:5}"
+            )
+
+    if len(args.styles) > 1 and "verbose" in results:
+        baseline = results["verbose"]["task"]["mean_prompt_tokens"]
+        for name in args.styles:
+            if name != "verbose":
+                saved = 1 - results[name]["task"]["mean_prompt_tokens"] / baseline
+                print(f"  {name} saves {saved:.0%} of single-task prompt {unit} compared to verbose")
+
+    if args.live:
+        print(f"\n--- Live extractions ({args.live} per style) ---")
+        for name in args.styles:
+            live = measure_live(name, json_mode=name == "compact", runs=args.live)
+            results[name]["live"] = live
+            print(f"  {name:<8} {live}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.append('.')
+
+import httpx
+from pydantic import TypeAdapter
+
+from src.api import endpoints
+from src.models.task import Task
+from src.storage.async_store import AsyncTaskStore
+from src.storage.base_store import BaseTaskStore
+from src.storage.caching_store import CachingTaskStore
+from src.storage.sqlite_store import SQLiteTaskStore
+from scripts.benchmark_hot_paths import sample_tasks
+
+Result = Dict[str, float]
+
+# The previous `GET /tasks` path: tasks are returned as objects and FastAPI
+# validates and serializes them through the `list[Task]` response model.
+REFERENCE_PATH = "/_benchmark/tasks-response-model"
+
+
+def add_reference_route() -> None:
+    async def list_tasks_with_response_model(
+        async_task_store: AsyncTaskStore = endpoints.Depends(endpoints.get_async_task_store),
+    ):
+        return await async_task_store.list_tasks()
+
+    endpoints.app.add_api_route(REFERENCE_PATH, list_tasks_with_response_model, response_model=list[Task])
+
+
+async def measure(client: httpx.AsyncClient, url: str, runs: int) -> Result:
+    """Fetches `url` `runs` times (after one warm-up request) and reports latency and throughput."""
+    body = (await client.get(url)).raise_for_status().content
+    timings: List[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = await client.get(url)
+        timings.append(time.perf_counter() - started)
+        response.raise_for_status()
+    mean = statistics.fmean(timings)
+    return {
+        "runs": runs,
+        "response_bytes": len(body),
+        "mean_ms": round(mean * 1000, 2),
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "bytes_per_s": round(len(body) / mean),
+    }
+
+
+async def bench(tasks: int, runs: int) -> Dict[str, Result]:
+    stores: Dict[str, Callable[[], BaseTaskStore]] = {
+        # SQLite without the read cache encodes each listing in one pass.
+        "sqlite": lambda: SQLiteTaskStore.for_testing(),
+        # The read cache joins tasks encoded on the first listing.
+        "sqlite+read_cache": lambda: CachingTaskStore(SQLiteTaskStore.for_testing()),
+    }
+    results: Dict[str, Result] = {}
+    transport = httpx.ASGITransport(app=endpoints.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, create in stores.items():
+            store = create()
+            store.add_tasks(sample_tasks(tasks), chunk_size=5000)
+            async_store = AsyncTaskStore(store)
+            endpoints.app.dependency_overrides[endpoints.get_async_task_store] = lambda: async_store
+            try:
+                reference = (await client.get(REFERENCE_PATH)).raise_for_status().json()
+                fast = (await client.get("/tasks")).raise_for_status().json()
+                assert TypeAdapter(list[Task]).validate_python(fast) == TypeAdapter(list[Task]).validate_python(reference)
+                results[f"{name} response_model"] = await measure(client, REFERENCE_PATH, runs)
+                results[f"{name} fast_path"] = await measure(client, "/tasks", runs)
+            finally:
+                endpoints.app.dependency_overrides.clear()
+                async_store.shutdown()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare GET /tasks throughput through the response model and the fast JSON path."
+    )
+    parser.add_argument("--tasks", type=int, default=10000, help="Number of tasks in each response.")
+    parser.add_argument("--runs", type=int, default=20, help="Requests measured per path.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    add_reference_route()
+    results = asyncio.run(bench(args.tasks, args.runs))
+
+    print(f"--- GET /tasks with {args.tasks} tasks ({args.runs} requests each) ---")
+    for name, result in results.items():
+        print(
+            f"  {name:<32} {result['mean_ms']:8.2f} ms   "
+            f"{result['bytes_per_s'] / 1e6:8.1f} MB/s   {result['response_bytes']} bytes"
+        )
+    for store in ("sqlite", "sqlite+read_cache"):
+        speedup = results[f"{store} fast_path"]["bytes_per_s"] / results[f"{store} response_model"]["bytes_per_s"]
+        print(f"  {store}: fast path is {speedup:.1f}x the response_model throughput")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
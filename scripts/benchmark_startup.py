@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Entry points whose cold-start latency we track.
+ENTRY_POINTS = {
+    "cli": "src.main",
+    "api": "src.api.endpoints",
+}
+
+_IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def time_cold_import(module: str, runs: int) -> List[float]:
+    """Imports a module in fresh interpreters and returns the wall time of each run in ms."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True, env=_child_env())
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def slowest_imports(module: str, top: int) -> List[Tuple[str, float]]:
+    """
+    Runs `python -X importtime` and returns the imports with the highest cumulative
+    time in ms. Our own modules are reported individually, third-party packages by
+    their top-level name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True, capture_output=True, text=True, env=_child_env(),
+    )
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if not match or match.group(3) == module:
+            continue
+        name = match.group(3)
+        key = name if name.startswith("src.") else name.split(".")[0]
+        cumulative[key] = max(cumulative.get(key, 0.0), int(match.group(2)) / 1000)
+    return sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    return env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold-start import latency of the CLI and API.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters started per entry point.")
+    parser.add_argument("--top", type=int, default=0, help="Also report the N slowest imports per entry point.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_cold_import("sys", args.runs))
+    results = {"python": sys.version.split()[0], "runs": args.runs, "interpreter_ms": round(baseline, 1), "entry_points": {}}
+    print(f"--- Cold-start import latency (median of {args.runs} runs, interpreter startup {baseline:.0f} ms) ---")
+
+    for name, module in ENTRY_POINTS.items():
+        timings = time_cold_import(module, args.runs)
+        median = statistics.median(timings)
+        entry = {"module": module, "median_ms": round(median, 1), "min_ms": round(min(timings), 1)}
+        print(f"  {name:<4} {module:<20} median {median:7.0f} ms   min {min(timings):7.0f} ms")
+        if args.top:
+            entry["slowest_imports"] = dict(slowest_imports(module, args.top))
+            for package, elapsed in entry["slowest_imports"].items():
+                print(f"         {package:<30} {elapsed:7.0f} ms")
+        results["entry_points"][name] = entry
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+sys.path.append('.')
+
+from pydantic import ValidationError
+
+from src.models.task import Task
+from src.storage.vector_store import get_task_store
+
+
+def read_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """Streams raw task records from a JSONL or CSV file, one row at a time."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() == '.csv':
+            for row in csv.DictReader(f):
+                # Empty CSV cells mean "not set", not an empty string.
+                yield {key: value for key, value in row.items() if value not in ('', None)}
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def import_tasks(path: Path, chunk_size: int = 500) -> None:
+    """
+    Streams tasks from a JSONL or CSV file into the vector store in chunks.
+
+    Each record is validated into a `Task`; missing application fields such as
+    `id` and `created_at` are generated. Records with an existing `id` replace the
+    stored task. Invalid records are reported and skipped.
+    """
+    print(f"--- Importing tasks from {path} ---")
+    skipped = 0
+    imported = 0
+    started = time.perf_counter()
+
+    def valid_tasks() -> Iterator[Task]:
+        nonlocal skipped
+        for line_number, row in enumerate(read_rows(path), 1):
+            try:
+                yield Task.model_validate(row)
+            except ValidationError as e:
+                skipped += 1
+                print(f"  -> Skipping record {line_number}: {e.error_count()} validation error(s)")
+
+    def report_progress(chunk_written: int) -> None:
+        nonlocal imported
+        imported += chunk_written
+        elapsed = time.perf_counter() - started
+        print(f"  -> {imported} tasks imported ({imported / elapsed:,.0f} tasks/s)")
+
+    task_store = get_task_store()
+    task_store.add_tasks(valid_tasks(), chunk_size=chunk_size, on_progress=report_progress)
+    # Save the aggregate counters now so the next start does not rescan the store.
+    task_store.flush()
+
+    elapsed = time.perf_counter() - started
+    rate = imported / elapsed if elapsed else 0.0
+    print(f"\n--- Import Complete. Imported {imported} tasks, skipped {skipped}, in {elapsed:.1f}s ({rate:,.0f} tasks/s). ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import tasks from a JSONL or CSV file.")
+    parser.add_argument("path", type=Path, help="Path to a .jsonl or .csv file of task records.")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Tasks written per bulk upsert.")
+    args = parser.parse_args()
+    import_tasks(args.path, chunk_size=args.chunk_size)
@@ -0,0 +1,53 @@
+import argparse
+import sys
+import time
+
+sys.path.append('.')
+
+from src.core.config import get_settings
+from src.storage.embeddings import create_embedder
+from src.storage.sqlite_store import SQLiteTaskStore
+from src.storage.vector_store import ChromaTaskStore
+
+
+def migrate(chroma_path: str, sqlite_path: str, chunk_size: int = 1000) -> int:
+    """
+    Copies every task from a ChromaDB directory into a SQLite database.
+
+    The ChromaDB collection is left untouched: with `storage.backend: sqlite`
+    it keeps serving vector search, and its stored embeddings stay valid, so
+    nothing is re-embedded. Running the migration again upserts the same ids.
+
+    Returns:
+        The number of tasks copied.
+    """
+    print(f"--- Migrating tasks from {chroma_path} to {sqlite_path} ---")
+    embedding_settings = get_settings().storage.embedding
+    source = ChromaTaskStore.for_production(chroma_path, embedder=create_embedder(embedding_settings))
+    # No vector index: the tasks are already embedded in the source collection.
+    target = SQLiteTaskStore(sqlite_path)
+    started = time.perf_counter()
+    migrated = 0
+
+    def report_progress(chunk_written: int) -> None:
+        nonlocal migrated
+        migrated += chunk_written
+        print(f"  -> {migrated} tasks migrated")
+
+    target.add_tasks(source.iter_tasks(batch_size=chunk_size), chunk_size=chunk_size, on_progress=report_progress)
+    target.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n--- Migration Complete. Migrated {migrated} tasks in {elapsed:.1f}s. ---")
+    print("Set `storage.backend: sqlite` in configs/settings.yaml to use the new database.")
+    return migrated
+
+
+if __name__ == "__main__":
+    storage_settings = get_settings().storage
+    parser = argparse.ArgumentParser(description="Migrate tasks from ChromaDB to the SQLite backend.")
+    parser.add_argument("--chroma-path", default=storage_settings.chroma_path, help="Source ChromaDB directory.")
+    parser.add_argument("--sqlite-path", default=storage_settings.sqlite_path, help="Target SQLite database file.")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Tasks copied per transaction.")
+    args = parser.parse_args()
+    migrate(args.chroma_path, args.sqlite_path, chunk_size=args.chunk_size)
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta, timezone
 sys.path.append('.')
 
 from src.models.task import Task
-from src.storage.vector_store import task_store
+from src.storage.vector_store import get_task_store
 
 def seed_database():
     """
@@ -56,17 +56,21 @@ def seed_database():
         ),
     ]
 
-    existing_tasks = task_store.list_tasks()
-    existing_titles = {task.title.lower() for task in existing_tasks}
+    # One bulk lookup against the in-memory dedup index instead of loading every task.
+    task_store = get_task_store()
+    existing_titles = task_store.titles_exist([task.title for task in sample_tasks])
     
-    tasks_added = 0
+    new_tasks = []
     for task in sample_tasks:
-        if task.title.lower() not in existing_titles:
-            task_store.add_task(task)
-            print(f"  -> Added task: '{task.title}'")
-            tasks_added += 1
+        if not existing_titles[task.title]:
+            new_tasks.append(task)
+            print(f"  -> Adding task: '{task.title}'")
         else:
             print(f"  -> Skipping existing task: '{task.title}'")
+
+    task_store.add_tasks(new_tasks)
+    task_store.flush()
+    tasks_added = len(new_tasks)
             
     print(f"\n--- Database Seeding Complete. Added {tasks_added} new tasks. ---")
 
@@ -0,0 +1,308 @@
+import hashlib
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
+
+from src.models.task import LLMTaskSchema
+
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+
+    from src.storage.embeddings import Embedder
+
+# Queries whose meaning depends on the time of day (e.g. "in 2 hours") resolve to a
+# different due date every time they are asked, so they are never served from cache.
+_TIME_SENSITIVE_PATTERN = re.compile(r"\b(?:in|within)\s+\d+\s+(?:hours?|hrs?|minutes?|mins?)\b|\bnow\b")
+_NON_WORD_PATTERN = re.compile(r"[^\w]+")
+# Words that pin a query to a day. Queries differing only in them (e.g. "call mom
+# today" and "call mom tomorrow") embed almost identically but resolve to different
+# due dates, so a semantic match must contain exactly the same ones.
+_DATE_TERM_PATTERN = re.compile(
+    r"\b(?:today|tonight|tomorrow|tmrw|yesterday|weekend|next|this|last|"
+    r"(?:mon|tues|wednes|thurs|fri|satur|sun)day|(?:day|week|month|year)s?|"
+    r"jan(?:uary)?|feb(?:ruary)?|march|april|may|june|july|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|"
+    r"nov(?:ember)?|dec(?:ember)?|\d+(?:st|nd|rd|th)?)\b"
+)
+
+
+def normalize_query(query: str) -> str:
+    """Lower-cases a query, strips punctuation and collapses whitespace."""
+    return _NON_WORD_PATTERN.sub(" ", query.casefold()).strip()
+
+
+def date_terms(query: str) -> str:
+    """Returns the words of a query that select its due date, in order."""
+    return " ".join(_DATE_TERM_PATTERN.findall(normalize_query(query)))
+
+
+def date_bucket(current_date: datetime) -> str:
+    """
+    Returns the day a query is resolved against. Relative dates such as "tomorrow"
+    only produce the same due date within the same day, so entries are scoped to it.
+    """
+    return current_date.date().isoformat()
+
+
+def prompt_fingerprint(*parts: Any) -> str:
+    """Returns a short, stable hash of the prompt (and model) that produced an entry."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an extraction cache."""
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.exact_hits + self.semantic_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ExtractionCache(ABC):
+    """
+    Abstract base class for caches sitting in front of the LLM extraction chain.
+
+    Entries map a user query (resolved on a given day) to the `LLMTaskSchema` the
+    LLM produced for it. Only LLM-generated fields are cached; application fields
+    such as `id` and `created_at` are always generated fresh.
+    """
+    def __init__(self, fingerprint: str):
+        self._fingerprint = fingerprint
+        self.stats = CacheStats()
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def is_cacheable(self, query: str) -> bool:
+        """Returns False for queries whose result depends on the time of day."""
+        return not _TIME_SENSITIVE_PATTERN.search(normalize_query(query))
+
+    def set_fingerprint(self, fingerprint: str) -> None:
+        """Invalidates every entry if the prompt fingerprint has changed."""
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self.clear()
+
+    @abstractmethod
+    def get(self, query: str, current_date: datetime) -> Optional[LLMTaskSchema]:
+        """Returns the cached extraction for a query, or None on a miss."""
+        pass
+
+    @abstractmethod
+    def put(self, query: str, current_date: datetime, result: LLMTaskSchema) -> None:
+        """Stores the extraction produced for a query."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        pass
+
+
+class InMemoryExtractionCache(ExtractionCache):
+    """
+    Exact-match cache keyed on the normalized query text and its date bucket,
+    with TTL expiry and LRU eviction.
+    """
+    def __init__(self, fingerprint: str, ttl_seconds: float = 86400, max_entries: int = 1000):
+        super().__init__(fingerprint)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, LLMTaskSchema]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, query: str, current_date: datetime) -> Optional[LLMTaskSchema]:
+        """Exact lookup that does not touch the hit/miss counters."""
+        if not self.is_cacheable(query):
+            return None
+        key = (date_bucket(current_date), normalize_query(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                self.stats.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def get(self, query: str, current_date: datetime) -> Optional[LLMTaskSchema]:
+        result = self.lookup(query, current_date)
+        if result is None:
+            self.stats.misses += 1
+        else:
+            self.stats.exact_hits += 1
+        return result
+
+    def put(self, query: str, current_date: datetime, result: LLMTaskSchema) -> None:
+        if not self.is_cacheable(query):
+            return
+        key = (date_bucket(current_date), normalize_query(query))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticExtractionCache(ExtractionCache):
+    """
+    Two-tier extraction cache.
+
+    Lookups first try an exact match on the normalized query, then fall back to a
+    nearest-neighbour search over query embeddings stored in a dedicated ChromaDB
+    collection. A semantic match is only served if its cosine similarity reaches
+    `similarity_threshold`, it was resolved on the same day with the same prompt,
+    and it contains the same date words (see `date_terms`).
+
+    Queries are embedded by `embedder`, normally the task store's, and passed to
+    the collection precomputed. Entries embedded by another backend are dropped.
+    """
+    def __init__(
+        self,
+        client: "ClientAPI",
+        embedder: "Embedder",
+        fingerprint: str,
+        ttl_seconds: float = 86400,
+        max_entries: int = 1000,
+        similarity_threshold: float = 0.95,
+        collection_name: str = "extraction_cache",
+    ):
+        super().__init__(fingerprint)
+        self._exact = InMemoryExtractionCache(fingerprint, ttl_seconds, max_entries)
+        self._exact.stats = self.stats
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._similarity_threshold = similarity_threshold
+        self._embedder = embedder
+        metadata = {"hnsw:space": "cosine", "embedding_backend": embedder.name}
+        self._collection = client.get_or_create_collection(name=collection_name, metadata=metadata, embedding_function=None)
+        if (self._collection.metadata or {}).get("embedding_backend") != embedder.name:
+            # Vectors from another backend are not comparable; the entries are only a cache.
+            client.delete_collection(collection_name)
+            self._collection = client.create_collection(name=collection_name, metadata=metadata, embedding_function=None)
+        self._prune()
+
+    def _entry_id(self, bucket: str, normalized_query: str) -> str:
+        return hashlib.sha1(f"{self._fingerprint}|{bucket}|{normalized_query}".encode("utf-8")).hexdigest()
+
+    def get(self, query: str, current_date: datetime) -> Optional[LLMTaskSchema]:
+        if not self.is_cacheable(query):
+            self.stats.misses += 1
+            return None
+
+        result = self._exact.lookup(query, current_date)
+        if result is not None:
+            self.stats.exact_hits += 1
+            return result
+
+        if self._collection.count() == 0:
+            self.stats.misses += 1
+            return None
+
+        bucket = date_bucket(current_date)
+        matches = self._collection.query(
+            query_embeddings=list(self._embedder.embed([normalize_query(query)])),
+            n_results=1,
+            where={"$and": [
+                {"date_bucket": bucket},
+                {"prompt_version": self._fingerprint},
+                {"date_terms": date_terms(query)},
+            ]},
+            include=["metadatas", "distances"],
+        )
+        ids = matches["ids"][0]
+        if ids:
+            metadata = cast(Dict[str, Any], matches["metadatas"][0][0])
+            similarity = 1.0 - float(matches["distances"][0][0])
+            if time.time() - float(metadata["created_at_ts"]) > self._ttl_seconds:
+                self._collection.delete(ids=[ids[0]])
+                self.stats.evictions += 1
+            elif similarity >= self._similarity_threshold:
+                result = LLMTaskSchema.model_validate_json(metadata["result_json"])
+                self._exact.put(query, current_date, result)
+                self.stats.semantic_hits += 1
+                return result
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, query: str, current_date: datetime, result: LLMTaskSchema) -> None:
+        if not self.is_cacheable(query):
+            return
+        self._exact.put(query, current_date, result)
+
+        bucket = date_bucket(current_date)
+        normalized = normalize_query(query)
+        self._collection.upsert(
+            ids=[self._entry_id(bucket, normalized)],
+            documents=[normalized],
+            embeddings=list(self._embedder.embed([normalized])),
+            metadatas=[{
+                "date_bucket": bucket,
+                "prompt_version": self._fingerprint,
+                "date_terms": date_terms(query),
+                "created_at_ts": time.time(),
+                "result_json": result.model_dump_json(),
+            }],
+        )
+        # Pruning scans the collection, so only do it once the cap is exceeded by 10%.
+        if self._collection.count() > self._max_entries * 1.1:
+            self._prune()
+
+    def clear(self) -> None:
+        self._exact.clear()
+        existing = self._collection.get(include=[])
+        if existing["ids"]:
+            self._collection.delete(ids=existing["ids"])
+
+    def _prune(self) -> None:
+        """Drops expired entries, entries from other prompts, and the oldest overflow."""
+        entries = self._collection.get(include=["metadatas"])
+        ids = entries["ids"]
+        if not ids:
+            return
+        cutoff = time.time() - self._ttl_seconds
+        stale, live = [], []
+        for entry_id, metadata in zip(ids, entries["metadatas"] or []):
+            metadata = cast(Dict[str, Any], metadata)
+            created_at_ts = float(metadata.get("created_at_ts", 0))
+            if metadata.get("prompt_version") != self._fingerprint or created_at_ts < cutoff:
+                stale.append(entry_id)
+            else:
+                live.append((created_at_ts, entry_id))
+        live.sort()
+        overflow = len(live) - self._max_entries
+        if overflow > 0:
+            stale.extend(entry_id for _, entry_id in live[:overflow])
+        if stale:
+            self._collection.delete(ids=stale)
+            self.stats.evictions += len(stale)
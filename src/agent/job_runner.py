@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.agent.main_agent import TaskManagerAgent
+from src.core.logging_config import reset_correlation_id, set_correlation_id
+from src.core.metrics import JOBS_PROCESSED
+from src.llm.resilience import LLMUnavailableError
+from src.models.job import Job
+from src.storage.async_store import AsyncTaskStore
+from src.storage.job_queue import SQLiteJobQueue
+
+logger = logging.getLogger(__name__)
+
+_OUTCOMES = {outcome: JOBS_PROCESSED.labels(outcome=outcome) for outcome in ("succeeded", "failed", "retried")}
+
+
+class TaskJobRunner:
+    """
+    Creates tasks in the background: `submit` puts a query on a durable
+    `SQLiteJobQueue` and returns at once, and `workers` asyncio workers run each
+    job through `TaskManagerAgent.acreate_task_from_text` and `add_task`,
+    skipping tasks whose title already exists in the store.
+
+    Idle workers wake up when a job is submitted, and otherwise poll the queue
+    every `poll_interval_seconds`, which also picks up jobs left over from a
+    previous run. When the LLM is unavailable, the job is queued again after
+    the gateway's retry hint (or `retry_delay_seconds`); other errors, such as
+    a duplicate task, fail the job.
+
+    The queue, agent and store are passed as providers and only created when
+    first needed.
+    """
+    def __init__(
+        self,
+        queue_provider: Callable[[], SQLiteJobQueue],
+        agent_provider: Callable[[], TaskManagerAgent],
+        store_provider: Callable[[], AsyncTaskStore],
+        workers: int = 4,
+        poll_interval_seconds: float = 1.0,
+        retry_delay_seconds: float = 30.0,
+        retention_seconds: Optional[float] = None,
+        max_wait_seconds: float = 30.0,
+    ):
+        self._queue_provider = queue_provider
+        self._agent_provider = agent_provider
+        self._store_provider = store_provider
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.retention_seconds = retention_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: Optional[SQLiteJobQueue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Set[str] = set()
+        self._waiters: Dict[str, Set[asyncio.Future]] = defaultdict(set)
+
+    @property
+    def queue(self) -> SQLiteJobQueue:
+        if self._queue is None:
+            self._queue = self._queue_provider()
+        return self._queue
+
+    @property
+    def queue_opened(self) -> bool:
+        return self._queue is not None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._worker_tasks)
+
+    async def start(self) -> None:
+        """Starts the workers on the running event loop. Does nothing if they are already running."""
+        if self.started:
+            return
+        self._wakeup = asyncio.Event()
+        if self.retention_seconds is not None:
+            deleted = await asyncio.to_thread(self.queue.delete_finished, self.retention_seconds)
+            if deleted:
+                logger.info("Deleted %d finished jobs older than %ss", deleted, self.retention_seconds)
+        self._worker_tasks = [
+            asyncio.create_task(self._work(), name=f"task-job-worker-{i}") for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stops the workers. Jobs they were running are put back in the queue for the next start."""
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        if self._running:
+            await asyncio.to_thread(self.queue.release, list(self._running))
+            self._running.clear()
+
+    async def submit(self, query: str, priority: int = 0) -> Tuple[Job, bool]:
+        """Queues a job, or returns the pending job for the same query. See `SQLiteJobQueue.enqueue`."""
+        job, created = await asyncio.to_thread(self.queue.enqueue, query, priority)
+        if created and self._wakeup is not None:
+            self._wakeup.set()
+        return job, created
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return await asyncio.to_thread(self.queue.get, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Job]:
+        """
+        Returns the job once it has finished or after `timeout` seconds (at most
+        `max_wait_seconds`), whichever comes first. Jobs finished by this process's workers are
+        returned as soon as they finish; the queue is re-read every
+        `poll_interval_seconds` in case another process runs the job.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(timeout, self.max_wait_seconds)
+        while True:
+            # Registered before reading, so a job finishing in between is not missed.
+            finished = loop.create_future()
+            self._waiters[job_id].add(finished)
+            try:
+                job = await self.get(job_id)
+                remaining = deadline - loop.time()
+                if job is None or job.finished or remaining <= 0:
+                    return job
+                await asyncio.wait({finished}, timeout=min(remaining, self.poll_interval_seconds))
+            finally:
+                waiters = self._waiters[job_id]
+                waiters.discard(finished)
+                if not waiters:
+                    del self._waiters[job_id]
+
+    async def _work(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._wakeup.clear()
+            try:
+                job = await asyncio.to_thread(self.queue.claim)
+            except Exception:
+                logger.exception("Could not claim a job from the queue")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._process(job)
+            except Exception:
+                # E.g. the queue could not record the outcome; the job's lease expires and it is retried.
+                logger.exception("Could not process job %s", job.id)
+                self._running.discard(job.id)
+
+    async def _process(self, job: Job) -> None:
+        # Log records emitted while running the job carry its id.
+        token = set_correlation_id(job.id)
+        self._running.add(job.id)
+        try:
+            try:
+                task = await self._agent_provider().acreate_task_from_text(job.query)
+                store = self._store_provider()
+                if (await store.titles_exist([task.title]))[task.title]:
+                    raise ValueError(f"Task '{task.title}' already exists")
+                await store.add_task(task)
+            except LLMUnavailableError as e:
+                retry_after = e.retry_after or self.retry_delay_seconds
+                job = await asyncio.to_thread(self.queue.fail, job.id, str(e), retry_after)
+                outcome = "retried" if job.status == "queued" else "failed"
+                logger.warning("Job %s could not reach the LLM (%s): %s", job.id, outcome, e)
+            except Exception as e:
+                await asyncio.to_thread(self.queue.fail, job.id, str(e))
+                outcome = "failed"
+                logger.warning("Job %s failed: %s", job.id, e)
+            else:
+                await asyncio.to_thread(self.queue.complete, job.id, task)
+                outcome = "succeeded"
+                logger.info("Job %s created task %s", job.id, task.id)
+            # A cancelled job stays in `_running`, so that `stop` puts it back in the queue.
+            self._running.discard(job.id)
+            _OUTCOMES[outcome].inc()
+            for finished in self._waiters.get(job.id, ()):
+                if not finished.done():
+                    finished.set_result(None)
+        finally:
+            reset_correlation_id(token)
@@ -0,0 +1,107 @@
+import json
+import re
+from typing import List, Optional
+
+# Outside strings, only braces and quotes change the scanner's state. Inside a
+# string, only quotes and backslashes do. Jumping between these characters with
+# a regex keeps the Python-level loop to a handful of iterations per object.
+_OPEN_BRACE = re.compile(r"\{")
+_STRUCTURAL = re.compile(r'[{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+_DECODER = json.JSONDecoder()
+
+
+class IncrementalJSONExtractor:
+    """
+    Finds the first balanced JSON object in text that arrives in chunks, e.g.
+    from `llm.stream`. Each chunk is scanned once, carrying the brace depth and
+    string/escape state over from the previous chunk, so the caller can stop
+    consuming the stream as soon as the object closes.
+
+    Text before the first `{` (such as "Sure! Here is the task:" or a Markdown
+    fence) is skipped. Braces inside JSON strings are ignored.
+    """
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._offset = 0
+        self._depth = 0
+        self._start = 0
+        self._in_string = False
+        self._escaped = False
+        self._result: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._chunks)
+
+    @property
+    def result(self) -> Optional[str]:
+        """The first complete JSON object, once it has closed."""
+        return self._result
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consumes the next chunk and returns the JSON object text if it is now complete."""
+        if self._result is not None:
+            return self._result
+        self._chunks.append(chunk)
+        end = self._scan(chunk)
+        if end is not None:
+            self._result = self.text[self._start:self._offset + end]
+        self._offset += len(chunk)
+        return self._result
+
+    def _scan(self, chunk: str) -> Optional[int]:
+        """Advances the scanner over `chunk`. Returns the index just past the closing brace, if found."""
+        pos, length = 0, len(chunk)
+        if self._escaped and length:
+            # The previous chunk ended with a backslash inside a string.
+            self._escaped = False
+            pos = 1
+        while pos < length:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(chunk, pos)
+                if match is None:
+                    return None
+                if match.group() == "\\":
+                    pos = match.end() + 1
+                    self._escaped = pos > length
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = (_STRUCTURAL if self._depth else _OPEN_BRACE).search(chunk, pos)
+            if match is None:
+                return None
+            char, pos = match.group(), match.end()
+            if char == "{":
+                if not self._depth:
+                    self._start = self._offset + match.start()
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if not self._depth:
+                    return pos
+            else:
+                self._in_string = True
+        return None
+
+
+def extract_json_object(text: str) -> str:
+    """Returns the first balanced JSON object in `text`, or raises ValueError if there is none."""
+    start = text.find("{")
+    if start < 0:
+        raise ValueError("No valid JSON object found in the LLM output.")
+    # Complete, valid JSON (the common case) is delimited by the C decoder; the
+    # scanner handles the rest, e.g. objects the validator should reject.
+    try:
+        _, end = _DECODER.raw_decode(text, start)
+        return text[start:end]
+    except ValueError:
+        pass
+    result = IncrementalJSONExtractor().feed(text[start:])
+    if result is None:
+        raise ValueError("No valid JSON object found in the LLM output.")
+    return result
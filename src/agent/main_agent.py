@@ -1,64 +1,492 @@
-import re
+import asyncio
+import json
+import logging
+from contextlib import aclosing, closing
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
-from src.llm.client import llm_client
-from src.agent.prompt_templates import task_creation_prompt, pydantic_parser
-from src.models.task import Task, LLMTaskSchema 
+from functools import lru_cache
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
+from pydantic import ValidationError
+
+from src.core.config import get_settings
+from src.core.logging_config import should_log_payload
+from src.core.metrics import AGENT_PARSE_FAILURES, AGENT_RESOLUTIONS, AGENT_STAGE_SECONDS, record_token_usage
+from src.agent.extraction_cache import (
+    ExtractionCache,
+    InMemoryExtractionCache,
+    SemanticExtractionCache,
+    prompt_fingerprint,
+)
+from src.agent.json_extractor import IncrementalJSONExtractor, extract_json_object
+from src.agent.rule_parser import RuleBasedTaskParser
+from src.llm.client import get_llm_client
+from src.agent.prompt_templates import PROMPT_STYLES, format_prompt_date, json_mode_kwargs
+from src.models.task import Task, LLMTaskListSchema, LLMTaskSchema
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Labelled metric children, resolved once so that timing a stage is only a clock read and a bucket update.
+_STAGES = {
+    stage: AGENT_STAGE_SECONDS.labels(stage=stage)
+    for stage in (
+        "fast_path", "cache_lookup", "prompt_format", "llm_call", "llm_batch_call",
+        "sanitize", "parse", "cache_store", "build_task",
+    )
+}
+_RESOLVED_BY = {source: AGENT_RESOLUTIONS.labels(source=source) for source in ("fast_path", "cache", "llm")}
+_PARSE_FAILURES = {
+    stage: AGENT_PARSE_FAILURES.labels(stage=stage) for stage in ("type", "sanitize", "parse", "item")
+}
+
+# Fields the LLM fills in. Anything else in its output (e.g. an `id`) is ignored.
+LLM_TASK_FIELDS = tuple(LLMTaskSchema.model_fields)
 
 def sanitize_and_extract_json(llm_output: str) -> str:
     """
     (Moved from task_parser.py)
-    Finds and extracts the first valid JSON block from a raw LLM output string.
+    Finds and extracts the first balanced JSON object from a raw LLM output string.
+    """
+    return extract_json_object(llm_output)
+
+def validate_task_json(json_text: str) -> Task:
+    """
+    Validates the LLM's JSON object straight into a `Task`, in a single
+    Pydantic pass. Raises ValueError if the JSON or any field is invalid.
+    """
+    data = json.loads(json_text)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, but got {type(data).__name__}")
+    return Task.model_validate({name: data[name] for name in LLM_TASK_FIELDS if name in data})
+
+@dataclass
+class TaskListExtraction:
+    """The tasks extracted from a multi-task query, and the errors of the items that were dropped."""
+    tasks: List[Task] = field(default_factory=list)
+    rejected: List[str] = field(default_factory=list)
+
+def validate_task_list_json(json_text: str) -> TaskListExtraction:
+    """
+    Validates the LLM's `{"tasks": [...]}` object item by item, so that one
+    malformed task does not discard the others. Raises ValueError if there is
+    no task list at all.
     """
-    match = re.search(r"\{.*\}", llm_output, re.DOTALL)
-    if match:
-        return match.group(0)
-    else:
-        raise ValueError("No valid JSON object found in the LLM output.")
+    data = json.loads(json_text)
+    items = data.get("tasks") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON object with a 'tasks' list")
+    extraction = TaskListExtraction()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            extraction.rejected.append(f"Item {index}: expected an object, but got {type(item).__name__}")
+            continue
+        try:
+            extraction.tasks.append(
+                Task.model_validate({name: item[name] for name in LLM_TASK_FIELDS if name in item})
+            )
+        except ValidationError as e:
+            details = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+            extraction.rejected.append(f"Item {index}: {details}")
+    return extraction
+
+def _llm_fields(task: Task) -> LLMTaskSchema:
+    """The LLM-generated part of an already validated task, as stored in the extraction cache."""
+    return LLMTaskSchema.model_construct(**{name: getattr(task, name) for name in LLM_TASK_FIELDS})
+
+@dataclass
+class FastPathStats:
+    """Counts how often the rule-based fast path handled a query."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        attempts = self.hits + self.misses
+        return self.hits / attempts if attempts else 0.0
 
 class TaskManagerAgent:
     """
     The main agent responsible for understanding natural language and creating tasks.
     It now handles the entire parsing and validation process.
+
+    Two optional stages sit in front of the LLM chain, and either one skips the
+    LLM round-trip entirely:
+    - a `RuleBasedTaskParser` fast path, used when its confidence reaches
+      `fast_path_min_confidence`;
+    - an `ExtractionCache` holding the extraction for the same query (resolved
+      on the same day, with the same prompt).
+
+    With `stream_llm_output`, the LLM response is streamed and consumed only
+    until the first JSON object closes; trailing chatter is never waited for.
+
+    `prompt_style` selects the prompts from `PROMPT_STYLES`: "verbose" inlines
+    the output schema, "compact" keeps a static, cacheable prefix and is meant
+    to be used with `json_mode`, which asks the model for schema-conforming JSON.
+    `fingerprint` is the `current_prompt_fingerprint` for these settings, if the
+    caller has already computed it.
     """
-    def __init__(self):
-        self.chain = task_creation_prompt | llm_client
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        cache: Optional[ExtractionCache] = None,
+        fast_path: Optional[RuleBasedTaskParser] = None,
+        fast_path_min_confidence: float = 0.8,
+        batch_max_concurrency: int = 8,
+        stream_llm_output: bool = True,
+        prompt_style: str = "verbose",
+        json_mode: bool = False,
+        fingerprint: Optional[str] = None,
+    ):
+        llm = llm if llm is not None else get_llm_client()
+        self.llm = llm
+        self.prompt_style = prompt_style
+        self.prompts = PROMPT_STYLES[prompt_style]
+        self._task_llm = llm.bind(**json_mode_kwargs(LLMTaskSchema)) if json_mode else llm
+        self._task_list_llm = llm.bind(**json_mode_kwargs(LLMTaskListSchema)) if json_mode else llm
+        self.chain = self.prompts.task | self._task_llm
+        self.cache = cache
+        self.fast_path = fast_path
+        self.fast_path_min_confidence = fast_path_min_confidence
+        self.fast_path_stats = FastPathStats()
+        self.batch_max_concurrency = batch_max_concurrency
+        self.stream_llm_output = stream_llm_output
+        if self.cache is not None:
+            # Entries produced by a different prompt or model are invalidated here.
+            self.cache.set_fingerprint(fingerprint or current_prompt_fingerprint(llm, prompt_style, json_mode))
 
-    def create_task_from_text(self, user_query: str) -> Task:
+    def _build_prompt_inputs(self, user_query: str, now: datetime) -> Dict[str, Any]:
+        """Returns the variables used to fill the task creation prompt."""
+        return {
+            "query": user_query,
+            "current_date": format_prompt_date(now, self.prompts.date_only),
+        }
+
+    def _format_prompt(self, prompt: PromptTemplate, user_query: str, now: datetime) -> Any:
+        with _STAGES["prompt_format"].time():
+            return prompt.invoke(self._build_prompt_inputs(user_query, now))
+
+    def _call_llm(self, llm: Runnable, prompt_value: Any) -> Tuple[str, Optional[str]]:
         """
-        Takes a natural language query, gets a response from the LLM, sanitizes
-        and parses it, and returns a full, validated Task object.
+        Calls (or streams from) the LLM. Returns its raw output and, when
+        streamed, the JSON object already extracted from it.
         """
-        print(f"Processing query: '{user_query}'...")
+        _RESOLVED_BY["llm"].inc()
+        if not self.stream_llm_output:
+            with _STAGES["llm_call"].time():
+                llm_response = llm.invoke(prompt_value)
+            record_token_usage(llm_response)
+            return self._chunk_text(llm_response), None
 
-        prompt_inputs = {
-            "query": user_query,
-            "current_date": datetime.now(timezone.utc).isoformat()
-        }
-        
-        llm_response = self.chain.invoke(prompt_inputs)
-        raw_llm_output = llm_response.content
-        
-        if not isinstance(raw_llm_output, str):
-            raise TypeError(f"Expected a string from LLM, but got {type(raw_llm_output)}")
-        
-        print(f"Raw LLM Output:\n{raw_llm_output}")
+        extractor = IncrementalJSONExtractor()
+        with _STAGES["llm_call"].time(), closing(llm.stream(prompt_value)) as stream:
+            for chunk in stream:
+                record_token_usage(chunk)
+                if extractor.feed(self._chunk_text(chunk)) is not None:
+                    break
+        return extractor.text, extractor.result
+
+    async def _acall_llm(self, llm: Runnable, prompt_value: Any) -> Tuple[str, Optional[str]]:
+        """Async version of `_call_llm`."""
+        _RESOLVED_BY["llm"].inc()
+        if not self.stream_llm_output:
+            with _STAGES["llm_call"].time():
+                llm_response = await llm.ainvoke(prompt_value)
+            record_token_usage(llm_response)
+            return self._chunk_text(llm_response), None
+
+        extractor = IncrementalJSONExtractor()
+        with _STAGES["llm_call"].time():
+            async with aclosing(llm.astream(prompt_value)) as stream:
+                async for chunk in stream:
+                    record_token_usage(chunk)
+                    if extractor.feed(self._chunk_text(chunk)) is not None:
+                        break
+        return extractor.text, extractor.result
+
+    def _chunk_text(self, message: Any) -> str:
+        content = message.content
+        if not isinstance(content, str):
+            _PARSE_FAILURES["type"].inc()
+            raise TypeError(f"Expected a string from LLM, but got {type(content)}")
+        return content
+
+    def _parse_llm_response(self, llm_response: Any) -> Task:
+        """
+        Sanitizes and parses a raw LLM response into a Task.
+        """
+        record_token_usage(llm_response)
+        return self._parse_llm_output(self._chunk_text(llm_response))
+
+    def _parse_llm_output(
+        self,
+        raw_llm_output: str,
+        json_text: Optional[str] = None,
+        validate: Callable[[str], T] = validate_task_json,  # type: ignore[assignment]
+    ) -> T:
+        """
+        Validates the JSON object in the LLM output with `validate` (into a Task
+        by default). `json_text` is the object if it was already extracted while
+        streaming.
+        """
+        # Raw outputs are large; only a sample of them is logged, and only at DEBUG level.
+        if logger.isEnabledFor(logging.DEBUG) and should_log_payload():
+            logger.debug("Raw LLM output:\n%s", raw_llm_output)
 
+        stage = "sanitize"
         try:
             # Sanitize the output to extract ONLY the JSON part.
-            clean_json_str = sanitize_and_extract_json(raw_llm_output)
-
-            # Parse the clean string into the simpler LLMTaskSchema.
-            parsed_llm_data = pydantic_parser.parse(clean_json_str)
-
-            # Create the final, complete Task object.
-            final_task = Task(**parsed_llm_data.model_dump())
-            
-            print(f"Successfully parsed task: {final_task.title}")
-            return final_task
-        except Exception as e:
-            print(f"Agent failed to create task: {e}")
+            if json_text is None:
+                with _STAGES["sanitize"].time():
+                    json_text = sanitize_and_extract_json(raw_llm_output)
+
+            stage = "parse"
+            with _STAGES["parse"].time():
+                return validate(json_text)
+        except ValueError as e:
+            _PARSE_FAILURES[stage].inc()
+            logger.warning("Failed to parse LLM output at the %s stage: %s", stage, e)
             raise ValueError(f"Failed to create task from LLM output. Error: {e}")
 
-# --- Singleton instance ---
-task_agent = TaskManagerAgent()
\ No newline at end of file
+    def _build_task(self, parsed_llm_data: LLMTaskSchema) -> Task:
+        """
+        Creates the final, complete Task object from LLM fields produced by the
+        fast path or the cache. They are already validated, so they are not
+        validated again.
+        """
+        with _STAGES["build_task"].time():
+            return Task.model_construct(**dict(parsed_llm_data))
+
+    def _fast_path_parse(self, user_query: str, now: datetime) -> Optional[LLMTaskSchema]:
+        if self.fast_path is None:
+            return None
+        with _STAGES["fast_path"].time():
+            result = self.fast_path.parse(user_query, now)
+        if result is None or result.confidence < self.fast_path_min_confidence:
+            self.fast_path_stats.misses += 1
+            return None
+        self.fast_path_stats.hits += 1
+        _RESOLVED_BY["fast_path"].inc()
+        logger.debug("Fast path parsed query (confidence %.2f): '%s'", result.confidence, user_query)
+        return result.task
+
+    def _cache_get(self, user_query: str, now: datetime) -> Optional[LLMTaskSchema]:
+        if self.cache is None:
+            return None
+        with _STAGES["cache_lookup"].time():
+            cached = self.cache.get(user_query, now)
+        if cached is not None:
+            _RESOLVED_BY["cache"].inc()
+            logger.debug("Extraction cache hit for query: '%s'", user_query)
+        return cached
+
+    def _resolve_without_llm(self, user_query: str, now: datetime) -> Optional[LLMTaskSchema]:
+        """Tries the rule-based fast path, then the extraction cache."""
+        parsed_llm_data = self._fast_path_parse(user_query, now)
+        if parsed_llm_data is None:
+            parsed_llm_data = self._cache_get(user_query, now)
+        return parsed_llm_data
+
+    def _cache_put(self, user_query: str, now: datetime, task: Task) -> None:
+        if self.cache is not None:
+            with _STAGES["cache_store"].time():
+                self.cache.put(user_query, now, _llm_fields(task))
+
+    def create_task_from_text(self, user_query: str) -> Task:
+        """
+        Takes a natural language query, gets a response from the LLM, sanitizes
+        and parses it, and returns a full, validated Task object.
+        """
+        logger.info("Processing query: '%s'", user_query)
+        now = datetime.now(timezone.utc)
+
+        parsed_llm_data = self._resolve_without_llm(user_query, now)
+        if parsed_llm_data is not None:
+            return self._build_task(parsed_llm_data)
+        prompt_value = self._format_prompt(self.prompts.task, user_query, now)
+        task = self._parse_llm_output(*self._call_llm(self._task_llm, prompt_value))
+        logger.debug("Successfully parsed task: %s", task.title)
+        self._cache_put(user_query, now, task)
+        return task
+
+    async def acreate_task_from_text(self, user_query: str) -> Task:
+        """
+        Async version of `create_task_from_text`. The LLM round-trip is awaited
+        (or streamed), so it never blocks the event loop.
+        """
+        logger.info("Processing query: '%s'", user_query)
+        now = datetime.now(timezone.utc)
+
+        # Cache lookups may embed the query, so they run off the event loop.
+        parsed_llm_data = await asyncio.to_thread(self._resolve_without_llm, user_query, now)
+        if parsed_llm_data is not None:
+            return self._build_task(parsed_llm_data)
+        prompt_value = self._format_prompt(self.prompts.task, user_query, now)
+        task = self._parse_llm_output(*await self._acall_llm(self._task_llm, prompt_value))
+        logger.debug("Successfully parsed task: %s", task.title)
+        await asyncio.to_thread(self._cache_put, user_query, now, task)
+        return task
+
+    def extract_tasks_from_text(self, user_query: str) -> TaskListExtraction:
+        """
+        Extracts every task described in a single natural language query (e.g.
+        "email Bob, book flights for Friday, and renew gym membership") with one
+        LLM call. Each item is validated on its own: invalid items are dropped
+        and reported in `rejected`, valid ones are kept.
+
+        The fast path and the extraction cache only hold single tasks, so this
+        always calls the LLM.
+
+        Raises:
+            ValueError: If the output holds no task list at all.
+        """
+        logger.info("Processing multi-task query: '%s'", user_query)
+        now = datetime.now(timezone.utc)
+        prompt_value = self._format_prompt(self.prompts.task_list, user_query, now)
+        return self._parse_llm_output(*self._call_llm(self._task_list_llm, prompt_value), validate=self._validate_task_list)
+
+    async def aextract_tasks_from_text(self, user_query: str) -> TaskListExtraction:
+        """Async version of `extract_tasks_from_text`."""
+        logger.info("Processing multi-task query: '%s'", user_query)
+        now = datetime.now(timezone.utc)
+        prompt_value = self._format_prompt(self.prompts.task_list, user_query, now)
+        return self._parse_llm_output(
+            *await self._acall_llm(self._task_list_llm, prompt_value), validate=self._validate_task_list
+        )
+
+    def _validate_task_list(self, json_text: str) -> TaskListExtraction:
+        extraction = validate_task_list_json(json_text)
+        if extraction.rejected:
+            _PARSE_FAILURES["item"].inc(len(extraction.rejected))
+            logger.warning("Dropped %d invalid task(s) from LLM output", len(extraction.rejected))
+        return extraction
+
+    async def create_tasks_from_texts(
+        self, user_queries: List[str], max_concurrency: Optional[int] = None
+    ) -> List[Union[Task, Exception]]:
+        """
+        Extracts tasks from many natural language queries concurrently.
+
+        Queries handled by the fast path or the extraction cache skip the LLM; the remaining
+        LLM calls are fanned out with `chain.abatch`, keeping at most
+        `max_concurrency` requests in flight. A failing query does not abort
+        the batch; its exception is returned in place of the task.
+
+        Args:
+            user_queries: The natural language queries to process.
+            max_concurrency: Cap on concurrent LLM calls. Defaults to the
+                agent's `batch_max_concurrency`.
+
+        Returns:
+            One entry per query, in input order: the created Task, or the
+            exception that prevented it from being created.
+        """
+        if not user_queries:
+            return []
+
+        concurrency = max_concurrency or self.batch_max_concurrency
+        logger.info("Processing batch of %d queries (max concurrency: %d)", len(user_queries), concurrency)
+        now = datetime.now(timezone.utc)
+
+        parsed: List[Union[LLMTaskSchema, Task, Exception, None]] = list(
+            await asyncio.to_thread(lambda: [self._resolve_without_llm(query, now) for query in user_queries])
+        )
+        pending = [i for i, entry in enumerate(parsed) if entry is None]
+
+        with _STAGES["llm_batch_call"].time():
+            llm_responses = await self.chain.abatch(
+                [self._build_prompt_inputs(user_queries[i], now) for i in pending],
+                config={"max_concurrency": concurrency},
+                return_exceptions=True,
+            )
+        _RESOLVED_BY["llm"].inc(len(pending))
+
+        extracted: List[Tuple[str, Task]] = []
+        for i, llm_response in zip(pending, llm_responses):
+            if isinstance(llm_response, Exception):
+                parsed[i] = llm_response
+                continue
+            try:
+                task = self._parse_llm_response(llm_response)
+            except (ValueError, TypeError) as e:
+                parsed[i] = e
+                continue
+            parsed[i] = task
+            extracted.append((user_queries[i], task))
+
+        if extracted:
+            await asyncio.to_thread(lambda: [self._cache_put(query, now, task) for query, task in extracted])
+
+        return [
+            entry if isinstance(entry, (Task, Exception)) else self._build_task(cast(LLMTaskSchema, entry))
+            for entry in parsed
+        ]
+
+
+def current_prompt_fingerprint(llm: BaseChatModel, prompt_style: str = "verbose", json_mode: bool = False) -> str:
+    """
+    Fingerprint of the prompt, model and output mode used for extraction. Cached
+    extractions are only valid for the fingerprint that produced them.
+    """
+    model_name = getattr(llm, "model", None) or getattr(llm, "model_name", None) or type(llm).__name__
+    prompt = PROMPT_STYLES[prompt_style].task
+    return prompt_fingerprint(
+        prompt.template,
+        prompt.partial_variables,
+        model_name,
+        json_mode,
+    )
+
+def create_extraction_cache(fingerprint: str) -> Optional[ExtractionCache]:
+    """
+    Builds the extraction cache described by `settings.agent.cache`, or returns
+    None if caching is disabled.
+    """
+    settings = get_settings()
+    cache_settings = settings.agent.cache
+    if not cache_settings.enabled:
+        return None
+    if not cache_settings.semantic_enabled:
+        return InMemoryExtractionCache(fingerprint, cache_settings.ttl_seconds, cache_settings.max_entries)
+
+    from src.storage.vector_store import get_chroma_store
+
+    # Shares the task store's ChromaDB client and (cached) embedder.
+    chroma_store = get_chroma_store()
+    return SemanticExtractionCache(
+        client=chroma_store.client,
+        embedder=chroma_store.embedder,
+        fingerprint=fingerprint,
+        ttl_seconds=cache_settings.ttl_seconds,
+        max_entries=cache_settings.max_entries,
+        similarity_threshold=cache_settings.similarity_threshold,
+        collection_name=cache_settings.collection_name,
+    )
+
+# --- Lazily created singleton ---
+@lru_cache(maxsize=1)
+def get_task_agent() -> TaskManagerAgent:
+    """
+    Returns the application's agent. The LLM client, extraction cache and
+    settings are only created on the first call.
+    """
+    settings = get_settings()
+    llm = get_llm_client()
+    fast_path_settings = settings.agent.fast_path
+    fingerprint = current_prompt_fingerprint(llm, settings.agent.prompt_style, settings.agent.json_mode)
+    return TaskManagerAgent(
+        llm=llm,
+        cache=create_extraction_cache(fingerprint),
+        fast_path=RuleBasedTaskParser(fast_path_settings.max_words) if fast_path_settings.enabled else None,
+        fast_path_min_confidence=fast_path_settings.min_confidence,
+        batch_max_concurrency=settings.agent.batch_max_concurrency,
+        stream_llm_output=settings.agent.stream_llm_output,
+        prompt_style=settings.agent.prompt_style,
+        json_mode=settings.agent.json_mode,
+        fingerprint=fingerprint,
+    )
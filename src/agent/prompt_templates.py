@@ -1,9 +1,15 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Dict, Type
+
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
-from src.models.task import LLMTaskSchema, TaskCategory, TaskPriority
+from pydantic import BaseModel
+
+from src.models.task import LLMTaskListSchema, LLMTaskSchema, TaskCategory, TaskPriority
 
 pydantic_parser = PydanticOutputParser(pydantic_object=LLMTaskSchema)
+task_list_parser = PydanticOutputParser(pydantic_object=LLMTaskListSchema)
 
 task_creation_prompt = PromptTemplate(
     template="""
@@ -33,4 +39,98 @@ task_creation_prompt = PromptTemplate(
         "categories": list(TaskCategory.__args__),
         "priorities": list(TaskPriority.__args__),
     },
-)
\ No newline at end of file
+)
+
+# Variant of `task_creation_prompt` for queries that may describe several tasks,
+# e.g. "email Bob, book flights for Friday, and renew gym membership".
+multi_task_creation_prompt = PromptTemplate(
+    template="""
+    You are an expert AI assistant that extracts structured information from user input.
+    Your goal is to create one `Task` object for every distinct task in the user's query.
+
+    Analyze the user's query below. It may describe a single task or several; return them all in the `tasks` list, in the order they appear.
+
+    User Query:
+    "{query}"
+
+    Contextual Information:
+    - Today's date is {current_date}. Use this to resolve relative dates like "tomorrow" or "next week".
+
+    Follow these specific instructions for every task:
+    - Title: Create a concise and clear title for the task.
+    - Category: Assign one of the following categories: {categories}. If no specific category fits, use "Other".
+    - Priority: Assign a priority level: {priorities}. Infer this from words like "urgent," "ASAP," or if no urgency is implied, default to "Medium".
+    - Due Date: If a date or time is mentioned, convert it to a valid ISO 8601 datetime format (YYYY-MM-DDTHH:MM:SSZ). A date only applies to the task it is mentioned with.
+    - Description: If there are extra details in the query, add them here. Otherwise, leave it empty.
+    - Do not merge separate actions into one task, and do not split a single action into several.
+
+    {format_instructions}
+    """,
+    input_variables=["query", "current_date"],
+    partial_variables={
+        "format_instructions": task_list_parser.get_format_instructions(),
+        "categories": list(TaskCategory.__args__),
+        "priorities": list(TaskPriority.__args__),
+    },
+)
+
+# --- Compact prompts ---
+# Cheaper variants of the prompts above, tuned for token cost:
+# - Instructions come first and are identical on every call; only the date and
+#   the query at the very end change, so providers can cache the prefix.
+# - The date has day granularity, so the prefix up to the query only changes daily.
+# - Fields are described in one line each instead of an inlined JSON schema. The
+#   schema itself is enforced by the provider's JSON mode (see `json_mode_kwargs`).
+_COMPACT_FIELDS = f"""Fields:
+- title: short, clear task title.
+- category: one of {", ".join(TaskCategory.__args__)}; "Other" if none fits.
+- priority: one of {", ".join(TaskPriority.__args__)}; "Medium" unless urgency is implied (e.g. "urgent", "ASAP").
+- description: extra details from the query, or null.
+- due_date: ISO 8601 datetime (YYYY-MM-DDTHH:MM:SSZ) if a date or time is mentioned, resolved against today's date; otherwise null."""
+
+compact_task_creation_prompt = PromptTemplate(
+    template=f"""Extract one task from the user's query. Reply with a single JSON object and nothing else.
+{_COMPACT_FIELDS}
+
+Today: {{current_date}}
+Query: {{query}}""",
+    input_variables=["query", "current_date"],
+)
+
+compact_multi_task_creation_prompt = PromptTemplate(
+    template=f"""Extract every distinct task from the user's query, in order. Reply with a single JSON object {{{{"tasks": [...]}}}} and nothing else. Do not merge separate actions or split a single one; a date only applies to the task it is mentioned with.
+{_COMPACT_FIELDS}
+
+Today: {{current_date}}
+Query: {{query}}""",
+    input_variables=["query", "current_date"],
+)
+
+
+@dataclass(frozen=True)
+class PromptStyle:
+    """The prompts the agent uses for single- and multi-task extraction, and how it fills them in."""
+    task: PromptTemplate
+    task_list: PromptTemplate
+    # Dates are given to the LLM with day granularity, e.g. "2025-11-08 (Saturday)".
+    date_only: bool
+
+
+PROMPT_STYLES: Dict[str, PromptStyle] = {
+    "verbose": PromptStyle(task_creation_prompt, multi_task_creation_prompt, date_only=False),
+    "compact": PromptStyle(compact_task_creation_prompt, compact_multi_task_creation_prompt, date_only=True),
+}
+
+
+def format_prompt_date(now: datetime, date_only: bool) -> str:
+    if date_only:
+        return f"{now.date().isoformat()} ({now.strftime('%A')})"
+    return now.isoformat()
+
+
+def json_mode_kwargs(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Call options that make Gemini return JSON matching `schema` (its native
+    structured output), instead of relying on schema text in the prompt.
+    """
+    return {"response_mime_type": "application/json", "response_json_schema": schema.model_json_schema()}
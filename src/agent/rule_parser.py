@@ -0,0 +1,246 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.models.task import LLMTaskSchema, TaskCategory, TaskPriority
+
+# Keyword tables used to classify a query. Multi-word phrases are listed before the
+# single words they contain so that "high priority" is consumed as one phrase.
+PRIORITY_KEYWORDS: Dict[TaskPriority, List[str]] = {
+    "Urgent": ["urgent", "urgently", "asap", "immediately", "right away", "critical"],
+    "High": ["high priority", "important", "top priority"],
+    "Low": ["low priority", "no rush", "whenever", "someday", "eventually"],
+}
+
+CATEGORY_KEYWORDS: Dict[TaskCategory, List[str]] = {
+    "Work": ["meeting", "report", "client", "presentation", "deadline", "project", "boss",
+             "colleague", "invoice", "standup", "sprint", "email", "slides", "office"],
+    "Personal": ["groceries", "grocery", "mom", "dad", "dentist", "doctor", "birthday", "bills",
+                 "rent", "laundry", "haircut", "pharmacy", "vet", "family", "clean"],
+    "Study": ["study", "exam", "homework", "lecture", "course", "assignment", "revise",
+              "thesis", "chapter", "tutorial", "quiz", "learn"],
+    "Fitness": ["gym", "workout", "run", "running", "jog", "yoga", "swim", "swimming",
+                "cycling", "exercise", "stretch", "pilates"],
+}
+
+# Leading phrases that carry no meaning for the title.
+_FILLER_PATTERN = re.compile(
+    r"^(?:please\s+|remind\s+me\s+to\s+|don'?t\s+forget\s+to\s+|i\s+(?:need|have|want)\s+to\s+"
+    r"|need\s+to\s+|have\s+to\s+|todo:?\s+|task:?\s+)+",
+    re.IGNORECASE,
+)
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+_MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+_NUMBER_WORDS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+                 "six": 6, "seven": 7, "ten": 10, "fourteen": 14}
+_DATE_PREFIX = r"(?:(?:by|on|due|before|until|for|this|next)\s+)*"
+
+_RELATIVE_DAY_PATTERN = re.compile(
+    rf"\b{_DATE_PREFIX}(day after tomorrow|tomorrow|today|tonight)\b", re.IGNORECASE
+)
+_OFFSET_PATTERN = re.compile(
+    rf"\b{_DATE_PREFIX}in\s+(\d+|{'|'.join(_NUMBER_WORDS)})\s+(days?|weeks?)\b", re.IGNORECASE
+)
+_NEXT_WEEK_PATTERN = re.compile(r"\b(?:by\s+|due\s+)?next\s+week\b", re.IGNORECASE)
+_WEEKDAY_PATTERN = re.compile(rf"\b{_DATE_PREFIX}({'|'.join(_WEEKDAYS)})\b", re.IGNORECASE)
+_ISO_DATE_PATTERN = re.compile(rf"\b{_DATE_PREFIX}(\d{{4}})-(\d{{2}})-(\d{{2}})\b", re.IGNORECASE)
+_MONTH_DAY_PATTERN = re.compile(
+    rf"\b{_DATE_PREFIX}(?:({'|'.join(_MONTHS)})[a-z]*\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?"
+    rf"|(\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?({'|'.join(_MONTHS)})[a-z]*)\b",
+    re.IGNORECASE,
+)
+_TIME_PATTERN = re.compile(
+    r"\b(?:at\s+)?(?:(\d{1,2})(?::(\d{2}))?\s*(am|pm)|(\d{1,2}):(\d{2})|(noon|midnight))\b",
+    re.IGNORECASE,
+)
+# Temporal or structural cues that survive extraction mean the query was not fully
+# understood, e.g. "every monday", "next month", "this weekend".
+_UNRESOLVED_PATTERN = re.compile(
+    r"\b(?:every|next|this|weekend|morning|afternoon|evening|month|year|week|"
+    r"am|pm|daily|weekly|monthly)\b|\d",
+    re.IGNORECASE,
+)
+_MULTI_TASK_PATTERN = re.compile(r"[,;]|\bthen\b|\balso\b", re.IGNORECASE)
+_CONJUNCTION_PATTERN = re.compile(r"\band\b", re.IGNORECASE)
+
+
+@dataclass
+class RuleParseResult:
+    """The outcome of a rule-based parse, with how much it should be trusted."""
+    task: LLMTaskSchema
+    confidence: float
+
+
+class RuleBasedTaskParser:
+    """
+    Deterministic parser for short, formulaic queries such as
+    "urgent: call dentist tomorrow 3pm".
+
+    It extracts priority and category keywords, relative or absolute due dates,
+    and a cleaned-up title, and scores how confident it is that nothing in the
+    query was missed. Callers should only use results above their confidence
+    threshold and fall back to the LLM otherwise.
+    """
+    def __init__(self, max_words: int = 12):
+        self._max_words = max_words
+        self._priority_patterns = self._compile_keywords(PRIORITY_KEYWORDS)
+        self._category_patterns = self._compile_keywords(CATEGORY_KEYWORDS)
+
+    @staticmethod
+    def _compile_keywords(table: Dict[str, List[str]]) -> List[Tuple[str, re.Pattern]]:
+        return [
+            (label, re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b", re.IGNORECASE))
+            for label, keywords in table.items()
+        ]
+
+    def parse(self, query: str, now: datetime) -> Optional[RuleParseResult]:
+        """
+        Parses a query into an `LLMTaskSchema`.
+
+        Args:
+            query: The natural language query.
+            now: The current (timezone-aware) time, used to resolve relative dates.
+
+        Returns:
+            The parsed task and a confidence score in [0, 1], or None if the
+            query is too long or complex for the rule-based parser.
+        """
+        text = " ".join(query.split())
+        if not text or len(text.split()) > self._max_words:
+            return None
+
+        confidence = 1.0
+
+        priority: TaskPriority = "Medium"
+        for label, pattern in self._priority_patterns:
+            if pattern.search(text):
+                priority = label  # type: ignore[assignment]
+                text = pattern.sub(" ", text)
+                break
+
+        due_date, text, date_matches = self._extract_due_date(text, now)
+        if date_matches > 1:
+            confidence -= 0.5
+
+        category: TaskCategory = "Other"
+        for label, pattern in self._category_patterns:
+            if pattern.search(text):
+                category = label  # type: ignore[assignment]
+                break
+        if category == "Other":
+            confidence -= 0.2
+
+        title = self._clean_title(text)
+        if not title:
+            return None
+
+        if _UNRESOLVED_PATTERN.search(title):
+            confidence -= 0.4
+        if _MULTI_TASK_PATTERN.search(title):
+            confidence -= 0.4
+        elif _CONJUNCTION_PATTERN.search(title):
+            confidence -= 0.2
+        if len(title.split()) < 2:
+            confidence -= 0.2
+
+        task = LLMTaskSchema(title=title, category=category, priority=priority, description=None, due_date=due_date)
+        return RuleParseResult(task=task, confidence=max(confidence, 0.0))
+
+    def _extract_due_date(self, text: str, now: datetime) -> Tuple[Optional[datetime], str, int]:
+        """Finds one date and one time expression, removes them from the text."""
+        day: Optional[datetime] = None
+        date_matches = 0
+        tonight = re.search(r"\btonight\b", text, re.IGNORECASE) is not None
+
+        for pattern, resolve in (
+            (_RELATIVE_DAY_PATTERN, self._resolve_relative_day),
+            (_OFFSET_PATTERN, self._resolve_offset),
+            (_NEXT_WEEK_PATTERN, lambda m, now: now + timedelta(days=7)),
+            (_ISO_DATE_PATTERN, self._resolve_iso_date),
+            (_MONTH_DAY_PATTERN, self._resolve_month_day),
+            (_WEEKDAY_PATTERN, self._resolve_weekday),
+        ):
+            for match in pattern.finditer(text):
+                resolved = resolve(match, now)
+                if resolved is None:
+                    continue
+                date_matches += 1
+                day = day or resolved
+                text = text.replace(match.group(0), " ", 1)
+
+        at_time: Optional[time] = None
+        time_match = _TIME_PATTERN.search(text)
+        if time_match:
+            at_time = self._resolve_time(time_match)
+            if at_time is not None:
+                text = text.replace(time_match.group(0), " ", 1)
+
+        if day is None and at_time is None:
+            return None, text, 0
+        if day is None:
+            # A bare time refers to its next occurrence.
+            day = now if at_time > now.time() else now + timedelta(days=1)  # type: ignore[operator]
+            date_matches = 1
+        if at_time is None:
+            # Without an explicit time, a task is due at the end of the day (or the evening for "tonight").
+            at_time = time(20, 0) if tonight else time(23, 59, 59)
+        return datetime.combine(day.date(), at_time, tzinfo=now.tzinfo), text, date_matches
+
+    @staticmethod
+    def _resolve_relative_day(match: re.Match, now: datetime) -> Optional[datetime]:
+        word = match.group(1).lower()
+        offset = {"today": 0, "tonight": 0, "tomorrow": 1, "day after tomorrow": 2}[word]
+        return now + timedelta(days=offset)
+
+    @staticmethod
+    def _resolve_offset(match: re.Match, now: datetime) -> Optional[datetime]:
+        amount_word, unit = match.group(1).lower(), match.group(2).lower()
+        amount = int(amount_word) if amount_word.isdigit() else _NUMBER_WORDS[amount_word]
+        return now + timedelta(days=amount * (7 if unit.startswith("week") else 1))
+
+    @staticmethod
+    def _resolve_weekday(match: re.Match, now: datetime) -> Optional[datetime]:
+        days_ahead = (_WEEKDAYS.index(match.group(1).lower()) - now.weekday()) % 7
+        return now + timedelta(days=days_ahead or 7)
+
+    @staticmethod
+    def _resolve_iso_date(match: re.Match, now: datetime) -> Optional[datetime]:
+        try:
+            return now.replace(year=int(match.group(1)), month=int(match.group(2)), day=int(match.group(3)))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _resolve_month_day(match: re.Match, now: datetime) -> Optional[datetime]:
+        month_name = (match.group(1) or match.group(4)).lower()
+        day = int(match.group(2) or match.group(3))
+        try:
+            resolved = now.replace(month=_MONTHS.index(month_name[:3]) + 1, day=day)
+            # A date that has already passed this year refers to next year.
+            if resolved.date() < now.date():
+                resolved = resolved.replace(year=now.year + 1)
+            return resolved
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _resolve_time(match: re.Match) -> Optional[time]:
+        hour_12, minute_12, meridiem, hour_24, minute_24, named = match.groups()
+        if named:
+            return time(12, 0) if named.lower() == "noon" else time(0, 0)
+        if meridiem:
+            hour = int(hour_12) % 12 + (12 if meridiem.lower() == "pm" else 0)
+            minute = int(minute_12 or 0)
+        else:
+            hour, minute = int(hour_24), int(minute_24)
+        if hour > 23 or minute > 59:
+            return None
+        return time(hour, minute)
+
+    @staticmethod
+    def _clean_title(text: str) -> str:
+        title = " ".join(text.split()).strip(" :-,.!")
+        title = _FILLER_PATTERN.sub("", title).strip(" :-,.!")
+        title = re.sub(r"\s+(?:by|on|at|due|before|until|for)$", "", title, flags=re.IGNORECASE)
+        return title[:1].upper() + title[1:]
@@ -3,41 +3,629 @@
 # 2. Run from the project root: `uvicorn src.api.endpoints:app --reload`
 # 3. Access the interactive documentation at http://127.0.0.1:8000/docs
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional
 
-from src.agent.main_agent import task_agent
-from src.storage.vector_store import task_store
-from src.models.task import Task
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from src.agent.job_runner import TaskJobRunner
+from src.agent.main_agent import TaskManagerAgent, get_task_agent
+from src.core.config import get_settings
+from src.core.logging_config import get_correlation_id, reset_correlation_id, set_correlation_id, setup_logging
+from src.core.metrics import HTTP_REQUEST_SECONDS, REGISTRY, Sample
+from src.llm.resilience import LLMUnavailableError
+from src.storage.async_store import AsyncTaskStore
+from src.storage.caching_store import CachingTaskStore
+from src.storage.job_queue import SQLiteJobQueue
+from src.storage.vector_store import get_task_store
+from src.models.job import Job
+from src.models.task import Task, TaskCategory, TaskFilter, TaskPriority, TaskSearchResult, TaskStats, TaskUpdate
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
+def get_async_task_store() -> AsyncTaskStore:
+    """
+    Offloads blocking ChromaDB calls to a bounded thread pool so that the event
+    loop keeps serving other requests while storage I/O is in flight. The store
+    is opened on the first request that needs it, not at import time.
+    """
+    return AsyncTaskStore(get_task_store(), max_workers=get_settings().storage.io_workers)
+
+@lru_cache(maxsize=1)
+def get_job_runner() -> TaskJobRunner:
+    """
+    Returns the runner behind `POST /task/create?async=true`. Its queue, the
+    agent and the store are only opened once a job needs them.
+    """
+    settings = get_settings().jobs
+    return TaskJobRunner(
+        lambda: SQLiteJobQueue(settings.path, lease_seconds=settings.lease_seconds, max_attempts=settings.max_attempts),
+        get_task_agent,
+        get_async_task_store,
+        workers=settings.workers,
+        poll_interval_seconds=settings.poll_interval_seconds,
+        retry_delay_seconds=settings.retry_delay_seconds,
+        retention_seconds=settings.retention_seconds,
+        max_wait_seconds=settings.max_wait_seconds,
+    )
+
+def job_runner_provider() -> Callable[[], TaskJobRunner]:
+    """
+    Hands `POST /task/create` the job runner getter instead of the runner, so
+    that synchronous requests never build it.
+    """
+    return get_job_runner
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    # Started with the app, so that jobs queued before a restart are picked up.
+    await get_job_runner().start()
+    yield
+    await get_job_runner().stop()
+    # Only shut the pool down if a request actually created it.
+    if get_async_task_store.cache_info().currsize:
+        get_async_task_store().shutdown()
+    # Saves the in-memory task counts, if the store was opened.
+    if get_task_store.cache_info().currsize:
+        get_task_store().flush()
 
 app = FastAPI(
     title="AI Task Manager Agent API",
     description="An API to interact with the AI agent to create and manage tasks.",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
+class RequestMetricsMiddleware:
+    """
+    Records the latency of every HTTP request, labelled with the route template
+    (e.g. `/tasks/{task_id}`) rather than the raw path to keep cardinality bounded.
+    A plain ASGI middleware, so it adds no per-request task or body buffering.
+    """
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status_code = 500
+
+        async def send_with_status(message: Any) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status_code),
+            ).observe(time.perf_counter() - started)
+
+class CorrelationIdMiddleware:
+    """
+    Gives every HTTP request a correlation id, taken from the `X-Request-ID`
+    header or generated, that is attached to all log records emitted while
+    serving it and echoed back in the response headers.
+    """
+    header = b"x-request-id"
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        incoming = dict(scope["headers"]).get(self.header)
+        token = set_correlation_id(incoming.decode("latin-1")[:128] if incoming else None)
+        correlation_id = get_correlation_id() or ""
+
+        async def send_with_header(message: Any) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (self.header, correlation_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            reset_correlation_id(token)
+
+app.add_middleware(RequestMetricsMiddleware)
+app.add_middleware(CorrelationIdMiddleware)
+
+def collect_cache_events() -> Iterator[Sample]:
+    """
+    Scrape-time samples for the fast path, extraction cache and read cache
+    counters. Components that have not been created yet are skipped, so a
+    scrape never opens the store or the LLM client.
+    """
+    if get_task_agent.cache_info().currsize:
+        task_agent = get_task_agent()
+        yield "_total", {"cache": "fast_path", "result": "hit"}, task_agent.fast_path_stats.hits
+        yield "_total", {"cache": "fast_path", "result": "miss"}, task_agent.fast_path_stats.misses
+        if task_agent.cache is not None:
+            cache_stats = task_agent.cache.stats
+            yield "_total", {"cache": "extraction", "result": "hit"}, cache_stats.hits
+            yield "_total", {"cache": "extraction", "result": "miss"}, cache_stats.misses
+    if get_async_task_store.cache_info().currsize:
+        store = get_async_task_store().store
+        if isinstance(store, CachingTaskStore):
+            yield "_total", {"cache": "read", "result": "hit"}, store.stats.task_hits + store.stats.list_hits
+            yield "_total", {"cache": "read", "result": "miss"}, store.stats.task_misses + store.stats.list_misses
+
+REGISTRY.register_collector(
+    "cache_lookups", "counter", "Lookups in the agent and storage caches by result.", collect_cache_events
+)
+
+def collect_job_counts() -> Iterator[Sample]:
+    """Scrape-time number of background jobs in each status, once the job queue is open."""
+    if get_job_runner.cache_info().currsize and get_job_runner().queue_opened:
+        for status, count in get_job_runner().queue.counts().items():
+            yield "", {"status": status}, count
+
+REGISTRY.register_collector("jobs", "gauge", "Background task-creation jobs by status.", collect_job_counts)
+
 # Pydantic model for the request body to create a task
 class CreateTaskRequest(BaseModel):
     query: str
 
-@app.post("/task/create", response_model=Task)
-async def create_task(request: CreateTaskRequest):
+# Pydantic models for the batch creation endpoint
+class BatchCreateTaskRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1)
+    max_concurrency: Optional[int] = Field(None, ge=1, description="Cap on concurrent LLM calls for this batch")
+
+class BatchTaskResult(BaseModel):
+    query: str
+    success: bool
+    task: Optional[Task] = None
+    error: Optional[str] = None
+
+class BatchCreateTaskResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[BatchTaskResult]
+
+# Pydantic model for the multi-task extraction endpoint
+class ExtractTasksResponse(BaseModel):
+    query: str
+    created: int
+    tasks: List[Task]
+    rejected: List[str] = Field([], description="Validation errors of extracted items that were dropped")
+
+# Pydantic model for the search endpoint
+class TaskSearchResponse(BaseModel):
+    query: str
+    results: List[TaskSearchResult]
+
+# Pydantic models for the duplicate check endpoint
+class DuplicateCheckRequest(BaseModel):
+    titles: List[str] = Field(..., min_length=1)
+    include_near_duplicates: bool = False
+
+class NearDuplicate(BaseModel):
+    task: Task
+    similarity: float
+
+class DuplicateCheckResult(BaseModel):
+    title: str
+    exists: bool
+    near_duplicates: List[NearDuplicate] = []
+
+# Pydantic models for the bulk update and delete endpoints
+class CompleteTasksRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1)
+    is_completed: bool = True
+
+class CompleteTasksResponse(BaseModel):
+    updated: List[str]
+    missing: List[str]
+
+class DeleteTasksResponse(BaseModel):
+    deleted: List[str]
+    missing: List[str]
+
+# Pydantic models for the agent statistics endpoint
+class FastPathStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+
+class ExtractionCacheStatsResponse(BaseModel):
+    exact_hits: int
+    semantic_hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+
+class AgentStatsResponse(BaseModel):
+    fast_path: FastPathStatsResponse
+    cache: Optional[ExtractionCacheStatsResponse] = None
+
+# Pydantic models for the storage statistics endpoint
+class ReadCacheStatsResponse(BaseModel):
+    task_hits: int
+    task_misses: int
+    list_hits: int
+    list_misses: int
+    invalidations: int
+    hit_rate: float
+
+class StoreStatsResponse(BaseModel):
+    read_cache: Optional[ReadCacheStatsResponse] = None
+
+def llm_unavailable(error: LLMUnavailableError) -> HTTPException:
+    """A 503 response for an LLM outage, telling clients when to retry if the gateway knows."""
+    headers = {"Retry-After": str(math.ceil(error.retry_after))} if error.retry_after else None
+    return HTTPException(status_code=503, detail=f"The language model is unavailable: {error}", headers=headers)
+
+@app.post("/task/create", response_model=Task, responses={202: {"model": Job, "description": "Job queued"}})
+async def create_task(
+    request: CreateTaskRequest,
+    run_async: bool = Query(False, alias="async", description="Queue the task for background creation and return a job."),
+    priority: int = Query(0, ge=-100, le=100, description="Priority of the background job; higher runs first."),
+    task_agent: TaskManagerAgent = Depends(get_task_agent),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+    job_runner_getter: Callable[[], TaskJobRunner] = Depends(job_runner_provider),
+):
     """
     Accepts a natural language query and uses the AI agent to create
     a structured task, then saves it to the vector store.
+
+    With `async=true`, the query is queued instead and `202 Accepted` is
+    returned at once with the job, to be polled at `GET /jobs/{job_id}`. A
+    query that is already queued returns the existing job.
     """
+    if run_async:
+        job_runner = job_runner_getter()
+        await job_runner.start()
+        job, _ = await job_runner.submit(request.query, priority)
+        return JSONResponse(
+            status_code=202, content=job.model_dump(mode="json"), headers={"Location": f"/jobs/{job.id}"}
+        )
     try:
-        task = task_agent.create_task_from_text(request.query)
-        task_store.add_task(task)
+        task = await task_agent.acreate_task_from_text(request.query)
+        await async_task_store.add_task(task)
         return task
+    except LLMUnavailableError as e:
+        raise llm_unavailable(e)
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=400, detail=f"Failed to process task: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
+@app.get("/jobs/{job_id}", response_model=Job)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to wait for the job to finish (long-polling)."),
+    job_runner: TaskJobRunner = Depends(get_job_runner),
+):
+    """
+    Returns a background job and, once it has succeeded, the created task.
+    With `wait`, the response is held until the job finishes or the wait
+    (capped at `jobs.max_wait_seconds`) runs out.
+    """
+    job = await job_runner.wait(job_id, wait) if wait else await job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job
+
+def task_filters(
+    category: Optional[TaskCategory] = None,
+    priority: Optional[TaskPriority] = None,
+    is_completed: Optional[bool] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> TaskFilter:
+    """Collects the task filter query parameters shared by the listing endpoints."""
+    return TaskFilter(
+        category=category,
+        priority=priority,
+        is_completed=is_completed,
+        due_after=due_after,
+        due_before=due_before,
+        created_after=created_after,
+        created_before=created_before,
+    )
+
 @app.get("/tasks", response_model=list[Task])
-async def list_tasks():
+async def list_tasks(
+    limit: Optional[int] = Query(None, ge=1, description="Page size. Omit to return every matching task."),
+    offset: int = Query(0, ge=0, description="Number of matching tasks to skip."),
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. 'id,title'."),
+    filters: TaskFilter = Depends(task_filters),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Retrieves tasks from the vector store, newest first. Supports limit/offset
+    pagination, server-side filters and field projection, so only the requested
+    page is ever loaded. Stored tasks are already valid, so they are encoded
+    straight to JSON instead of being re-validated by the response model.
+    """
+    if fields:
+        field_list = [field.strip() for field in fields.split(",") if field.strip()]
+        try:
+            records = await async_task_store.project_tasks(field_list, limit=limit, offset=offset, filters=filters)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        # Projected records are partial tasks, so they bypass the Task response model.
+        return JSONResponse(content=records)
+    body = await async_task_store.list_tasks_json(limit=limit, offset=offset, filters=filters)
+    return Response(content=body, media_type="application/json")
+
+@app.get("/tasks/export")
+async def export_tasks(
+    output_format: Literal["ndjson", "sse"] = Query(
+        "ndjson", alias="format", description="Newline-delimited JSON or server-sent events."
+    ),
+    cursor: int = Query(0, ge=0, description="Number of tasks already received, to resume an interrupted export."),
+    batch_size: int = Query(500, ge=1, le=5000, description="Tasks fetched from the store per round-trip."),
+    last_event_id: Optional[str] = Header(None),
+    filters: TaskFilter = Depends(task_filters),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Streams every matching task in storage order (oldest first) with constant
+    memory. The cursor is the number of tasks already received: NDJSON clients
+    resume with `?cursor=<lines received>`, and SSE events carry it as their id,
+    so reconnecting with `Last-Event-ID` continues where the stream stopped.
+    """
+    store = async_task_store.store
+    if output_format == "sse" and last_event_id is not None and last_event_id.isdigit():
+        cursor = int(last_event_id)
+
+    def ndjson_lines() -> Iterator[str]:
+        for task in store.iter_tasks(batch_size=batch_size, filters=filters, start=cursor):
+            yield task.model_dump_json() + "\n"
+
+    def sse_events() -> Iterator[str]:
+        position = cursor
+        for task in store.iter_tasks(batch_size=batch_size, filters=filters, start=cursor):
+            position += 1
+            yield f"id: {position}\nevent: task\ndata: {task.model_dump_json()}\n\n"
+        yield f"id: {position}\nevent: end\ndata: {{\"cursor\": {position}}}\n\n"
+
+    # The generators are synchronous, so Starlette runs them in a worker thread.
+    if output_format == "sse":
+        return StreamingResponse(sse_events(), media_type="text/event-stream")
+    return StreamingResponse(
+        ndjson_lines(), media_type="application/x-ndjson", headers={"X-Export-Cursor": str(cursor)}
+    )
+
+@app.get("/tasks/stats", response_model=TaskStats)
+async def task_stats(
+    due_soon_days: float = Query(7, gt=0, le=365, description="Open tasks due within this many days count as due soon."),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Counts tasks by category, priority and completion state, plus the open
+    tasks that are overdue, due soon, or have no due date. The Chroma store
+    keeps these counts up to date on every write, so this does not scan tasks.
+    """
+    return await async_task_store.task_stats(due_soon_days=due_soon_days)
+
+@app.get("/tasks/search", response_model=List[TaskSearchResponse])
+async def search_tasks(
+    q: List[str] = Query(..., description="Search query. Repeat the parameter to run several searches at once."),
+    k: int = Query(5, ge=1, le=100, description="Number of results per query."),
+    filters: TaskFilter = Depends(task_filters),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Semantic search over stored tasks. Tasks are ranked by vector similarity to
+    each query, restricted by the same metadata filters as `GET /tasks`. Multiple
+    `q` parameters are embedded and searched in a single round-trip.
+    """
+    results = await async_task_store.search_tasks_batch(q, k=k, filters=filters)
+    return [TaskSearchResponse(query=query, results=matches) for query, matches in zip(q, results)]
+
+@app.post("/tasks/batch", response_model=BatchCreateTaskResponse)
+async def create_tasks_batch(
+    request: BatchCreateTaskRequest,
+    task_agent: TaskManagerAgent = Depends(get_task_agent),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Accepts many natural language queries, extracts tasks from them concurrently,
+    and saves all successfully created tasks to the vector store in one bulk write.
+    Each query gets its own success or error result. If the bulk write fails,
+    each task is written on its own, so that only the tasks that could not be
+    saved are reported as failed (with the extracted task).
+    """
+    outcomes = await task_agent.create_tasks_from_texts(request.queries, request.max_concurrency)
+    created_tasks = [outcome for outcome in outcomes if isinstance(outcome, Task)]
+
+    write_errors: Dict[str, str] = {}
+    try:
+        await async_task_store.add_tasks(created_tasks)
+    except Exception as e:
+        logger.warning("Bulk write of %d tasks failed, writing them one by one: %s", len(created_tasks), e)
+        # Writes are upserts, so tasks the failed bulk write already saved are just written again.
+        for task in created_tasks:
+            try:
+                await async_task_store.add_tasks([task])
+            except Exception as task_error:
+                write_errors[task.id] = f"Could not save the task: {task_error}"
+
+    results: List[BatchTaskResult] = []
+    for query, outcome in zip(request.queries, outcomes):
+        if not isinstance(outcome, Task):
+            results.append(BatchTaskResult(query=query, success=False, error=str(outcome)))
+        elif outcome.id in write_errors:
+            results.append(BatchTaskResult(query=query, success=False, task=outcome, error=write_errors[outcome.id]))
+        else:
+            results.append(BatchTaskResult(query=query, success=True, task=outcome))
+    created = sum(result.success for result in results)
+    return BatchCreateTaskResponse(created=created, failed=len(results) - created, results=results)
+
+@app.post("/tasks/extract", response_model=ExtractTasksResponse)
+async def extract_tasks(
+    request: CreateTaskRequest,
+    task_agent: TaskManagerAgent = Depends(get_task_agent),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Extracts every task described in one natural language query (e.g. "email
+    Bob, book flights for Friday, and renew gym membership") with a single LLM
+    call, and saves them to the vector store in one bulk write. Items that fail
+    validation are dropped and listed in `rejected`.
+    """
+    try:
+        extraction = await task_agent.aextract_tasks_from_text(request.query)
+    except LLMUnavailableError as e:
+        raise llm_unavailable(e)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Failed to process tasks: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+    if not extraction.tasks:
+        raise HTTPException(status_code=400, detail=f"No valid tasks found in query. Rejected: {extraction.rejected}")
+
+    try:
+        await async_task_store.add_tasks(extraction.tasks)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+    return ExtractTasksResponse(
+        query=request.query,
+        created=len(extraction.tasks),
+        tasks=extraction.tasks,
+        rejected=extraction.rejected,
+    )
+
+@app.post("/tasks/duplicates", response_model=List[DuplicateCheckResult])
+async def check_duplicates(
+    request: DuplicateCheckRequest,
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Bulk-checks candidate titles against the stored tasks. Exact matches use the
+    in-memory dedup index; near duplicates are found by embedding similarity.
+    """
+    store = async_task_store.store
+    exists = await async_task_store.run(store.titles_exist, request.titles)
+    near_duplicates = [[] for _ in request.titles]
+    if request.include_near_duplicates:
+        near_duplicates = await async_task_store.run(
+            store.find_near_duplicates, request.titles, get_settings().storage.dedup.near_duplicate_threshold
+        )
+    return [
+        DuplicateCheckResult(
+            title=title,
+            exists=exists[title],
+            near_duplicates=[NearDuplicate(task=task, similarity=similarity) for task, similarity in matches],
+        )
+        for title, matches in zip(request.titles, near_duplicates)
+    ]
+
+@app.patch("/tasks/{task_id}", response_model=Task)
+async def update_task(
+    task_id: str,
+    update: TaskUpdate,
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """
+    Partially updates a task. Only the fields present in the body change; the
+    task is only re-embedded if its title or description changed.
+    """
+    task = await async_task_store.update_task(task_id, update)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
+    return task
+
+@app.patch("/tasks", response_model=CompleteTasksResponse)
+async def complete_tasks(
+    request: CompleteTasksRequest,
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """Marks many tasks as completed (or not completed) in a single write."""
+    updated = await async_task_store.complete_tasks(request.ids, request.is_completed)
+    updated_ids = set(updated)
+    return CompleteTasksResponse(
+        updated=updated,
+        missing=[task_id for task_id in request.ids if task_id not in updated_ids],
+    )
+
+@app.delete("/tasks/{task_id}", status_code=204)
+async def delete_task(
+    task_id: str,
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """Deletes a task."""
+    if not await async_task_store.delete_tasks([task_id]):
+        raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
+    return Response(status_code=204)
+
+@app.delete("/tasks", response_model=DeleteTasksResponse)
+async def delete_tasks(
+    ids: List[str] = Query(..., alias="id", description="Task id to delete. Repeat the parameter to delete several."),
+    async_task_store: AsyncTaskStore = Depends(get_async_task_store),
+):
+    """Deletes many tasks in a single write."""
+    deleted = await async_task_store.delete_tasks(ids)
+    deleted_ids = set(deleted)
+    return DeleteTasksResponse(deleted=deleted, missing=[task_id for task_id in ids if task_id not in deleted_ids])
+
+@app.get("/agent/stats", response_model=AgentStatsResponse)
+async def agent_stats(task_agent: TaskManagerAgent = Depends(get_task_agent)):
+    """
+    Reports how often the rule-based fast path and the extraction cache
+    avoided an LLM call since the server started.
+    """
+    fast_path = task_agent.fast_path_stats
+    cache_stats = task_agent.cache.stats if task_agent.cache is not None else None
+    return AgentStatsResponse(
+        fast_path=FastPathStatsResponse(hits=fast_path.hits, misses=fast_path.misses, hit_rate=fast_path.hit_rate),
+        cache=ExtractionCacheStatsResponse(
+            exact_hits=cache_stats.exact_hits,
+            semantic_hits=cache_stats.semantic_hits,
+            misses=cache_stats.misses,
+            evictions=cache_stats.evictions,
+            hit_rate=cache_stats.hit_rate,
+        ) if cache_stats is not None else None,
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Exposes stage latencies, store operation timings, LLM token counts, parse
+    failures and cache counters in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/store/stats", response_model=StoreStatsResponse)
+async def store_stats(async_task_store: AsyncTaskStore = Depends(get_async_task_store)):
     """
-    Retrieves and lists all tasks currently in the vector store.
+    Reports how often task reads were served from the in-process read cache
+    instead of the database since the server started.
     """
-    return task_store.list_tasks()
\ No newline at end of file
+    store = async_task_store.store
+    if not isinstance(store, CachingTaskStore):
+        return StoreStatsResponse()
+    stats = store.stats
+    return StoreStatsResponse(
+        read_cache=ReadCacheStatsResponse(
+            task_hits=stats.task_hits,
+            task_misses=stats.task_misses,
+            list_hits=stats.list_hits,
+            list_misses=stats.list_misses,
+            invalidations=stats.invalidations,
+            hit_rate=stats.hit_rate,
+        )
+    )
@@ -1,8 +1,10 @@
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
+from typing import Dict, List, Literal, Optional
 
 # --- Helper function to find the project root ---
 def get_project_root() -> Path:
@@ -12,9 +14,115 @@ def get_project_root() -> Path:
 # --- Main Settings Class ---
 class LLMSettings(BaseSettings):
     """Configuration for the Large Language Model."""
+    provider: Literal["google", "fake"] = "google"
     model_name: str = "gemini-1.0-pro"
     temperature: float = 0.7
 
+class RetrySettings(BaseSettings):
+    """Configuration for retrying failed LLM calls on the same model."""
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+
+class CircuitBreakerSettings(BaseSettings):
+    """Configuration for the per-model circuit breaker."""
+    failure_threshold: int = 5
+    reset_seconds: float = 30.0
+
+class LLMGatewaySettings(BaseSettings):
+    """Configuration for the resilient gateway in front of the LLM."""
+    enabled: bool = True
+    fallback_models: List[str] = []
+    timeout_seconds: Optional[float] = 30.0
+    deadline_seconds: Optional[float] = 60.0
+    max_concurrency: int = 8
+    requests_per_second: Optional[float] = None
+    burst: int = 5
+    retry: RetrySettings = RetrySettings()
+    circuit_breaker: CircuitBreakerSettings = CircuitBreakerSettings()
+
+class ExtractionCacheSettings(BaseSettings):
+    """Configuration for the cache in front of LLM task extraction."""
+    enabled: bool = True
+    ttl_seconds: int = 86400
+    max_entries: int = 1000
+    semantic_enabled: bool = True
+    similarity_threshold: float = 0.95
+    collection_name: str = "extraction_cache"
+
+class FastPathSettings(BaseSettings):
+    """Configuration for the rule-based parser that bypasses the LLM."""
+    enabled: bool = True
+    min_confidence: float = 0.8
+    max_words: int = 12
+
+class AgentSettings(BaseSettings):
+    """Configuration for the task-extraction agent."""
+    batch_max_concurrency: int = 8
+    stream_llm_output: bool = True
+    prompt_style: Literal["verbose", "compact"] = "verbose"
+    json_mode: bool = False
+    cache: ExtractionCacheSettings = ExtractionCacheSettings()
+    fast_path: FastPathSettings = FastPathSettings()
+
+class DedupSettings(BaseSettings):
+    """Configuration for duplicate task detection."""
+    near_duplicate_enabled: bool = False
+    near_duplicate_threshold: float = 0.9
+
+class ReadCacheSettings(BaseSettings):
+    """Configuration for the in-process cache in front of task store reads."""
+    enabled: bool = True
+    max_entries: int = 1024
+    max_listed_tasks: int = 10000
+
+class TaskStatsSettings(BaseSettings):
+    """Configuration for saving the ChromaDB task stats counters."""
+    save_every_writes: int = 1000
+    save_interval_seconds: float = 30.0
+
+class EmbeddingSettings(BaseSettings):
+    """Configuration for the embedding backend used by the task store."""
+    backend: Literal["default", "sentence_transformers", "hashing"] = "default"
+    model_name: str = "all-MiniLM-L6-v2"
+    device: Optional[str] = None
+    batch_size: int = 64
+    dimensions: int = 384
+    cache_size: int = 10000
+
+class LoggingSettings(BaseSettings):
+    """Configuration for application logging. The root level is `Settings.log_level`."""
+    format: Literal["json", "text"] = "json"
+    levels: Dict[str, str] = {}
+    queue_size: int = 10000
+    payload_sample_rate: float = Field(1.0, ge=0.0, le=1.0)
+
+class StorageSettings(BaseSettings):
+    """Configuration for the task storage layer."""
+    backend: Literal["chroma", "sqlite"] = "chroma"
+    chroma_path: str = "./chroma_db"
+    sqlite_path: str = "./tasks.db"
+    io_workers: int = 8
+    dedup: DedupSettings = DedupSettings()
+    read_cache: ReadCacheSettings = ReadCacheSettings()
+    stats: TaskStatsSettings = TaskStatsSettings()
+    embedding: EmbeddingSettings = EmbeddingSettings()
+
+class JobSettings(BaseSettings):
+    """Configuration for the background task-creation job queue."""
+    path: str = "./jobs.db"
+    workers: int = 4
+    poll_interval_seconds: float = 1.0
+    lease_seconds: float = 300.0
+    max_attempts: int = 3
+    retry_delay_seconds: float = 30.0
+    max_wait_seconds: float = 30.0
+    retention_seconds: float = 604800.0
+
+class CLISettings(BaseSettings):
+    """Configuration for the command-line interface."""
+    page_size: int = 20
+
 class Settings(BaseSettings):
     """
     Main settings class to hold all configuration.
@@ -27,7 +135,13 @@ class Settings(BaseSettings):
     
     app_name: str = "AI Task Manager Agent"
     log_level: str = "INFO"
+    logging: LoggingSettings = LoggingSettings()
     llm: LLMSettings = LLMSettings()
+    llm_gateway: LLMGatewaySettings = LLMGatewaySettings()
+    agent: AgentSettings = AgentSettings()
+    storage: StorageSettings = StorageSettings()
+    jobs: JobSettings = JobSettings()
+    cli: CLISettings = CLISettings()
 
 
 def load_yaml_config(settings: Settings) -> dict:
@@ -70,5 +184,11 @@ def create_settings() -> Settings:
     return Settings.model_validate(final_data)
 
 
-# --- Singleton instance ---
-settings = create_settings()
\ No newline at end of file
+# --- Lazily created singleton ---
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the application settings, loading `.env` and the YAML file on the
+    first call only. Nothing is read at import time.
+    """
+    return create_settings()
@@ -1,25 +1,152 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import random
 import sys
-from src.core.config import settings
+import uuid
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 
-def setup_logging():
+from src.core.config import get_settings
+
+# Correlation id of the request (or CLI command) being handled. Context variables
+# follow asyncio tasks and `asyncio.to_thread`, so every log record emitted while
+# serving a request carries its id.
+_correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+# Fraction of verbose payloads (e.g. raw LLM output) that are logged. Set by `setup_logging`.
+_payload_sample_rate = 1.0
+
+# The listener draining the log queue, kept so `setup_logging` can be called again.
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Attributes every LogRecord has; anything else was passed with `extra=` and is logged as a field.
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "correlation_id"}
+
+
+def get_correlation_id() -> Optional[str]:
+    return _correlation_id.get()
+
+
+def set_correlation_id(correlation_id: Optional[str] = None) -> Token:
+    """Sets the correlation id for the current context, generating one if none is given."""
+    return _correlation_id.set(correlation_id or uuid.uuid4().hex)
+
+
+def reset_correlation_id(token: Token) -> None:
+    _correlation_id.reset(token)
+
+
+def should_log_payload() -> bool:
+    """Decides whether a verbose payload is logged, according to the configured sample rate."""
+    return _payload_sample_rate >= 1.0 or random.random() < _payload_sample_rate
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Stamps records with the current correlation id. Must run in the emitting thread."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = _correlation_id.get() or "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single-line JSON object, including any `extra=` fields."""
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        correlation_id = getattr(record, "correlation_id", "-")
+        if correlation_id != "-":
+            entry["correlation_id"] = correlation_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to a `QueueListener` thread instead of writing them, so
+    logging never blocks the caller on console or file I/O. When the queue is
+    full, records are dropped (and counted) rather than stalling the caller.
+    """
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the base class, keep the record unformatted so the listener's
+        # formatter still sees the `extra=` fields; only resolve what may not
+        # survive the thread hop (message arguments and tracebacks).
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging() -> logging.handlers.QueueListener:
     """
     Configures the root logger for the application.
 
-    This setup directs logs to the console with a specific format and sets
-    the logging level based on the configuration in settings.yaml.
+    Records are put on an in-memory queue and written to stdout by a background
+    `QueueListener`, as JSON lines (or plain text, see `logging.format` in
+    settings.yaml). The root level comes from `log_level`, and
+    `logging.levels` overrides it for individual loggers.
 
-    In a real production app, this could be extended to log to files,
-    services like Datadog, or other monitoring tools.
+    Calling it again replaces the previous configuration.
     """
-    # Use the log level from our central settings
-    log_level = settings.log_level.upper()
-    
-    # Create a basic configuration
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stdout  # Log to standard out
-    )
-    
-    
\ No newline at end of file
+    global _listener, _payload_sample_rate
+    settings = get_settings()
+    logging_settings = settings.logging
+
+    _stop_listener()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if logging_settings.format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] %(message)s")
+        )
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=logging_settings.queue_size))
+    queue_handler.addFilter(CorrelationIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.log_level.upper())
+    for logger_name, level in logging_settings.levels.items():
+        logging.getLogger(logger_name).setLevel(level.upper())
+    _payload_sample_rate = logging_settings.payload_sample_rate
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flushes the records still queued and stops the listener thread, e.g. when the process exits."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
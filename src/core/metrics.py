@@ -0,0 +1,264 @@
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Latency buckets in seconds, from sub-millisecond store reads to slow LLM calls.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# A sample as produced by collectors: metric name suffix, labels and value.
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class for metrics with optional labels. Children are cached per label set."""
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: str) -> Any:
+        """Returns the child for a label set. Keep the result to avoid the lookup on hot paths."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"Metric '{self.name}' has labels; use .labels(...)")
+        return self.labels()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def samples(self) -> Iterator[Sample]:
+        for key, child in list(self._children.items()):
+            yield from child.samples(dict(zip(self.labelnames, key)))
+
+
+class _CounterChild:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def samples(self, labels: Dict[str, str]) -> Iterator[Sample]:
+        yield "_total", labels, self._value
+
+
+class Counter(_Metric):
+    """A monotonically increasing count. Exposed with a `_total` suffix."""
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def time(self) -> "_Timer":
+        """Context manager observing the duration of its block."""
+        return _Timer(self)
+
+    def samples(self, labels: Dict[str, str]) -> Iterator[Sample]:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative = 0
+        for bound, count in zip(self._buckets + (float("inf"),), counts):
+            cumulative += count
+            yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+        yield "_sum", labels, total
+        yield "_count", labels, cumulative
+
+
+class _Timer:
+    # A plain class rather than @contextmanager: cheaper to enter on hot paths.
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: _HistogramChild):
+        self._histogram = histogram
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._histogram.observe(time.perf_counter() - self._started)
+
+
+class Histogram(_Metric):
+    """Counts observations (usually durations in seconds) into cumulative buckets."""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self) -> _Timer:
+        return self._default().time()
+
+
+class MetricsRegistry:
+    """
+    Holds the application's metrics and renders them in the Prometheus text
+    exposition format. Collectors are callbacks run at scrape time, for values
+    that are already counted elsewhere (e.g. cache statistics).
+    """
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: Dict[str, Tuple[str, str, Callable[[], Iterable[Sample]]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            self._metrics.append(metric)
+
+    def register_collector(
+        self, name: str, type_name: str, documentation: str, collect: Callable[[], Iterable[Sample]]
+    ) -> None:
+        """Registers (or replaces) a scrape-time callback producing samples for metric `name`."""
+        with self._lock:
+            self._collectors[name] = (type_name, documentation, collect)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = dict(self._collectors)
+        for metric in metrics:
+            self._render_family(lines, metric.name, metric.type_name, metric.documentation, metric.samples())
+        for name, (type_name, documentation, collect) in collectors.items():
+            self._render_family(lines, name, type_name, documentation, collect())
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_family(
+        lines: List[str], name: str, type_name: str, documentation: str, samples: Iterable[Sample]
+    ) -> None:
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {type_name}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+
+
+# --- Default registry and application metrics ---
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    metric = Counter(name, documentation, labelnames)
+    REGISTRY.register(metric)
+    return metric
+
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Histogram:
+    metric = Histogram(name, documentation, labelnames)
+    REGISTRY.register(metric)
+    return metric
+
+
+AGENT_STAGE_SECONDS = histogram(
+    "agent_stage_duration_seconds", "Time spent in each stage of task extraction.", ["stage"]
+)
+AGENT_RESOLUTIONS = counter(
+    "agent_resolutions", "Extracted tasks by where the result came from.", ["source"]
+)
+AGENT_PARSE_FAILURES = counter(
+    "agent_parse_failures", "LLM responses that could not be turned into a task.", ["stage"]
+)
+LLM_TOKENS = counter("llm_tokens", "Tokens reported in LLM response metadata.", ["type"])
+LLM_CALLS = counter("llm_calls", "LLM call attempts made by the gateway, by model and outcome.", ["model", "outcome"])
+STORE_OPERATION_SECONDS = histogram(
+    "store_operation_duration_seconds", "Time spent in each task store operation.", ["backend", "operation"]
+)
+JOBS_PROCESSED = counter("jobs_processed", "Background task-creation jobs by outcome.", ["outcome"])
+HTTP_REQUEST_SECONDS = histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ["method", "route", "status"]
+)
+
+
+def timed(metric: Histogram, **labels: str) -> Callable[[F], F]:
+    """
+    Decorator recording each call's duration in `metric`. The labelled child is
+    resolved once, so a call only costs two clock reads and one bucket update.
+    """
+    child = metric.labels(**labels)
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - started)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def record_token_usage(message: Any) -> None:
+    """Counts input and output tokens from a chat model response's `usage_metadata`, if present."""
+    usage: Optional[Dict[str, Any]] = getattr(message, "usage_metadata", None)
+    if not usage:
+        return
+    for token_type in ("input_tokens", "output_tokens"):
+        count = usage.get(token_type)
+        if count:
+            LLM_TOKENS.labels(type=token_type.removesuffix("_tokens")).inc(count)
@@ -1,17 +1,24 @@
 import os
-from langchain_google_genai import ChatGoogleGenerativeAI
-from src.core.config import settings
+from functools import lru_cache
 
-def get_llm_client() -> ChatGoogleGenerativeAI:
-    """
-    Initializes and returns the LangChain client for the Google Gemini model.
+from typing import Optional
 
-    This function configures the client using settings from our centralized
-    configuration system, including the model name and the API key.
+from langchain_core.language_models import BaseChatModel
+
+from src.core.config import get_settings
+from src.llm.fake import FakeChatModel
+from src.llm.gateway import LLMGateway, ModelRoute
+from src.llm.resilience import CircuitBreaker, RetryPolicy, TokenBucket
+
+def _build_chat_model(model_name: str, timeout: Optional[float]) -> BaseChatModel:
+    """Creates the chat model for one model name, for the configured provider."""
+    settings = get_settings()
+
+    if settings.llm.provider == "fake":
+        return FakeChatModel(model=model_name)
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
-    Returns:
-        An instance of ChatGoogleGenerativeAI configured and ready to use.
-    """
     # LangChain's Google provider automatically looks for the GOOGLE_API_KEY
     # environment variable. Our config system ensures it's loaded.
     # We will also pass our other configurations.
@@ -22,25 +29,68 @@ def get_llm_client() -> ChatGoogleGenerativeAI:
     if "GOOGLE_API_KEY" not in os.environ:
         os.environ["GOOGLE_API_KEY"] = settings.google_api_key
 
-    llm = ChatGoogleGenerativeAI(
-        model=settings.llm.model_name,
+    return ChatGoogleGenerativeAI(
+        model=model_name,
         temperature=settings.llm.temperature,
+        timeout=timeout,
+        # Retries are left to the gateway, which also knows when to fail over.
+        max_retries=0 if settings.llm_gateway.enabled else 6,
     )
-    
-    return llm
 
-# --- Singleton instance ---
-# Create one instance of the client to be reused across the application.
-# This avoids re-initializing the client on every call, which is inefficient.
-llm_client = get_llm_client()
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> BaseChatModel:
+    """
+    Initializes and returns the LangChain client for the Google Gemini model.
+
+    This function configures the client using settings from our centralized
+    configuration system, including the model name and the API key.
+
+    Unless disabled with `llm_gateway.enabled`, the model is wrapped in an
+    `LLMGateway` that retries, rate-limits and bounds calls, and fails over to
+    `llm_gateway.fallback_models` when the primary model is unavailable.
+
+    The client is created on the first call and reused afterwards. The Google
+    provider package is only imported here, since it is slow to import and
+    most entry points (tests, scripts) never need it.
+
+    Returns:
+        A chat model configured and ready to use.
+    """
+    settings = get_settings()
+    gateway = settings.llm_gateway
+
+    if not gateway.enabled:
+        return _build_chat_model(settings.llm.model_name, gateway.timeout_seconds)
+
+    routes = []
+    for model_name in [settings.llm.model_name, *gateway.fallback_models]:
+        rate_limiter = None
+        if gateway.requests_per_second:
+            rate_limiter = TokenBucket(gateway.requests_per_second, gateway.burst)
+        routes.append(ModelRoute(
+            _build_chat_model(model_name, gateway.timeout_seconds),
+            name=model_name,
+            rate_limiter=rate_limiter,
+            breaker=CircuitBreaker(gateway.circuit_breaker.failure_threshold, gateway.circuit_breaker.reset_seconds),
+        ))
+
+    return LLMGateway(
+        routes=routes,
+        retry=RetryPolicy(**gateway.retry.model_dump()),
+        timeout_seconds=gateway.timeout_seconds,
+        deadline_seconds=gateway.deadline_seconds,
+        max_concurrency=gateway.max_concurrency,
+    )
 
 # You can test this file directly to see if the client initializes correctly.
 # Run `python -m src.llm.client` from the root directory.
 # If it runs without error, your API key and setup are correct.
 if __name__ == "__main__":
+    llm_client = get_llm_client()
     print("LLM client initialized successfully!")
     print(f"Model: {llm_client.model}")
-    print(f"Temperature: {llm_client.temperature}")
+    print(f"Type: {llm_client._llm_type}")
     
     # Example invocation:
     # from langchain_core.messages import HumanMessage
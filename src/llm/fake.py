@@ -0,0 +1,123 @@
+import asyncio
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.ai import UsageMetadata
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, PrivateAttr
+
+DEFAULT_RESPONSE = '{"title": "Review the quarterly report", "category": "Work", "priority": "Medium"}'
+
+# Word-sized stream chunks, keeping the whitespace that follows each word.
+_CHUNK = re.compile(r"\S+\s*|\s+")
+
+
+class FakeLLMError(RuntimeError):
+    """An error as a provider SDK would raise it, carrying the HTTP status."""
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    An offline chat model for tests, benchmarks and local runs without an API key
+    (`llm.provider: fake`). It answers with `responses` in turn, after
+    `latency_seconds`, and fails its first `failures` calls with `failure_status`
+    (e.g. 429 or 503), so retries, timeouts and fallbacks can be exercised.
+    Responses carry token usage metadata and are streamed word by word.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model: str = "fake-llm"
+    responses: List[str] = [DEFAULT_RESPONSE]
+    latency_seconds: float = 0.0
+    failures: int = 0
+    failure_status: int = 503
+
+    _calls: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-llm"
+
+    @property
+    def calls(self) -> int:
+        """Number of calls made so far, failed ones included."""
+        return self._calls
+
+    def _next_response(self) -> str:
+        with self._lock:
+            call = self._calls
+            self._calls += 1
+        if call < self.failures:
+            raise FakeLLMError(f"{self.model} is unavailable (call {call + 1})", self.failure_status)
+        return self.responses[(call - self.failures) % len(self.responses)]
+
+    @staticmethod
+    def _usage(messages: List[BaseMessage], text: str) -> UsageMetadata:
+        # Roughly four characters per token, as for typical tokenizers.
+        input_tokens = sum(len(str(message.content)) for message in messages) // 4
+        output_tokens = len(text) // 4
+        return UsageMetadata(input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        text = self._next_response()
+        message = AIMessage(content=text, usage_metadata=self._usage(messages, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        text = self._next_response()
+        message = AIMessage(content=text, usage_metadata=self._usage(messages, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        text = self._next_response()
+        for index, piece in enumerate(_CHUNK.findall(text)):
+            # Usage is reported once, on the first chunk, so that merged chunks add up.
+            usage = self._usage(messages, text) if index == 0 else None
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece, usage_metadata=usage))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        text = self._next_response()
+        for index, piece in enumerate(_CHUNK.findall(text)):
+            usage = self._usage(messages, text) if index == 0 else None
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece, usage_metadata=usage))
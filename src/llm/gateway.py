@@ -0,0 +1,338 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, PrivateAttr
+
+from src.core.metrics import LLM_CALLS
+from src.llm.resilience import CircuitBreaker, Deadline, LLMUnavailableError, RetryPolicy, TokenBucket, is_retryable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ModelRoute:
+    """A model the gateway can send calls to, with its own rate limit and circuit breaker."""
+    def __init__(
+        self,
+        model: BaseChatModel,
+        name: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.model = model
+        self.name = name or getattr(model, "model", None) or type(model).__name__
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker or CircuitBreaker()
+
+
+class LLMGateway(BaseChatModel):
+    """
+    A chat model that fronts one or more real models and makes calls to them
+    resilient. For each call it:
+
+    - waits for a slot under `max_concurrency`, shared by sync and async callers;
+    - tries each route in order (the primary model, then the fallbacks),
+      skipping routes whose circuit breaker is open;
+    - per route, waits for the route's rate limiter, then retries retryable
+      errors (rate limits, timeouts, 5xx) with exponential backoff;
+    - bounds each attempt by `timeout_seconds` and the whole call, retries and
+      fallbacks included, by `deadline_seconds`.
+
+    Non-retryable errors (e.g. an invalid request) are raised as they are. When
+    every route has failed, `LLMUnavailableError` is raised.
+
+    Streams are retried and failed over until their first chunk arrives; after
+    that, chunks are passed through and the deadline is checked between them.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    routes: List[ModelRoute]
+    retry: RetryPolicy = RetryPolicy()
+    timeout_seconds: Optional[float] = 30.0
+    deadline_seconds: Optional[float] = 60.0
+    max_concurrency: int = 8
+
+    _slots: threading.BoundedSemaphore = PrivateAttr()
+    _executor: ThreadPoolExecutor = PrivateAttr()
+    _async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        if not self.routes:
+            raise ValueError("LLMGateway needs at least one model route")
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        # Sync calls run here so that a per-attempt timeout can be enforced.
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="llm-call")
+        self._async_slots = weakref.WeakKeyDictionary()
+
+    @property
+    def _llm_type(self) -> str:
+        return "llm-gateway"
+
+    @property
+    def model(self) -> str:
+        """Name of the primary model, e.g. for prompt fingerprints."""
+        return self.routes[0].name
+
+    # --- Sync calls ---
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        deadline = Deadline(self.deadline_seconds)
+        with self._slot(deadline):
+            message = self._call(lambda model: model.invoke(messages, stop=stop, **kwargs), deadline)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        deadline = Deadline(self.deadline_seconds)
+        with self._slot(deadline):
+            stream, first = self._call(lambda model: _open_stream(model.stream(messages, stop=stop, **kwargs)), deadline)
+            try:
+                chunk: Optional[BaseMessage] = first
+                while chunk is not None:
+                    generation = ChatGenerationChunk(message=_as_chunk(chunk))
+                    if run_manager:
+                        run_manager.on_llm_new_token(generation.text, chunk=generation)
+                    yield generation
+                    if deadline.expired:
+                        raise LLMUnavailableError("LLM stream exceeded its deadline")
+                    chunk = next(stream, None)
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+
+    def _slot(self, deadline: Deadline) -> "_SlotContext":
+        return _SlotContext(self._slots, deadline)
+
+    def _call(self, invoke: Callable[[BaseChatModel], T], deadline: Deadline) -> T:
+        errors: List[str] = []
+        for route in self.routes:
+            if not route.breaker.allow():
+                LLM_CALLS.labels(model=route.name, outcome="circuit_open").inc()
+                errors.append(f"{route.name}: circuit open")
+                continue
+            settled = False
+            try:
+                for attempt in range(self.retry.max_attempts):
+                    if route.rate_limiter is not None:
+                        try:
+                            route.rate_limiter.acquire(timeout=deadline.remaining())
+                        except TimeoutError as e:
+                            errors.append(f"{route.name}: {e}")
+                            break
+                    try:
+                        result = self._run_with_timeout(invoke, route.model, deadline)
+                    except Exception as e:
+                        settled = True
+                        if not self._on_failure(route, e, attempt, errors) or deadline.expired:
+                            break
+                        time.sleep(self._backoff(attempt, deadline))
+                        continue
+                    settled = True
+                    self._on_success(route)
+                    return result
+            finally:
+                if not settled:
+                    # Cancelled, or never called: a half-open trial must not hold the circuit forever.
+                    route.breaker.release()
+            if deadline.expired:
+                break
+        raise self._unavailable(errors)
+
+    def _run_with_timeout(self, invoke: Callable[[BaseChatModel], T], model: BaseChatModel, deadline: Deadline) -> T:
+        timeout = deadline.cap(self.timeout_seconds)
+        if timeout is None:
+            return invoke(model)
+        # Keep the caller's context (e.g. the log correlation id) on the worker thread.
+        future = self._executor.submit(contextvars.copy_context().run, invoke, model)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # The abandoned call finishes in the background; the client's own timeout bounds it.
+            future.cancel()
+            raise TimeoutError(f"LLM call timed out after {timeout:.1f}s")
+
+    # --- Async calls ---
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        deadline = Deadline(self.deadline_seconds)
+        async with self._async_slot(deadline):
+            message = await self._acall(lambda model: model.ainvoke(messages, stop=stop, **kwargs), deadline)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        deadline = Deadline(self.deadline_seconds)
+        async with self._async_slot(deadline):
+            stream, first = await self._acall(
+                lambda model: _aopen_stream(model.astream(messages, stop=stop, **kwargs)), deadline
+            )
+            try:
+                chunk: Optional[BaseMessage] = first
+                while chunk is not None:
+                    generation = ChatGenerationChunk(message=_as_chunk(chunk))
+                    if run_manager:
+                        await run_manager.on_llm_new_token(generation.text, chunk=generation)
+                    yield generation
+                    try:
+                        chunk = await asyncio.wait_for(anext(stream, None), timeout=deadline.remaining())
+                    except asyncio.TimeoutError:
+                        raise LLMUnavailableError("LLM stream exceeded its deadline")
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+    def _async_slot(self, deadline: Deadline) -> "_AsyncSlotContext":
+        # asyncio primitives belong to one event loop, so each loop gets its own semaphore.
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_slots.get(loop)
+        if semaphore is None:
+            semaphore = self._async_slots.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+        return _AsyncSlotContext(semaphore, deadline)
+
+    async def _acall(self, invoke: Callable[[BaseChatModel], Awaitable[T]], deadline: Deadline) -> T:
+        errors: List[str] = []
+        for route in self.routes:
+            if not route.breaker.allow():
+                LLM_CALLS.labels(model=route.name, outcome="circuit_open").inc()
+                errors.append(f"{route.name}: circuit open")
+                continue
+            settled = False
+            try:
+                for attempt in range(self.retry.max_attempts):
+                    if route.rate_limiter is not None:
+                        try:
+                            await route.rate_limiter.aacquire(timeout=deadline.remaining())
+                        except TimeoutError as e:
+                            errors.append(f"{route.name}: {e}")
+                            break
+                    try:
+                        result = await asyncio.wait_for(invoke(route.model), timeout=deadline.cap(self.timeout_seconds))
+                    except Exception as e:
+                        settled = True
+                        if not self._on_failure(route, e, attempt, errors) or deadline.expired:
+                            break
+                        await asyncio.sleep(self._backoff(attempt, deadline))
+                        continue
+                    settled = True
+                    self._on_success(route)
+                    return result
+            finally:
+                if not settled:
+                    # Cancelled, or never called: a half-open trial must not hold the circuit forever.
+                    route.breaker.release()
+            if deadline.expired:
+                break
+        raise self._unavailable(errors)
+
+    # --- Shared bookkeeping ---
+    def _on_success(self, route: ModelRoute) -> None:
+        route.breaker.record_success()
+        outcome = "success" if route is self.routes[0] else "fallback_success"
+        LLM_CALLS.labels(model=route.name, outcome=outcome).inc()
+
+    def _on_failure(self, route: ModelRoute, error: Exception, attempt: int, errors: List[str]) -> bool:
+        """
+        Records a failed attempt. Returns True if the same route should be
+        retried, False to move on to the next route. Non-retryable errors are re-raised.
+        """
+        if not is_retryable(error):
+            # The model answered, so it is healthy; the request itself is at fault.
+            route.breaker.record_success()
+            LLM_CALLS.labels(model=route.name, outcome="error").inc()
+            raise error
+        route.breaker.record_failure()
+        LLM_CALLS.labels(model=route.name, outcome="retryable_error").inc()
+        errors.append(f"{route.name}: {error}")
+        logger.warning("LLM call to %s failed (attempt %d): %s", route.name, attempt + 1, error)
+        return attempt + 1 < self.retry.max_attempts and route.breaker.state == CircuitBreaker.CLOSED
+
+    def _backoff(self, attempt: int, deadline: Deadline) -> float:
+        delay = self.retry.backoff(attempt)
+        remaining = deadline.remaining()
+        return delay if remaining is None else min(delay, remaining)
+
+    def _unavailable(self, errors: List[str]) -> LLMUnavailableError:
+        retry_after = min((route.breaker.retry_after() for route in self.routes), default=None)
+        return LLMUnavailableError(
+            "No LLM could serve the request: " + "; ".join(errors or ["deadline exceeded"]),
+            retry_after=retry_after or None,
+        )
+
+
+class _SlotContext:
+    """Holds one of the gateway's concurrency slots, waiting at most until the deadline."""
+    def __init__(self, semaphore: threading.BoundedSemaphore, deadline: Deadline):
+        self._semaphore = semaphore
+        self._deadline = deadline
+
+    def __enter__(self) -> None:
+        if not self._semaphore.acquire(timeout=self._deadline.remaining()):
+            raise LLMUnavailableError("Timed out waiting for a free LLM call slot")
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+class _AsyncSlotContext:
+    def __init__(self, semaphore: asyncio.Semaphore, deadline: Deadline):
+        self._semaphore = semaphore
+        self._deadline = deadline
+
+    async def __aenter__(self) -> None:
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self._deadline.remaining())
+        except asyncio.TimeoutError:
+            raise LLMUnavailableError("Timed out waiting for a free LLM call slot")
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+def _as_chunk(message: BaseMessage) -> AIMessageChunk:
+    if isinstance(message, AIMessageChunk):
+        return message
+    return AIMessageChunk(content=message.content, usage_metadata=getattr(message, "usage_metadata", None))
+
+
+def _open_stream(stream: Iterator[BaseMessage]) -> Tuple[Iterator[BaseMessage], Optional[BaseMessage]]:
+    """Starts a stream and waits for its first chunk, so that connection errors surface inside the retry loop."""
+    iterator = iter(stream)
+    return iterator, next(iterator, None)
+
+
+async def _aopen_stream(stream: AsyncIterator[BaseMessage]) -> Tuple[AsyncIterator[BaseMessage], Optional[BaseMessage]]:
+    return stream, await anext(stream, None)
@@ -0,0 +1,175 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# HTTP statuses worth retrying: timeouts, rate limits and transient server errors.
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class LLMUnavailableError(RuntimeError):
+    """
+    Raised when no model could serve a call: every model failed, timed out or
+    has its circuit open. `retry_after` hints when a circuit will let calls through again.
+    """
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Whether another attempt at the same call may succeed. Looks at the error
+    and its causes, since provider SDK errors are often wrapped.
+    """
+    current: Optional[BaseException] = error
+    while current is not None:
+        # LangChain's ModelError subclasses declare this themselves.
+        retryable = getattr(current, "is_retryable", None)
+        if isinstance(retryable, bool) and retryable:
+            return True
+        if isinstance(current, (TimeoutError, ConnectionError)):
+            return True
+        status = getattr(current, "status_code", None) or getattr(current, "code", None)
+        if isinstance(status, int) and status in RETRYABLE_STATUS_CODES:
+            return True
+        current = current.__cause__
+    return False
+
+
+class Deadline:
+    """A point in time after which a call must give up. `None` means no deadline."""
+    def __init__(self, seconds: Optional[float], clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._expires_at = clock() + seconds if seconds is not None else None
+
+    def remaining(self) -> Optional[float]:
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def cap(self, timeout: Optional[float]) -> Optional[float]:
+        """The smaller of `timeout` and the time left, treating None as unbounded."""
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        return timeout if remaining is None else min(timeout, remaining)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` requests per second on average, with
+    bursts of up to `capacity`. Callers reserve a token and sleep until it is
+    due, so waiting callers are served in order without polling.
+    """
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, timeout: Optional[float]) -> float:
+        """Takes a token and returns how long to wait before using it. Raises TimeoutError if that exceeds `timeout`."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if timeout is not None and wait > timeout:
+                raise TimeoutError(f"Rate limit: next request slot is {wait:.2f}s away")
+            self._tokens -= 1
+            return wait
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        wait = self._reserve(timeout)
+        if wait:
+            time.sleep(wait)
+
+    async def aacquire(self, timeout: Optional[float] = None) -> None:
+        wait = self._reserve(timeout)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Stops sending calls to a model after `failure_threshold` consecutive
+    failures. After `reset_seconds` a single trial call is let through
+    (half-open); its success closes the circuit, its failure re-opens it. A
+    trial that ends without either (e.g. it was cancelled) must be given back
+    with `release`, or the circuit would stay half-open.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial call through (0 if it already would)."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may be made now. In the half-open state only one trial call is allowed."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_seconds:
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def release(self) -> None:
+        """Gives back a half-open trial that recorded no outcome, so the next call can make the trial."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter between attempts on the same model."""
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (0-based), with 'equal jitter' to spread out retries."""
+        delay = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
@@ -1,70 +1,180 @@
+import argparse
 import logging
-from typing import List
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, List, NoReturn, Optional, Tuple
 from rich import print as rprint
+from rich.console import Console, Group
+from rich.live import Live
+from rich.spinner import Spinner
 from rich.table import Table
-from rich.console import Console
 
 # --- Core Application Imports ---
-from src.agent.main_agent import task_agent
-from src.storage.vector_store import task_store
-from src.models.task import Task
-from src.core.logging_config import setup_logging
+from src.agent.main_agent import get_task_agent
+from src.storage.vector_store import get_task_store
+from src.models.task import Task, TaskCategory, TaskFilter, TaskPriority
+from src.core.config import get_settings
+from src.core.logging_config import set_correlation_id, setup_logging
 
-setup_logging()
 logger = logging.getLogger(__name__)
 console = Console() 
 
 
-def display_tasks(tasks: List[Task]):
-    """Renders a list of tasks in a beautiful table using Rich."""
-    table = Table(title="🧾 Current Tasks")
-
-    table.add_column("ID", style="dim", width=4)
-    table.add_column("Title", style="cyan", no_wrap=True)
-    table.add_column("Priority", style="magenta")
-    table.add_column("Category", style="green")
-    table.add_column("Due Date", style="yellow")
-    
-    
-    sorted_tasks = sorted(tasks, key=lambda t: t.created_at)
-
-    for i, task in enumerate(sorted_tasks, 1):
-        status_icon = "✅" if task.is_completed else ""
-        due_date_str = task.due_date.strftime("%Y-%m-%d") if task.due_date else ""
-        table.add_row(
-            str(i),
-            f"{status_icon} {task.title}",
-            task.priority,
-            task.category,
-            due_date_str
-        )
-    
-    rprint(table)
+class TaskView:
+    """
+    The CLI's in-memory copy of the task list, oldest first. It is loaded once
+    and then updated with each task the CLI creates, so commands never re-read
+    the whole store. Only one page (newest tasks first) is rendered at a time.
+    """
+    def __init__(self, tasks: Optional[List[Task]] = None, page_size: int = 20):
+        self._tasks: List[Task] = tasks if tasks is not None else []
+        self.page_size = page_size
+
+    @classmethod
+    def from_store(cls, tasks_newest_first: List[Task], page_size: int = 20) -> "TaskView":
+        """Builds the view from a store listing, reversing the list in place rather than copying it."""
+        tasks_newest_first.reverse()
+        return cls(tasks_newest_first, page_size)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, task: Task) -> None:
+        self._tasks.append(task)
+
+    def page(self, number: int = 1, filters: Optional[TaskFilter] = None) -> Tuple[List[Tuple[int, Task]], int]:
+        """
+        Returns the tasks on a page, newest first, each with its position in
+        creation order, along with the number of matching tasks.
+        """
+        matching: Iterable[Tuple[int, Task]] = zip(range(len(self._tasks), 0, -1), reversed(self._tasks))
+        if filters is not None and filters.model_fields_set:
+            matching = [(position, task) for position, task in matching if _matches(task, filters)]
+            total = len(matching)
+        else:
+            total = len(self._tasks)
+        start = (number - 1) * self.page_size
+        return list(islice(matching, start, start + self.page_size)), total
+
+    def render(self, number: int = 1, filters: Optional[TaskFilter] = None) -> Table:
+        """Builds the table for one page. Pages past the end show the last page."""
+        rows, total = self.page(number, filters)
+        pages = max(1, -(-total // self.page_size))
+        if number > pages:
+            number = pages
+            rows, _ = self.page(number, filters)
+        table = Table(title=f"🧾 Current Tasks (page {number}/{pages}, {total} tasks)")
+
+        table.add_column("ID", style="dim", width=4)
+        table.add_column("Title", style="cyan", no_wrap=True)
+        table.add_column("Priority", style="magenta")
+        table.add_column("Category", style="green")
+        table.add_column("Due Date", style="yellow")
+
+        for position, task in rows:
+            status_icon = "✅" if task.is_completed else ""
+            due_date_str = task.due_date.strftime("%Y-%m-%d") if task.due_date else ""
+            table.add_row(
+                str(position),
+                f"{status_icon} {task.title}",
+                task.priority,
+                task.category,
+                due_date_str
+            )
+        return table
+
+
+def _matches(task: Task, filters: TaskFilter) -> bool:
+    return (
+        (filters.category is None or task.category == filters.category)
+        and (filters.priority is None or task.priority == filters.priority)
+        and (filters.is_completed is None or task.is_completed == filters.is_completed)
+    )
+
+
+class _ListArgumentParser(argparse.ArgumentParser):
+    def error(self, message: str) -> NoReturn:
+        raise ValueError(message)
+
+
+_list_parser = _ListArgumentParser(prog="list", add_help=False)
+_list_parser.add_argument("--page", type=int, default=1)
+_list_parser.add_argument("--category", choices=TaskCategory.__args__)
+_list_parser.add_argument("--priority", choices=TaskPriority.__args__)
+_status = _list_parser.add_mutually_exclusive_group()
+_status.add_argument("--done", dest="is_completed", action="store_const", const=True)
+_status.add_argument("--open", dest="is_completed", action="store_const", const=False)
+
+
+def parse_list_command(arguments: str) -> Tuple[int, TaskFilter]:
+    """
+    Parses the arguments of `list`, e.g. `--page 2 --category Work --open`.
+    Raises ValueError for invalid arguments.
+    """
+    args = _list_parser.parse_args(shlex.split(arguments))
+    if args.page < 1:
+        raise ValueError("--page must be at least 1")
+    filters = TaskFilter(**{
+        name: value for name, value in
+        (("category", args.category), ("priority", args.priority), ("is_completed", args.is_completed))
+        if value is not None
+    })
+    return args.page, filters
+
+
+def display_tasks(view: TaskView, page: int = 1, filters: Optional[TaskFilter] = None):
+    """Renders one page of tasks in a beautiful table using Rich."""
+    rprint(view.render(page, filters))
+
+
+def _load_tasks() -> List[Task]:
+    return get_task_store().list_tasks()
 
 
 def main_cli():
     """
     Main function to run the polished command-line interface.
     """
-    rprint("🧠 [bold green]Welcome to the AI Task Manager Agent![/bold green]")
-    rprint("Type 'list' to see tasks, 'exit' to quit, or enter a new one.")
+    setup_logging()
+    settings = get_settings()
+
+    # The store, the task list and the agent are loaded in the background while the banner shows.
+    # One worker, so that the store and the agent's cache do not open the database concurrently.
+    prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cli-prefetch")
+    initial_tasks = prefetch.submit(_load_tasks)
+    agent_ready = prefetch.submit(get_task_agent)
+    prefetch.shutdown(wait=False)
 
-    
-    initial_tasks = task_store.list_tasks()
-    if initial_tasks:
-        display_tasks(initial_tasks)
+    banner = Group(
+        "🧠 [bold green]Welcome to the AI Task Manager Agent![/bold green]",
+        "Type 'list [--page N] [--category C] [--priority P] [--done|--open]' to see tasks, 'exit' to quit, or enter a new one.",
+    )
+    with Live(Group(banner, Spinner("dots", " Loading tasks...")), console=console, transient=True):
+        view = TaskView.from_store(initial_tasks.result(), page_size=settings.cli.page_size)
+    rprint(Group(banner, view.render()) if len(view) else banner)
+
+    task_store = get_task_store()
 
     while True:
         try:
             user_input = console.input("> ")
+            # Log records emitted while handling this command share one correlation id.
+            set_correlation_id()
 
             if user_input.lower() in ['exit', 'quit']:
                 rprint("👋 [bold]Goodbye![/bold]")
                 break
             
-            if user_input.lower() == 'list':
-                all_tasks = task_store.list_tasks()
-                display_tasks(all_tasks)
+            command, _, arguments = user_input.strip().partition(" ")
+            # "list groceries for the party" is a task, not a command.
+            if command.lower() == 'list' and (not arguments or arguments.lstrip().startswith("--")):
+                try:
+                    page, filters = parse_list_command(arguments)
+                except ValueError as e:
+                    rprint(f"❌ [bold red]{e}[/bold red]")
+                    continue
+                display_tasks(view, page, filters)
                 continue
             
             if not user_input.strip():
@@ -72,21 +182,31 @@ def main_cli():
             
             # --- Main Agent Logic ---
             with console.status("[bold yellow]📨 Processing your query...[/bold yellow]", spinner="dots"):
-                created_task: Task = task_agent.create_task_from_text(user_input)
+                created_task: Task = agent_ready.result().create_task_from_text(user_input)
 
             # Check for duplicates using the database as the source of truth
             if task_store.task_exists_by_title(created_task.title):
                 rprint(f"⚠️  [bold yellow]Task '{created_task.title}' already exists — skipping duplicate.[/bold yellow]")
                 continue
+
+            dedup_settings = settings.storage.dedup
+            if dedup_settings.near_duplicate_enabled:
+                near_duplicates = task_store.find_near_duplicates(
+                    [created_task.title], threshold=dedup_settings.near_duplicate_threshold
+                )[0]
+                if near_duplicates:
+                    existing_task, similarity = near_duplicates[0]
+                    rprint(f"⚠️  [bold yellow]Task '{created_task.title}' looks like existing task '{existing_task.title}' ({similarity:.0%} similar) — skipping duplicate.[/bold yellow]")
+                    continue
             
             # If new, add it to the database
             task_store.add_task(created_task)
             
             rprint(f"✨ [bold green]Task '{created_task.title}' was successfully created and saved![/bold green]")
 
-            # Refresh the full list to show the new task
-            all_tasks = task_store.list_tasks()
-            display_tasks(all_tasks)
+            # Update the local view instead of re-reading the store
+            view.add(created_task)
+            display_tasks(view)
 
         except (ValueError, TypeError) as e:
             logger.error(f"Handled error: {e}", exc_info=True)
@@ -98,5 +218,7 @@ def main_cli():
             logger.exception(f"An unexpected error occurred: {e}")
             rprint(f"💥 [bold red]An unexpected system error occurred. See logs for details.[/bold red]")
 
+    task_store.flush()
+
 if __name__ == "__main__":
     main_cli()
\ No newline at end of file
@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from src.models.task import Task
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class Job(BaseModel):
+    """
+    A task-creation request that is processed in the background. `task` holds
+    the created task once the job has succeeded, `error` the reason it failed.
+    """
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique identifier for the job")
+    query: str = Field(..., description="The natural language query to create a task from")
+    status: JobStatus = Field(default="queued", description="Where the job is in its lifecycle")
+    priority: int = Field(default=0, description="Jobs with a higher priority are run first")
+    attempts: int = Field(default=0, description="How many times a worker has picked the job up")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="When the job was submitted")
+    started_at: Optional[datetime] = Field(None, description="When a worker last picked the job up")
+    finished_at: Optional[datetime] = Field(None, description="When the job succeeded or failed")
+    task: Optional[Task] = Field(None, description="The created task, once the job has succeeded")
+    error: Optional[str] = Field(None, description="Why the job failed")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
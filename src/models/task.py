@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from pydantic import BaseModel, Field, ConfigDict
 
 # These type aliases remain the same
@@ -20,6 +20,13 @@ class LLMTaskSchema(BaseModel):
     due_date: Optional[datetime] = Field(None, description="The due date for the task")
 
 
+class LLMTaskListSchema(BaseModel):
+    """
+    The schema the LLM fills in when a single query may describe several tasks.
+    """
+    tasks: List[LLMTaskSchema] = Field(..., description="One entry per distinct task in the query")
+
+
 class Task(BaseModel):
     """
     Represents a full, structured task within our application.
@@ -50,4 +57,62 @@ class Task(BaseModel):
     category: TaskCategory = Field(default="Other", description="The category of the task")
     priority: TaskPriority = Field(default="Medium", description="The priority level of the task")
     description: Optional[str] = Field(None, description="A more detailed description of the task")
-    due_date: Optional[datetime] = Field(None, description="The due date for the task")
\ No newline at end of file
+    due_date: Optional[datetime] = Field(None, description="The due date for the task")
+
+
+class TaskUpdate(BaseModel):
+    """
+    A partial update to a task. Only the fields that are explicitly set are
+    changed; setting `description` or `due_date` to null clears it.
+    """
+    title: Optional[str] = Field(None, min_length=1, description="The new title of the task")
+    category: Optional[TaskCategory] = None
+    priority: Optional[TaskPriority] = None
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    is_completed: Optional[bool] = None
+
+    def changes(self) -> Dict[str, Any]:
+        """Returns the explicitly set fields. Null is only kept for fields that may be cleared."""
+        return {
+            field: value
+            for field, value in self.model_dump(exclude_unset=True).items()
+            if value is not None or field in ("description", "due_date")
+        }
+
+
+class TaskFilter(BaseModel):
+    """
+    Server-side filters for listing tasks. Every field that is set must match;
+    date ranges are inclusive.
+    """
+    category: Optional[TaskCategory] = None
+    priority: Optional[TaskPriority] = None
+    is_completed: Optional[bool] = None
+    due_after: Optional[datetime] = None
+    due_before: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class TaskSearchResult(BaseModel):
+    """A task returned by a semantic search, with its relevance score."""
+    task: Task
+    score: float = Field(..., description="Cosine similarity between the query and the task, higher is better")
+
+
+class TaskStats(BaseModel):
+    """
+    Aggregate counts over every stored task. Overdue and due-soon counts only
+    include open tasks, relative to `as_of`.
+    """
+    total: int = Field(..., description="Number of stored tasks")
+    completed: int = Field(..., description="Number of completed tasks")
+    open: int = Field(..., description="Number of tasks that are not completed")
+    by_category: Dict[str, int] = Field(..., description="Number of tasks in each category")
+    by_priority: Dict[str, int] = Field(..., description="Number of tasks at each priority")
+    overdue: int = Field(..., description="Open tasks whose due date has passed")
+    due_soon: int = Field(..., description="Open tasks due within the next `due_soon_days` days")
+    no_due_date: int = Field(..., description="Open tasks without a due date")
+    due_soon_days: float = Field(..., description="The window used for `due_soon`")
+    as_of: datetime = Field(..., description="The time the overdue and due-soon counts are relative to")
@@ -0,0 +1,90 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from src.models.task import Task, TaskFilter, TaskSearchResult, TaskStats, TaskUpdate
+from src.storage.base_store import BaseTaskStore
+
+T = TypeVar("T")
+
+
+class AsyncTaskStore:
+    """
+    Async facade over a synchronous `BaseTaskStore`.
+
+    Every call is offloaded to a bounded thread pool, so blocking storage I/O
+    (e.g. ChromaDB reads and writes) never stalls the event loop, and the number
+    of concurrent storage calls is capped at `max_workers`.
+    """
+    def __init__(self, store: BaseTaskStore, max_workers: int = 8):
+        self._store = store
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-store-io")
+
+    @property
+    def store(self) -> BaseTaskStore:
+        """The wrapped synchronous store."""
+        return self._store
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs any blocking callable on the store's thread pool, in a copy of the
+        caller's context so that log records keep the request's correlation id.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, partial(context.run, func, *args, **kwargs))
+
+    async def add_task(self, task: Task) -> None:
+        await self.run(self._store.add_task, task)
+
+    async def add_tasks(self, tasks: List[Task], chunk_size: int = 500) -> int:
+        return await self.run(self._store.add_tasks, tasks, chunk_size=chunk_size)
+
+    async def update_task(self, task_id: str, update: TaskUpdate) -> Optional[Task]:
+        return await self.run(self._store.update_task, task_id, update)
+
+    async def complete_tasks(self, task_ids: List[str], completed: bool = True) -> List[str]:
+        return await self.run(self._store.complete_tasks, task_ids, completed)
+
+    async def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        return await self.run(self._store.delete_tasks, task_ids)
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        return await self.run(self._store.get_task, task_id)
+
+    async def list_tasks(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> List[Task]:
+        return await self.run(self._store.list_tasks, limit=limit, offset=offset, filters=filters)
+
+    async def list_tasks_json(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> bytes:
+        return await self.run(self._store.list_tasks_json, limit=limit, offset=offset, filters=filters)
+
+    async def project_tasks(
+        self,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self.run(self._store.project_tasks, fields, limit=limit, offset=offset, filters=filters)
+
+    async def task_stats(self, now: Optional[datetime] = None, due_soon_days: float = 7) -> TaskStats:
+        return await self.run(self._store.task_stats, now, due_soon_days)
+
+    async def titles_exist(self, titles: List[str]) -> Dict[str, bool]:
+        return await self.run(self._store.titles_exist, titles)
+
+    async def search_tasks_batch(
+        self, queries: List[str], k: int = 5, filters: Optional[TaskFilter] = None
+    ) -> List[List[TaskSearchResult]]:
+        return await self.run(self._store.search_tasks_batch, queries, k=k, filters=filters)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker threads once pending calls have finished."""
+        self._executor.shutdown(wait=wait)
@@ -1,6 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import List
-from src.models.task import Task
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import TypeAdapter
+
+from src.models.task import Task, TaskFilter, TaskSearchResult, TaskStats, TaskUpdate
+from src.storage.task_stats import TaskStatsIndex
+
+# Serializes task lists straight to JSON bytes, without building intermediate dicts.
+_TASK_LIST_JSON = TypeAdapter(List[Task])
+
+# Encodes dates exactly as `Task` JSON does (e.g. "Z" rather than "+00:00" for UTC).
+_DATETIME_JSON = TypeAdapter(datetime)
+
+def json_dates(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-encodes the ISO 8601 dates of a projected record the way `Task` JSON encodes them."""
+    for field in ("created_at", "due_date"):
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = _DATETIME_JSON.dump_python(datetime.fromisoformat(value), mode="json")
+    return record
+
+def validate_fields(fields: List[str]) -> None:
+    """Raises a ValueError if any of the fields is not a `Task` field."""
+    unknown = [field for field in fields if field not in Task.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown task fields: {', '.join(unknown)}")
 
 class BaseTaskStore(ABC):
     """Abstract base class for a task storage system."""
@@ -10,12 +35,186 @@ class BaseTaskStore(ABC):
         """Adds a new task to the store."""
         pass
 
+    def add_tasks(
+        self,
+        tasks: Iterable[Task],
+        chunk_size: int = 500,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Adds or replaces several tasks in the store.
+
+        The default implementation adds the tasks one at a time; backends that
+        support bulk writes should override it and write `chunk_size` tasks per call.
+
+        Args:
+            tasks: The tasks to write. Any iterable works, so large imports can be streamed.
+            chunk_size: Number of tasks written per bulk write.
+            on_progress: Called with the number of tasks written after each chunk.
+
+        Returns:
+            The number of tasks written.
+        """
+        written = 0
+        for task in tasks:
+            self.add_task(task)
+            written += 1
+            if on_progress is not None and written % chunk_size == 0:
+                on_progress(chunk_size)
+        if on_progress is not None and written % chunk_size:
+            on_progress(written % chunk_size)
+        return written
+
+    @abstractmethod
+    def update_tasks(self, updates: Dict[str, TaskUpdate]) -> Dict[str, Task]:
+        """
+        Applies partial updates to several tasks in one write.
+
+        Args:
+            updates: The update to apply, keyed by task id.
+
+        Returns:
+            The updated tasks, keyed by id. Ids that do not exist are left out.
+        """
+        pass
+
+    def update_task(self, task_id: str, update: TaskUpdate) -> Task | None:
+        """Applies a partial update to one task and returns it, or None if it does not exist."""
+        return self.update_tasks({task_id: update}).get(task_id)
+
+    def complete_tasks(self, task_ids: List[str], completed: bool = True) -> List[str]:
+        """
+        Marks several tasks as completed (or not completed).
+
+        Returns:
+            The ids of the tasks that exist and were updated.
+        """
+        update = TaskUpdate(is_completed=completed)
+        return list(self.update_tasks({task_id: update for task_id in task_ids}))
+
+    @abstractmethod
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        """
+        Deletes several tasks in one write.
+
+        Returns:
+            The ids of the tasks that existed and were deleted.
+        """
+        pass
+
+    def delete_task(self, task_id: str) -> bool:
+        """Deletes one task. Returns False if it did not exist."""
+        return bool(self.delete_tasks([task_id]))
+
     @abstractmethod
     def get_task(self, task_id: str) -> Task | None:
         """Retrieves a task by its ID."""
         pass
 
     @abstractmethod
-    def list_tasks(self) -> List[Task]:
-        """Lists all tasks in the store."""
-        pass
\ No newline at end of file
+    def list_tasks(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> List[Task]:
+        """
+        Lists tasks in the store, newest first.
+
+        Args:
+            limit: Maximum number of tasks to return. None returns every match.
+            offset: Number of matching tasks to skip, for pagination.
+            filters: Optional server-side filters.
+        """
+        pass
+
+    @abstractmethod
+    def iter_tasks(
+        self, batch_size: int = 500, filters: Optional[TaskFilter] = None, start: int = 0
+    ) -> Iterator[Task]:
+        """
+        Lazily iterates over matching tasks in storage order (oldest first),
+        fetching `batch_size` tasks at a time so memory use stays constant.
+
+        Storage order is stable while tasks are being added, so `start` (the
+        number of matching tasks already consumed) works as a resume cursor.
+        """
+        pass
+
+    def list_tasks_json(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> bytes:
+        """
+        Lists tasks like `list_tasks`, encoded as a JSON array.
+
+        The default implementation encodes the listed tasks in one pass; backends
+        that can reuse encoded tasks should override it.
+        """
+        return _TASK_LIST_JSON.dump_json(self.list_tasks(limit=limit, offset=offset, filters=filters))
+
+    def project_tasks(
+        self,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lists tasks like `list_tasks`, but returns only the requested fields as
+        JSON-compatible dicts.
+
+        The default implementation projects fully loaded tasks; backends that can
+        skip building `Task` objects should override it.
+        """
+        validate_fields(fields)
+        return [
+            task.model_dump(mode="json", include=set(fields))
+            for task in self.list_tasks(limit=limit, offset=offset, filters=filters)
+        ]
+
+    def task_stats(self, now: Optional[datetime] = None, due_soon_days: float = 7) -> TaskStats:
+        """
+        Counts tasks by category, priority and completion state, and counts the
+        open tasks that are overdue or due within `due_soon_days` of `now`.
+
+        The default implementation scans every task; backends that keep
+        aggregates up to date should override it.
+        """
+        index = TaskStatsIndex()
+        index.warm(self.iter_tasks())
+        return index.snapshot(now, due_soon_days)
+
+    def flush(self) -> None:
+        """
+        Saves anything the store keeps in memory, e.g. before the process exits.
+        The default implementation keeps nothing.
+        """
+
+    @abstractmethod
+    def task_exists_by_title(self, title: str) -> bool:
+        """Checks if a task with the same title already exists."""
+        pass
+
+    def titles_exist(self, titles: List[str]) -> Dict[str, bool]:
+        """
+        Checks many candidate titles at once, keyed by the titles as given.
+
+        The default implementation checks the titles one at a time; backends
+        with a dedicated index should override it.
+        """
+        return {title: self.task_exists_by_title(title) for title in titles}
+
+    def search_tasks(
+        self, query: str, k: int = 5, filters: Optional[TaskFilter] = None
+    ) -> List[TaskSearchResult]:
+        """Returns the `k` tasks most similar to the query, best match first."""
+        return self.search_tasks_batch([query], k=k, filters=filters)[0]
+
+    @abstractmethod
+    def search_tasks_batch(
+        self, queries: List[str], k: int = 5, filters: Optional[TaskFilter] = None
+    ) -> List[List[TaskSearchResult]]:
+        """
+        Runs several semantic searches in one call.
+
+        Returns:
+            One ranked result list per query, in input order.
+        """
+        pass
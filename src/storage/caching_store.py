@@ -0,0 +1,319 @@
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from src.models.task import Task, TaskFilter, TaskSearchResult, TaskStats, TaskUpdate
+from src.storage.base_store import BaseTaskStore
+
+_TASK_JSON = TypeAdapter(Task)
+
+
+@dataclass
+class ReadCacheStats:
+    """Hit/miss counters for a `CachingTaskStore`."""
+    task_hits: int = 0
+    task_misses: int = 0
+    list_hits: int = 0
+    list_misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.task_hits + self.list_hits
+
+    @property
+    def misses(self) -> int:
+        return self.task_misses + self.list_misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingTaskStore(BaseTaskStore):
+    """
+    Read-through cache in front of another `BaseTaskStore`.
+
+    It keeps an id-keyed LRU of validated `Task` objects for `get_task`, and a
+    snapshot of every task sorted newest first for unfiltered `list_tasks` calls.
+    Only a full listing loads the snapshot, and only if the store holds at most
+    `max_listed_tasks` tasks; until then, pages are cut by the wrapped store.
+    Snapshot tasks are JSON-encoded once, when first listed by `list_tasks_json`,
+    so JSON listings are joined from pre-encoded tasks.
+    Writes go through to the wrapped store and then patch the cache in place, so
+    adding a task does not force the next listing to reload the whole store.
+    Filtered reads, iteration and search are always served by the wrapped store.
+
+    Every write bumps a version number; a read that raced with a write does not
+    populate the cache. The cache assumes this process is the only writer.
+    Returned tasks are shared with the cache and must not be mutated.
+
+    Backend-specific methods (e.g. `find_near_duplicates`) are forwarded to the
+    wrapped store.
+    """
+    def __init__(self, store: BaseTaskStore, max_entries: int = 1024, max_listed_tasks: int = 10000):
+        self._store = store
+        self._max_entries = max_entries
+        self._max_listed_tasks = max_listed_tasks
+        self._tasks: "OrderedDict[str, Task]" = OrderedDict()
+        self._snapshot: Optional[List[Task]] = None
+        self._snapshot_by_id: Dict[str, Task] = {}
+        # Encoded snapshot tasks by id, with the task object each was encoded from.
+        self._encoded: Dict[str, Tuple[Task, bytes]] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self.stats = ReadCacheStats()
+
+    @property
+    def store(self) -> BaseTaskStore:
+        """The wrapped store."""
+        return self._store
+
+    @property
+    def version(self) -> int:
+        """Incremented on every write."""
+        return self._version
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_store":
+            raise AttributeError(name)
+        return getattr(self._store, name)
+
+    # --- Reads ---
+    def get_task(self, task_id: str) -> Task | None:
+        with self._lock:
+            if task_id in self._tasks:
+                self._tasks.move_to_end(task_id)
+                self.stats.task_hits += 1
+                return self._tasks[task_id]
+            if self._snapshot is not None:
+                # Every task is in the snapshot, so a miss there means the task does not exist.
+                self.stats.task_hits += 1
+                return self._snapshot_by_id.get(task_id)
+            self.stats.task_misses += 1
+            version = self._version
+
+        task = self._store.get_task(task_id)
+        if task is not None:
+            with self._lock:
+                if version == self._version:
+                    self._remember(task)
+        return task
+
+    def list_tasks(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> List[Task]:
+        if _has_filters(filters):
+            return self._store.list_tasks(limit=limit, offset=offset, filters=filters)
+        snapshot = self._get_snapshot(load=limit is None)
+        if snapshot is None:
+            return self._store.list_tasks(limit=limit, offset=offset)
+        end = None if limit is None else offset + limit
+        return snapshot[offset:end]
+
+    def _get_snapshot(self, load: bool) -> Optional[List[Task]]:
+        """
+        Returns the snapshot. If there is none, it is loaded from the wrapped store
+        when `load` is set, and kept if it holds at most `max_listed_tasks` tasks;
+        otherwise None is returned.
+        """
+        with self._lock:
+            if self._snapshot is not None:
+                self.stats.list_hits += 1
+                return self._snapshot
+            self.stats.list_misses += 1
+            version = self._version
+        if not load:
+            return None
+
+        tasks = sorted(self._store.list_tasks(), key=_newest_first_key)
+        with self._lock:
+            if version == self._version and len(tasks) <= self._max_listed_tasks:
+                self._snapshot = tasks
+                self._snapshot_by_id = {task.id: task for task in tasks}
+        return tasks
+
+    def list_tasks_json(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> bytes:
+        if _has_filters(filters):
+            return self._store.list_tasks_json(limit=limit, offset=offset, filters=filters)
+        snapshot = self._get_snapshot(load=limit is None)
+        if snapshot is None:
+            return self._store.list_tasks_json(limit=limit, offset=offset)
+        end = None if limit is None else offset + limit
+        with self._lock:
+            page = snapshot[offset:end]
+            cached = [self._encoded.get(task.id) for task in page]
+
+        # Tasks are encoded outside the lock, and only kept if they are still in the
+        # snapshot (it may not have been kept, or a write may have replaced them).
+        encoded: List[bytes] = []
+        fresh: List[Tuple[Task, bytes]] = []
+        for task, entry in zip(page, cached):
+            if entry is not None and entry[0] is task:
+                encoded.append(entry[1])
+            else:
+                data = _TASK_JSON.dump_json(task)
+                encoded.append(data)
+                fresh.append((task, data))
+        if fresh:
+            with self._lock:
+                for task, data in fresh:
+                    if self._snapshot_by_id.get(task.id) is task:
+                        self._encoded[task.id] = (task, data)
+        return b"[" + b",".join(encoded) + b"]"
+
+    def project_tasks(
+        self,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Dict[str, Any]]:
+        # Projecting cached tasks only pays off once the snapshot exists;
+        # otherwise the wrapped store can project without building tasks.
+        if self._snapshot is None or _has_filters(filters):
+            return self._store.project_tasks(fields, limit=limit, offset=offset, filters=filters)
+        return super().project_tasks(fields, limit=limit, offset=offset)
+
+    def iter_tasks(
+        self, batch_size: int = 500, filters: Optional[TaskFilter] = None, start: int = 0
+    ) -> Iterator[Task]:
+        return self._store.iter_tasks(batch_size=batch_size, filters=filters, start=start)
+
+    def task_stats(self, now: Optional[datetime] = None, due_soon_days: float = 7) -> TaskStats:
+        return self._store.task_stats(now, due_soon_days)
+
+    def flush(self) -> None:
+        self._store.flush()
+
+    def task_exists_by_title(self, title: str) -> bool:
+        return self._store.task_exists_by_title(title)
+
+    def titles_exist(self, titles: List[str]) -> Dict[str, bool]:
+        return self._store.titles_exist(titles)
+
+    def search_tasks_batch(
+        self, queries: List[str], k: int = 5, filters: Optional[TaskFilter] = None
+    ) -> List[List[TaskSearchResult]]:
+        return self._store.search_tasks_batch(queries, k=k, filters=filters)
+
+    # --- Writes ---
+    def add_task(self, task: Task) -> None:
+        self._store.add_task(task)
+        with self._lock:
+            self._version += 1
+            self._apply_write(task.model_copy())
+
+    def add_tasks(
+        self,
+        tasks: Iterable[Task],
+        chunk_size: int = 500,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        written: List[Task] = []
+        overflow = False
+
+        def recorded(tasks: Iterable[Task]) -> Iterator[Task]:
+            # Remember small batches to patch the cache; large imports just drop it.
+            nonlocal overflow
+            for task in tasks:
+                if not overflow:
+                    written.append(task.model_copy())
+                    overflow = len(written) > self._max_entries
+                yield task
+
+        try:
+            count = self._store.add_tasks(recorded(tasks), chunk_size=chunk_size, on_progress=on_progress)
+        except BaseException:
+            self.invalidate()
+            raise
+        if overflow:
+            self.invalidate()
+        else:
+            with self._lock:
+                self._version += 1
+                for task in written:
+                    self._apply_write(task)
+        return count
+
+    def update_tasks(self, updates: Dict[str, TaskUpdate]) -> Dict[str, Task]:
+        updated = self._store.update_tasks(updates)
+        with self._lock:
+            self._version += 1
+            for task in updated.values():
+                self._apply_write(task.model_copy())
+        return updated
+
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        deleted = self._store.delete_tasks(task_ids)
+        with self._lock:
+            self._version += 1
+            for task_id in deleted:
+                self._tasks.pop(task_id, None)
+                self._remove_from_snapshot(task_id)
+        return deleted
+
+    def invalidate(self) -> None:
+        """Drops every cached task and the listing snapshot."""
+        with self._lock:
+            self._version += 1
+            self._tasks.clear()
+            self._snapshot = None
+            self._snapshot_by_id = {}
+            self._encoded = {}
+            self.stats.invalidations += 1
+
+    def _remember(self, task: Task) -> None:
+        """Adds a task to the LRU, evicting the least recently used one if full."""
+        self._tasks[task.id] = task
+        self._tasks.move_to_end(task.id)
+        while len(self._tasks) > self._max_entries:
+            self._tasks.popitem(last=False)
+
+    def _apply_write(self, task: Task) -> None:
+        """Replaces any cached copy of a written task. Must be called with the lock held."""
+        self._remember(task)
+        if self._snapshot is None:
+            return
+        self._remove_from_snapshot(task.id)
+        if len(self._snapshot) >= self._max_listed_tasks:
+            # Grown past its bound; pages go to the wrapped store again.
+            self._snapshot = None
+            self._snapshot_by_id = {}
+            self._encoded = {}
+            return
+        insort(self._snapshot, task, key=_newest_first_key)
+        self._snapshot_by_id[task.id] = task
+
+    def _remove_from_snapshot(self, task_id: str) -> None:
+        """Removes a task from the listing snapshot. Must be called with the lock held."""
+        if self._snapshot is None:
+            return
+        self._encoded.pop(task_id, None)
+        previous = self._snapshot_by_id.pop(task_id, None)
+        if previous is None:
+            return
+        position = bisect_left(self._snapshot, _newest_first_key(previous), key=_newest_first_key)
+        while self._snapshot[position] is not previous:
+            position += 1
+        del self._snapshot[position]
+
+
+def _has_filters(filters: Optional[TaskFilter]) -> bool:
+    return filters is not None and any(value is not None for value in filters.model_dump().values())
+
+
+def _newest_first_key(task: Task) -> float:
+    """Sort key placing the most recently created task first, treating naive times as UTC."""
+    created_at = task.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return -created_at.timestamp()
@@ -0,0 +1,56 @@
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List
+
+
+def normalize_title(title: str) -> str:
+    """Case-folds a title and collapses whitespace, so trivial variants collide."""
+    return " ".join(title.casefold().split()).strip(" .!?")
+
+
+class TitleDedupIndex:
+    """
+    In-memory hash index of normalized task titles.
+
+    It answers "does a task with this title exist?" in O(1) without touching the
+    database. The index is warmed once from a full scan of the store and then kept
+    in sync by the store's write methods. Titles are reference-counted so that
+    removing one of several tasks sharing a title keeps the title indexed.
+    """
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._warm = False
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warm
+
+    def warm(self, titles: Iterable[str]) -> None:
+        """Replaces the index contents with the given titles."""
+        counts = Counter(normalize_title(title) for title in titles)
+        with self._lock:
+            self._counts = counts
+            self._warm = True
+
+    def add(self, title: str) -> None:
+        with self._lock:
+            self._counts[normalize_title(title)] += 1
+
+    def discard(self, title: str) -> None:
+        key = normalize_title(title)
+        with self._lock:
+            if self._counts[key] <= 1:
+                self._counts.pop(key, None)
+            else:
+                self._counts[key] -= 1
+
+    def contains(self, title: str) -> bool:
+        return self._counts.get(normalize_title(title), 0) > 0
+
+    def contains_many(self, titles: List[str]) -> Dict[str, bool]:
+        """Checks many candidate titles at once, keyed by the titles as given."""
+        return {title: self.contains(title) for title in titles}
+
+    def __len__(self) -> int:
+        return len(self._counts)
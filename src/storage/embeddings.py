@@ -0,0 +1,208 @@
+import hashlib
+import re
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from src.core.config import EmbeddingSettings
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Hit/miss counters for a `CachedEmbedder`."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Embedder(ABC):
+    """
+    Abstract base class for the embedding backends used by the task store.
+
+    Embedders turn a batch of documents into a float32 matrix with one row per
+    document. The store always passes precomputed embeddings to ChromaDB, so the
+    backend is fully under our control rather than the collection's.
+    """
+    def __init__(self, batch_size: int = 64):
+        self.batch_size = batch_size
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        Identifies the backend and model. Embeddings from embedders with
+        different names are not comparable and must not share a collection.
+        """
+        pass
+
+    @abstractmethod
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embeds at most `batch_size` texts."""
+        pass
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embeds any number of texts, `batch_size` at a time."""
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        batches = [
+            np.asarray(self._embed_batch(texts[start:start + self.batch_size]), dtype=np.float32)
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        return batches[0] if len(batches) == 1 else np.vstack(batches)
+
+
+class ChromaDefaultEmbedder(Embedder):
+    """ChromaDB's bundled all-MiniLM-L6-v2 ONNX model. Needs no extra packages."""
+    def __init__(self, batch_size: int = 64):
+        super().__init__(batch_size)
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+        self._function = DefaultEmbeddingFunction()
+
+    @property
+    def name(self) -> str:
+        return "default"
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self._function(texts), dtype=np.float32)
+
+
+class SentenceTransformerEmbedder(Embedder):
+    """A local sentence-transformers model, run on CPU or GPU."""
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: int = 64, device: Optional[str] = None):
+        super().__init__(batch_size)
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "The 'sentence_transformers' embedding backend requires the sentence-transformers package."
+            ) from e
+        self._model_name = model_name
+        self._model = SentenceTransformer(model_name, device=device)
+
+    @property
+    def name(self) -> str:
+        return f"sentence_transformers:{self._model_name}"
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self._model.encode(
+            texts, batch_size=self.batch_size, convert_to_numpy=True, normalize_embeddings=True
+        )
+
+
+class HashingEmbedder(Embedder):
+    """
+    Signed feature hashing of word unigrams and bigrams into a fixed number of
+    dimensions. It has no model to load and is fully deterministic, which makes
+    it suitable for tests and offline environments, but it only captures word
+    overlap, not meaning.
+    """
+    def __init__(self, dimensions: int = 384, batch_size: int = 1024):
+        super().__init__(batch_size)
+        self._dimensions = dimensions
+
+    @property
+    def name(self) -> str:
+        return f"hashing:{self._dimensions}"
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        rows: List[int] = []
+        hashes: List[int] = []
+        for row, text in enumerate(texts):
+            tokens = _TOKEN_PATTERN.findall(text.casefold())
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            rows.extend([row] * len(features))
+            hashes.extend(zlib.crc32(feature.encode("utf-8")) for feature in features)
+
+        matrix = np.zeros((len(texts), self._dimensions), dtype=np.float32)
+        if hashes:
+            hashed = np.asarray(hashes, dtype=np.uint32)
+            # The low bits pick the column, the top bit the sign.
+            signs = np.where(hashed >> 31, -1.0, 1.0).astype(np.float32)
+            np.add.at(matrix, (np.asarray(rows), hashed % self._dimensions), signs)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+
+class CachedEmbedder(Embedder):
+    """
+    LRU cache in front of another embedder, keyed by a hash of the text. Only
+    the texts missing from the cache are sent to the wrapped embedder, in one
+    batched call.
+    """
+    def __init__(self, embedder: Embedder, max_entries: int = 10000):
+        super().__init__(embedder.batch_size)
+        self._embedder = embedder
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = EmbeddingCacheStats()
+
+    @property
+    def name(self) -> str:
+        return self._embedder.name
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self._embedder.embed(texts)
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        keys = [hashlib.sha1(text.encode("utf-8")).digest() for text in texts]
+        rows: List[Optional[np.ndarray]] = []
+        missing: "OrderedDict[bytes, str]" = OrderedDict()
+        with self._lock:
+            for key, text in zip(keys, texts):
+                row = self._entries.get(key)
+                if row is not None:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                elif key not in missing:
+                    missing[key] = text
+                    self.stats.misses += 1
+                rows.append(row)
+
+        if missing:
+            computed = dict(zip(missing, self._embedder.embed(list(missing.values()))))
+            with self._lock:
+                for key, row in computed.items():
+                    self._entries[key] = row
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            rows = [row if row is not None else computed[key] for key, row in zip(keys, rows)]
+        return np.vstack(rows)
+
+
+def create_embedder(settings: EmbeddingSettings) -> Embedder:
+    """
+    Builds the embedder described by `settings.storage.embedding`.
+
+    Args:
+        settings: The embedding settings section.
+
+    Returns:
+        The configured backend, wrapped in a `CachedEmbedder` if `cache_size` > 0.
+    """
+    embedder: Embedder
+    if settings.backend == "sentence_transformers":
+        embedder = SentenceTransformerEmbedder(settings.model_name, settings.batch_size, settings.device)
+    elif settings.backend == "hashing":
+        embedder = HashingEmbedder(settings.dimensions, settings.batch_size)
+    elif settings.backend == "default":
+        embedder = ChromaDefaultEmbedder(settings.batch_size)
+    else:
+        raise ValueError(f"Unknown embedding backend: {settings.backend}")
+    if settings.cache_size > 0:
+        embedder = CachedEmbedder(embedder, settings.cache_size)
+    return embedder
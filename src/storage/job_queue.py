@@ -0,0 +1,183 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.models.job import Job
+from src.models.task import Task
+from src.storage.dedup_index import normalize_title
+from src.storage.sqlite_base import SQLiteDatabaseMixin
+
+_JOB_COLUMNS = ["id", "query", "status", "priority", "attempts", "created_at", "started_at", "finished_at", "task", "error"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    query TEXT NOT NULL,
+    query_key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL,
+    task TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, priority DESC, seq);
+CREATE INDEX IF NOT EXISTS idx_jobs_finished_at ON jobs (finished_at);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_pending_query ON jobs (query_key) WHERE status IN ('queued', 'running');
+"""
+
+_SELECT = f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs"
+
+# Picks the next runnable job: the highest priority first, then the oldest. A
+# running job whose lease has expired was abandoned by a worker that died or
+# was restarted, so it is picked up again.
+_CLAIM = f"""
+UPDATE jobs
+SET status = 'running', attempts = attempts + 1, started_at = :now, lease_expires_at = :lease_expires_at
+WHERE seq = (
+    SELECT seq FROM jobs
+    WHERE (status = 'queued' AND available_at <= :now) OR (status = 'running' AND lease_expires_at <= :now)
+    ORDER BY priority DESC, seq
+    LIMIT 1
+)
+RETURNING {', '.join(_JOB_COLUMNS)}
+"""
+
+
+class SQLiteJobQueue(SQLiteDatabaseMixin):
+    """
+    Durable priority queue of task-creation jobs, stored in a SQLite database in
+    WAL mode so that queued jobs survive a restart.
+
+    Workers `claim` a job, which leases it for `lease_seconds`, and then either
+    `complete` or `fail` it. A job whose lease runs out (its worker crashed or
+    the process was killed) is handed out again, up to `max_attempts` times.
+
+    A query that is already queued or running is not queued twice: submitting
+    it again returns the pending job instead.
+    """
+    def __init__(self, path: str = ":memory:", lease_seconds: float = 300.0, max_attempts: int = 3):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._open_database(path, _SCHEMA)
+
+    # --- Producers ---
+    def enqueue(self, query: str, priority: int = 0) -> Tuple[Job, bool]:
+        """
+        Queues a job for `query`. Returns the job and whether it was newly
+        created; if the same query is already pending, that job is returned
+        instead, with its priority raised to `priority` if that is higher.
+        """
+        key = normalize_title(query)
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"{_SELECT} WHERE query_key = ? AND status IN ('queued', 'running')", (key,)
+            ).fetchone()
+            if row is not None:
+                job = _row_to_job(row)
+                if priority > job.priority:
+                    conn.execute("UPDATE jobs SET priority = ? WHERE id = ?", (priority, job.id))
+                    job.priority = priority
+                return job, False
+            job = Job(query=query, priority=priority)
+            conn.execute(
+                "INSERT INTO jobs (id, query, query_key, status, priority, created_at, available_at) "
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (job.id, query, key, priority, job.created_at.timestamp(), job.created_at.timestamp()),
+            )
+            return job, True
+
+    # --- Workers ---
+    def claim(self) -> Optional[Job]:
+        """Leases the next runnable job to the caller, or returns None if there is none."""
+        now = time.time()
+        with self._transaction() as conn:
+            # Jobs abandoned too often are presumed to crash their worker.
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, lease_expires_at = NULL, "
+                "error = 'Abandoned by its worker too many times' "
+                "WHERE status = 'running' AND lease_expires_at <= ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            row = conn.execute(_CLAIM, {"now": now, "lease_expires_at": now + self.lease_seconds}).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def complete(self, job_id: str, task: Task) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'succeeded', finished_at = ?, lease_expires_at = NULL, task = ?, error = NULL "
+                "WHERE id = ?",
+                (time.time(), task.model_dump_json(), job_id),
+            )
+
+    def fail(self, job_id: str, error: str, retry_after: Optional[float] = None) -> Job:
+        """
+        Records a failed attempt. With `retry_after`, the job is queued again
+        after that many seconds, unless it has used up its attempts.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "UPDATE jobs SET status = CASE WHEN ? AND attempts < ? THEN 'queued' ELSE 'failed' END, "
+                "available_at = ?, lease_expires_at = NULL, error = ?, "
+                "finished_at = CASE WHEN ? AND attempts < ? THEN NULL ELSE ? END "
+                f"WHERE id = ? RETURNING {', '.join(_JOB_COLUMNS)}",
+                (
+                    retry_after is not None, self.max_attempts, now + (retry_after or 0), error,
+                    retry_after is not None, self.max_attempts, now, job_id,
+                ),
+            ).fetchone()
+        return _row_to_job(row)
+
+    def release(self, job_ids: List[str]) -> None:
+        """Puts running jobs back in the queue without using up an attempt, e.g. on shutdown."""
+        if not job_ids:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE jobs SET status = 'queued', attempts = MAX(attempts - 1, 0), lease_expires_at = NULL "
+                "WHERE id = ? AND status = 'running'",
+                [(job_id,) for job_id in job_ids],
+            )
+
+    # --- Reads and housekeeping ---
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._read_lock(), self._connection() as conn:
+            row = conn.execute(f"{_SELECT} WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each status."""
+        with self._read_lock(), self._connection() as conn:
+            return dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def delete_finished(self, older_than_seconds: float) -> int:
+        """Deletes jobs that finished more than `older_than_seconds` ago. Returns how many were deleted."""
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE finished_at < ?", (time.time() - older_than_seconds,))
+            return cursor.rowcount
+
+
+def _datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+
+
+def _row_to_job(row: Tuple[Any, ...]) -> Job:
+    values = dict(zip(_JOB_COLUMNS, row))
+    return Job(
+        id=values["id"],
+        query=values["query"],
+        status=values["status"],
+        priority=values["priority"],
+        attempts=values["attempts"],
+        created_at=_datetime(values["created_at"]),
+        started_at=_datetime(values["started_at"]),
+        finished_at=_datetime(values["finished_at"]),
+        task=Task.model_validate_json(values["task"]) if values["task"] else None,
+        error=values["error"],
+    )
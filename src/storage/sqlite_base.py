@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterable, Iterator, List, Optional, Tuple
+
+
+class SQLiteDatabaseMixin:
+    """
+    Connection handling shared by the SQLite-backed stores, in WAL mode.
+
+    An in-memory database only exists on one connection, so all threads share
+    it under the write lock. File databases get a connection per thread, and
+    WAL lets readers proceed while a write is in progress. Writes go through
+    `_transaction`, which serializes them under the write lock.
+    """
+    _path: str
+    _local: threading.local
+    _write_lock: threading.Lock
+    _shared: Optional[sqlite3.Connection]
+
+    def _open_database(self, path: str, schema: str) -> None:
+        """Opens the database at `path` (or in memory) and creates `schema`. Call once from `__init__`."""
+        self._path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._shared = None
+        if path == ":memory:":
+            self._shared = self._open_connection()
+        with self._write_lock, self._connection() as conn:
+            conn.executescript(schema)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if self._shared is not None:
+            yield self._shared
+            return
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._open_connection()
+        yield conn
+
+    def _read_lock(self) -> ContextManager[Any]:
+        return self._write_lock if self._shared is not None else nullcontext()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock, self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple[Any, ...]]:
+        with self._read_lock(), self._connection() as conn:
+            return conn.execute(sql, tuple(params)).fetchall()
+
+    def close(self) -> None:
+        """Closes the calling thread's connection (or the shared in-memory one)."""
+        conn = self._shared or getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,387 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.metrics import STORE_OPERATION_SECONDS, timed
+from src.models.task import Task, TaskFilter, TaskSearchResult, TaskStats, TaskUpdate
+from src.storage.base_store import BaseTaskStore, json_dates, validate_fields
+from src.storage.dedup_index import normalize_title
+from src.storage.sqlite_base import SQLiteDatabaseMixin
+from src.storage.task_stats import TaskStatsIndex
+from src.storage.timeutil import timestamp
+
+# Columns holding `Task` fields, in the order they are read back.
+_TASK_COLUMNS = ["id", "title", "category", "priority", "description", "due_date", "created_at", "is_completed"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    category TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    description TEXT,
+    due_date TEXT,
+    due_date_ts REAL,
+    created_at TEXT NOT NULL,
+    created_at_ts REAL NOT NULL,
+    is_completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at_ts);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date_ts);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority, created_at_ts);
+CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category, created_at_ts);
+CREATE INDEX IF NOT EXISTS idx_tasks_title_key ON tasks (title_key);
+CREATE INDEX IF NOT EXISTS idx_tasks_open_due_date ON tasks (due_date_ts) WHERE is_completed = 0;
+
+-- Task counts per group, kept up to date by the triggers below in the same
+-- transaction as every write. Groups that become empty keep a zero count, so
+-- the table is only empty if no task was ever stored, and the backfill below
+-- only fills a table added to an existing database. Missing groups are inserted
+-- with WHERE NOT EXISTS, since an OR IGNORE inside a trigger would be overridden
+-- by the conflict clause of the upsert that fired it.
+CREATE TABLE IF NOT EXISTS task_counts (
+    category TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    is_completed INTEGER NOT NULL,
+    has_due_date INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (category, priority, is_completed, has_due_date)
+);
+INSERT INTO task_counts
+SELECT category, priority, is_completed, due_date_ts IS NOT NULL, COUNT(*) FROM tasks
+WHERE NOT EXISTS (SELECT 1 FROM task_counts)
+GROUP BY category, priority, is_completed, due_date_ts IS NOT NULL;
+CREATE TRIGGER IF NOT EXISTS task_counts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO task_counts SELECT new.category, new.priority, new.is_completed, new.due_date_ts IS NOT NULL, 0
+    WHERE NOT EXISTS (
+        SELECT 1 FROM task_counts
+        WHERE category = new.category AND priority = new.priority AND is_completed = new.is_completed
+          AND has_due_date = (new.due_date_ts IS NOT NULL)
+    );
+    UPDATE task_counts SET count = count + 1
+    WHERE category = new.category AND priority = new.priority AND is_completed = new.is_completed
+      AND has_due_date = (new.due_date_ts IS NOT NULL);
+END;
+CREATE TRIGGER IF NOT EXISTS task_counts_delete AFTER DELETE ON tasks BEGIN
+    UPDATE task_counts SET count = count - 1
+    WHERE category = old.category AND priority = old.priority AND is_completed = old.is_completed
+      AND has_due_date = (old.due_date_ts IS NOT NULL);
+END;
+CREATE TRIGGER IF NOT EXISTS task_counts_update AFTER UPDATE OF category, priority, is_completed, due_date_ts ON tasks BEGIN
+    UPDATE task_counts SET count = count - 1
+    WHERE category = old.category AND priority = old.priority AND is_completed = old.is_completed
+      AND has_due_date = (old.due_date_ts IS NOT NULL);
+    INSERT INTO task_counts SELECT new.category, new.priority, new.is_completed, new.due_date_ts IS NOT NULL, 0
+    WHERE NOT EXISTS (
+        SELECT 1 FROM task_counts
+        WHERE category = new.category AND priority = new.priority AND is_completed = new.is_completed
+          AND has_due_date = (new.due_date_ts IS NOT NULL)
+    );
+    UPDATE task_counts SET count = count + 1
+    WHERE category = new.category AND priority = new.priority AND is_completed = new.is_completed
+      AND has_due_date = (new.due_date_ts IS NOT NULL);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO tasks (id, title, title_key, category, priority, description, due_date, due_date_ts,
+                   created_at, created_at_ts, is_completed)
+VALUES (:id, :title, :title_key, :category, :priority, :description, :due_date, :due_date_ts,
+        :created_at, :created_at_ts, :is_completed)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title, title_key = excluded.title_key, category = excluded.category,
+    priority = excluded.priority, description = excluded.description, due_date = excluded.due_date,
+    due_date_ts = excluded.due_date_ts, created_at = excluded.created_at,
+    created_at_ts = excluded.created_at_ts, is_completed = excluded.is_completed
+"""
+
+# Aggregates behind `task_stats`: the non-empty groups of `task_counts`, and the
+# open tasks due before ?1 and up to ?2, counted from the partial due-date index.
+_STATS = """
+SELECT category, priority, is_completed, has_due_date, count,
+       (SELECT COUNT(*) FROM tasks INDEXED BY idx_tasks_open_due_date
+        WHERE is_completed = 0 AND due_date_ts < ?1),
+       (SELECT COUNT(*) FROM tasks INDEXED BY idx_tasks_open_due_date
+        WHERE is_completed = 0 AND due_date_ts >= ?1 AND due_date_ts <= ?2)
+FROM task_counts
+WHERE count > 0
+"""
+
+
+class SQLiteTaskStore(SQLiteDatabaseMixin, BaseTaskStore):
+    """
+    Task store backed by a SQLite database in WAL mode.
+
+    Every task field is a typed column, with indexes on the columns used for
+    sorting and filtering, so listings are index scans and reads skip parsing
+    metadata dicts. Exact duplicate checks use an index on the normalized title.
+
+    SQLite has no vector search, so semantic search and near-duplicate checks
+    are delegated to an optional `vector_index` (typically a `ChromaTaskStore`),
+    which every write is mirrored to.
+    """
+    def __init__(self, path: str = ":memory:", vector_index: Optional[BaseTaskStore] = None):
+        self._vector_index = vector_index
+        self._open_database(path, _SCHEMA)
+
+    @classmethod
+    def for_testing(cls, vector_index: Optional[BaseTaskStore] = None) -> "SQLiteTaskStore":
+        return cls(":memory:", vector_index=vector_index)
+
+    def flush(self) -> None:
+        if self._vector_index is not None:
+            self._vector_index.flush()
+
+    @property
+    def vector_index(self) -> Optional[BaseTaskStore]:
+        return self._vector_index
+
+    # --- Writes ---
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="add_task")
+    def add_task(self, task: Task) -> None:
+        self.add_tasks([task])
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="add_tasks")
+    def add_tasks(
+        self,
+        tasks: Iterable[Task],
+        chunk_size: int = 500,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Upserts tasks, one transaction per chunk, and mirrors each chunk to the vector index."""
+        iterator = iter(tasks)
+        written = 0
+        while True:
+            chunk = list(islice(iterator, max(1, chunk_size)))
+            if not chunk:
+                break
+            with self._transaction() as conn:
+                conn.executemany(_UPSERT, [_task_to_row(task) for task in chunk])
+            if self._vector_index is not None:
+                self._vector_index.add_tasks(chunk, chunk_size=len(chunk))
+            written += len(chunk)
+            if on_progress is not None:
+                on_progress(len(chunk))
+        return written
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="update_tasks")
+    def update_tasks(self, updates: Dict[str, TaskUpdate]) -> Dict[str, Task]:
+        if not updates:
+            return {}
+        updated: Dict[str, Task] = {}
+        with self._transaction() as conn:
+            ids = list(updates)
+            current = {task.id: task for task in self._select(conn, f"WHERE id IN ({_placeholders(ids)})", ids)}
+            for task_id, update in updates.items():
+                previous = current.get(task_id)
+                if previous is None:
+                    continue
+                updated[task_id] = Task.model_validate({**previous.model_dump(), **update.changes()})
+            conn.executemany(_UPSERT, [_task_to_row(task) for task in updated.values()])
+        if self._vector_index is not None and updated:
+            self._vector_index.update_tasks({task_id: updates[task_id] for task_id in updated})
+        return updated
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="delete_tasks")
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        if not task_ids:
+            return []
+        with self._transaction() as conn:
+            rows = conn.execute(f"SELECT id FROM tasks WHERE id IN ({_placeholders(task_ids)})", task_ids).fetchall()
+            existing = {row[0] for row in rows}
+            conn.execute(f"DELETE FROM tasks WHERE id IN ({_placeholders(task_ids)})", task_ids)
+        deleted = [task_id for task_id in dict.fromkeys(task_ids) if task_id in existing]
+        if self._vector_index is not None and deleted:
+            self._vector_index.delete_tasks(deleted)
+        return deleted
+
+    # --- Reads ---
+    def _select(self, conn: sqlite3.Connection, clause: str, params: Iterable[Any] = ()) -> List[Task]:
+        rows = conn.execute(f"SELECT {', '.join(_TASK_COLUMNS)} FROM tasks {clause}", tuple(params)).fetchall()
+        return [_row_to_task(row) for row in rows]
+
+    def _select_tasks(self, clause: str, params: Iterable[Any] = ()) -> List[Task]:
+        with self._read_lock(), self._connection() as conn:
+            return self._select(conn, clause, params)
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="get_task")
+    def get_task(self, task_id: str) -> Task | None:
+        tasks = self._select_tasks("WHERE id = ?", [task_id])
+        return tasks[0] if tasks else None
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="list_tasks")
+    def list_tasks(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> List[Task]:
+        where, params = _filters_to_sql(filters)
+        return self._select_tasks(
+            f"{where} ORDER BY created_at_ts DESC, seq DESC LIMIT ? OFFSET ?",
+            [*params, -1 if limit is None else limit, offset],
+        )
+
+    def iter_tasks(
+        self, batch_size: int = 500, filters: Optional[TaskFilter] = None, start: int = 0
+    ) -> Iterator[Task]:
+        where, params = _filters_to_sql(filters)
+        # The first batch skips `start` matches; later batches seek past the last
+        # sequence number seen, so deep cursors do not rescan skipped rows.
+        with self._read_lock(), self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT seq FROM tasks {where} ORDER BY seq LIMIT 1 OFFSET ?", [*params, start]
+            ).fetchall()
+        if not rows:
+            return
+        last_seq = rows[0][0] - 1
+        seek = f"{where} AND seq > ?" if where else "WHERE seq > ?"
+        while True:
+            with self._read_lock(), self._connection() as conn:
+                rows = conn.execute(
+                    f"SELECT seq, {', '.join(_TASK_COLUMNS)} FROM tasks {seek} ORDER BY seq LIMIT ?",
+                    [*params, last_seq, batch_size],
+                ).fetchall()
+            for row in rows:
+                yield _row_to_task(row[1:])
+            if len(rows) < batch_size:
+                return
+            last_seq = rows[-1][0]
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="project_tasks")
+    def project_tasks(
+        self,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Dict[str, Any]]:
+        """Selects only the requested columns. Dates are returned as ISO 8601 strings, formatted as in `Task` JSON."""
+        validate_fields(fields)
+        where, params = _filters_to_sql(filters)
+        rows = self._query(
+            f"SELECT {', '.join(fields)} FROM tasks {where} ORDER BY created_at_ts DESC, seq DESC LIMIT ? OFFSET ?",
+            [*params, -1 if limit is None else limit, offset],
+        )
+        return [
+            json_dates({field: bool(value) if field == "is_completed" else value for field, value in zip(fields, row)})
+            for row in rows
+        ]
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="task_stats")
+    def task_stats(self, now: Optional[datetime] = None, due_soon_days: float = 7) -> TaskStats:
+        """
+        Reads the counts by category, priority and completion state from the
+        `task_counts` table, which triggers keep up to date, and counts the open
+        tasks due up to the end of the due-soon window from a partial index.
+        """
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        rows = self._query(_STATS, [now.timestamp(), (now + timedelta(days=due_soon_days)).timestamp()])
+        # Start from the empty snapshot, so every category and priority is listed.
+        stats = TaskStatsIndex().snapshot(now, due_soon_days)
+        for category, priority, is_completed, has_due_date, count, overdue, due_soon in rows:
+            stats.total += count
+            stats.completed += count if is_completed else 0
+            stats.by_category[category] = stats.by_category.get(category, 0) + count
+            stats.by_priority[priority] = stats.by_priority.get(priority, 0) + count
+            stats.no_due_date += count if not (is_completed or has_due_date) else 0
+            stats.overdue, stats.due_soon = overdue, due_soon
+        stats.open = stats.total - stats.completed
+        return stats
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="task_exists_by_title")
+    def task_exists_by_title(self, title: str) -> bool:
+        """Checks for a task with the same normalized title, using the title index."""
+        return bool(self._query("SELECT 1 FROM tasks WHERE title_key = ? LIMIT 1", [normalize_title(title)]))
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="titles_exist")
+    def titles_exist(self, titles: List[str]) -> Dict[str, bool]:
+        keys = {title: normalize_title(title) for title in titles}
+        if not keys:
+            return {}
+        unique_keys = list(set(keys.values()))
+        rows = self._query(
+            f"SELECT DISTINCT title_key FROM tasks WHERE title_key IN ({_placeholders(unique_keys)})", unique_keys
+        )
+        found = {row[0] for row in rows}
+        return {title: key in found for title, key in keys.items()}
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="search_tasks_batch")
+    def search_tasks_batch(
+        self, queries: List[str], k: int = 5, filters: Optional[TaskFilter] = None
+    ) -> List[List[TaskSearchResult]]:
+        return self._require_vector_index().search_tasks_batch(queries, k=k, filters=filters)
+
+    @timed(STORE_OPERATION_SECONDS, backend="sqlite", operation="find_near_duplicates")
+    def find_near_duplicates(
+        self, texts: List[str], threshold: float = 0.9, k: int = 3
+    ) -> List[List[Tuple[Task, float]]]:
+        """Delegates to the vector index; see `ChromaTaskStore.find_near_duplicates`."""
+        return getattr(self._require_vector_index(), "find_near_duplicates")(texts, threshold, k)
+
+    def _require_vector_index(self) -> BaseTaskStore:
+        if self._vector_index is None:
+            raise RuntimeError("Vector search needs a SQLiteTaskStore created with a vector_index.")
+        return self._vector_index
+
+
+def _placeholders(values: Iterable[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _task_to_row(task: Task) -> Dict[str, Any]:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "title_key": normalize_title(task.title),
+        "category": task.category,
+        "priority": task.priority,
+        "description": task.description,
+        "due_date": task.due_date.isoformat() if task.due_date else None,
+        "due_date_ts": timestamp(task.due_date) if task.due_date else None,
+        "created_at": task.created_at.isoformat(),
+        "created_at_ts": timestamp(task.created_at),
+        "is_completed": int(task.is_completed),
+    }
+
+
+def _row_to_task(row: Tuple[Any, ...]) -> Task:
+    # Rows were validated when written, so they are rebuilt without re-validation.
+    task_id, title, category, priority, description, due_date, created_at, is_completed = row
+    return Task.model_construct(
+        id=task_id,
+        title=title,
+        category=category,
+        priority=priority,
+        description=description,
+        due_date=datetime.fromisoformat(due_date) if due_date else None,
+        created_at=datetime.fromisoformat(created_at),
+        is_completed=bool(is_completed),
+    )
+
+
+def _filters_to_sql(filters: Optional[TaskFilter]) -> Tuple[str, List[Any]]:
+    """Translates task filters into a SQL `WHERE` clause and its parameters."""
+    if filters is None:
+        return "", []
+    conditions: List[str] = []
+    params: List[Any] = []
+    for field in ("category", "priority", "is_completed"):
+        value = getattr(filters, field)
+        if value is not None:
+            conditions.append(f"{field} = ?")
+            params.append(int(value) if field == "is_completed" else value)
+    for bound, column, operator in (
+        (filters.due_after, "due_date_ts", ">="),
+        (filters.due_before, "due_date_ts", "<="),
+        (filters.created_after, "created_at_ts", ">="),
+        (filters.created_before, "created_at_ts", "<="),
+    ):
+        if bound is not None:
+            conditions.append(f"{column} {operator} ?")
+            params.append(timestamp(bound))
+    if not conditions:
+        return "", []
+    return "WHERE " + " AND ".join(conditions), params
@@ -0,0 +1,230 @@
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.models.task import Task, TaskCategory, TaskPriority, TaskStats
+from src.storage.timeutil import timestamp
+
+_CATEGORIES: List[str] = list(TaskCategory.__args__)  # type: ignore[attr-defined]
+_PRIORITIES: List[str] = list(TaskPriority.__args__)  # type: ignore[attr-defined]
+
+# Version of the layout written by `TaskStatsIndex.to_dict`.
+_FORMAT_VERSION = 2
+
+_DAY_SECONDS = 86400
+
+
+class _DayCounts:
+    """
+    Counts per UTC day in a Fenwick (binary indexed) tree, so updating one day
+    and adding up every day before a given one both take O(log days) steps.
+    Nodes live in a dict, so only days that were counted take up memory.
+    """
+    # Indexes cover every day a `datetime` can fall on: day -719162 (0001-01-01) maps to 1.
+    _OFFSET = 719163
+    _SIZE = 1 << 22
+
+    def __init__(self):
+        self._nodes: Dict[int, int] = {}
+
+    def add(self, day: int, count: int) -> None:
+        index = day + self._OFFSET
+        while 0 < index <= self._SIZE:
+            value = self._nodes.get(index, 0) + count
+            if value:
+                self._nodes[index] = value
+            else:
+                del self._nodes[index]
+            index += index & -index
+
+    def count_before(self, day: int) -> int:
+        """The total count of the days before `day`."""
+        index = min(day + self._OFFSET - 1, self._SIZE)
+        total = 0
+        while index > 0:
+            total += self._nodes.get(index, 0)
+            index -= index & -index
+        return total
+
+
+class TaskStatsIndex:
+    """
+    In-memory aggregate counters over the stored tasks, behind `GET /tasks/stats`.
+
+    Like `TitleDedupIndex`, it is warmed once from a full scan of the store and
+    then kept in sync by the store's write methods, so reading the counts by
+    category, priority and completion state never touches the database. The
+    due dates of open tasks are bucketed by UTC day, each day holding its count
+    and the exact due times that fall on it. The daily counts are kept in a
+    Fenwick tree, so a write and the overdue and due-soon counts for any point in
+    time take O(log days), only looking at exact times on the days where the
+    window starts and ends.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._warm = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._total = 0
+        self._completed = 0
+        self._categories: Counter = Counter()
+        self._priorities: Counter = Counter()
+        self._open_without_due = 0
+        # Open tasks due on each UTC day, and their exact due times on that day.
+        self._due_days = _DayCounts()
+        self._due_times: Dict[int, Counter] = {}
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warm
+
+    def __len__(self) -> int:
+        return self._total
+
+    def warm(self, tasks: Iterable[Task]) -> None:
+        """Replaces the counters with the counts over the given tasks."""
+        with self._lock:
+            self._reset()
+            for task in tasks:
+                self._apply(task, 1)
+            self._warm = True
+
+    def add(self, task: Task) -> None:
+        with self._lock:
+            self._apply(task, 1)
+
+    def discard(self, task: Task) -> None:
+        with self._lock:
+            self._apply(task, -1)
+
+    def replace(self, previous: Task, task: Task) -> None:
+        with self._lock:
+            self._apply(previous, -1)
+            self._apply(task, 1)
+
+    def _apply(self, task: Task, sign: int) -> None:
+        self._total += sign
+        self._categories[task.category] += sign
+        self._priorities[task.priority] += sign
+        if task.is_completed:
+            self._completed += sign
+        elif task.due_date is None:
+            self._open_without_due += sign
+        else:
+            self._count_due(timestamp(task.due_date), sign)
+
+    def _count_due(self, due: float, sign: int) -> None:
+        day = _day(due)
+        times = self._due_times.get(day, Counter())
+        count = times[due] + sign
+        if count < 0:
+            # Discarding a due date that is not counted.
+            return
+        if count:
+            times[due] = count
+        else:
+            del times[due]
+        if times:
+            self._due_times[day] = times
+        else:
+            del self._due_times[day]
+        self._due_days.add(day, sign)
+
+    def _count_due_before(self, limit: float, inclusive: bool = False) -> int:
+        """Open tasks due before `limit` (or at it, if `inclusive`)."""
+        day = _day(limit)
+        count = self._due_days.count_before(day)
+        for due, tasks in self._due_times.get(day, {}).items():
+            if due < limit or (inclusive and due == limit):
+                count += tasks
+        return count
+
+    def snapshot(self, now: Optional[datetime] = None, due_soon_days: float = 7) -> TaskStats:
+        """The current counts, with overdue and due-soon tasks counted relative to `now`."""
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        start = now.timestamp()
+        end = (now + timedelta(days=due_soon_days)).timestamp()
+        with self._lock:
+            overdue = self._count_due_before(start)
+            return TaskStats(
+                total=self._total,
+                completed=self._completed,
+                open=self._total - self._completed,
+                by_category={category: self._categories[category] for category in _CATEGORIES},
+                by_priority={priority: self._priorities[priority] for priority in _PRIORITIES},
+                overdue=overdue,
+                due_soon=self._count_due_before(end, inclusive=True) - overdue,
+                no_due_date=self._open_without_due,
+                due_soon_days=due_soon_days,
+                as_of=now,
+            )
+
+    # --- Persistence ---
+    def to_dict(self) -> Dict[str, Any]:
+        """A JSON-compatible copy of the counters. Due dates are saved as `[due, count]` pairs."""
+        with self._lock:
+            return {
+                "version": _FORMAT_VERSION,
+                "total": self._total,
+                "completed": self._completed,
+                "by_category": dict(self._categories),
+                "by_priority": dict(self._priorities),
+                "open_without_due": self._open_without_due,
+                "open_due": sorted([due, count] for times in self._due_times.values() for due, count in times.items()),
+            }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        """Replaces the counters with ones saved by `to_dict`. Raises ValueError for another format."""
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported task stats format: {data.get('version')!r}")
+        total, completed = int(data["total"]), int(data["completed"])
+        categories, priorities = Counter(data["by_category"]), Counter(data["by_priority"])
+        open_without_due = int(data["open_without_due"])
+        open_due = [(float(due), int(count)) for due, count in data["open_due"]]
+        with self._lock:
+            self._reset()
+            self._total, self._completed = total, completed
+            self._categories, self._priorities = categories, priorities
+            self._open_without_due = open_without_due
+            for due, count in open_due:
+                self._count_due(due, count)
+            self._warm = True
+
+    def save(self, path: str, write_version: int) -> None:
+        """
+        Writes the counters to `path` atomically, so a crash never leaves a partial
+        file. `write_version` identifies the state of the store they describe.
+        """
+        data = self.to_dict()
+        data["write_version"] = write_version
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temporary, path)
+
+    def load(self, path: str, write_version: int) -> bool:
+        """
+        Loads counters saved by `save`. Returns False, leaving the index cold, if
+        the file is missing or unreadable, or was saved at another `write_version`
+        (e.g. the store was written after the counters were last saved).
+        """
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("write_version") != write_version:
+                return False
+            self.load_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+
+def _day(value: float) -> int:
+    """The UTC day (days since the epoch) a POSIX timestamp falls on."""
+    return int(value // _DAY_SECONDS)
@@ -0,0 +1,8 @@
+from datetime import datetime, timezone
+
+
+def timestamp(value: datetime) -> float:
+    """Converts a datetime to a POSIX timestamp, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
@@ -1,30 +1,311 @@
-import chromadb
-from chromadb.api import ClientAPI
-from typing import List, Dict, Any, cast
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Iterable, Iterator, Optional, Tuple, cast
+
+from src.core.metrics import STORE_OPERATION_SECONDS, timed
+from src.core.config import get_settings
+from src.models.task import Task, TaskFilter, TaskSearchResult, TaskStats, TaskUpdate
+from src.storage.base_store import BaseTaskStore, json_dates, validate_fields
+from src.storage.caching_store import CachingTaskStore
+from src.storage.dedup_index import TitleDedupIndex
+from src.storage.sqlite_store import SQLiteTaskStore
+from src.storage.task_stats import TaskStatsIndex
+from src.storage.timeutil import timestamp
+from src.storage.embeddings import CachedEmbedder, ChromaDefaultEmbedder, Embedder, HashingEmbedder, create_embedder
+
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+
+logger = logging.getLogger(__name__)
+
+# Version of the metadata layout written by `_task_to_metadata`.
+SCHEMA_VERSION = 2
+
+class _CreationOrderIndex:
+    """
+    In-memory map of task ids to their `created_at` timestamps, used to cut
+    newest-first pages without loading every task's metadata. Like the dedup
+    index, it is warmed from one scan and then kept in sync by the write methods.
+    The newest-first ordering is cached and re-sorted after writes.
+    """
+    def __init__(self):
+        self._created_at: Dict[str, float] = {}
+        self._ordered: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self._warm = False
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warm
+
+    def warm(self, entries: Iterable[Tuple[str, float]]) -> None:
+        with self._lock:
+            self._created_at = dict(entries)
+            self._ordered = None
+            self._warm = True
+
+    def add(self, task_id: str, created_at_ts: float) -> None:
+        with self._lock:
+            self._created_at[task_id] = created_at_ts
+            self._ordered = None
+
+    def discard(self, task_id: str) -> None:
+        with self._lock:
+            if self._created_at.pop(task_id, None) is not None:
+                self._ordered = None
+
+    def newest_first(self) -> List[str]:
+        """Every id, newest first; ties are broken by the most recently added."""
+        with self._lock:
+            if self._ordered is None:
+                created_at = self._created_at
+                # `sorted` is stable, so reversing first puts the later insert first on ties.
+                self._ordered = sorted(reversed(created_at), key=created_at.__getitem__, reverse=True)
+            return self._ordered
 
-from src.models.task import Task
-from src.storage.base_store import BaseTaskStore
 
 class ChromaTaskStore(BaseTaskStore):
-    def __init__(self, client: ClientAPI):
+    # chromadb is imported lazily throughout this module: it is slow to import,
+    # and importing the storage layer should not cost anything until it is used.
+    def __init__(
+        self,
+        client: "ClientAPI",
+        embedder: Optional[Embedder] = None,
+        stats_path: Optional[str] = None,
+        stats_save_every: int = 1000,
+        stats_save_interval: float = 30.0,
+    ):
         self._client = client
-        self._collection = self._client.get_or_create_collection(name="tasks")
+        # Every write and query passes precomputed embeddings, so the collection
+        # itself has no embedding function and the backend is ours to choose.
+        self._embedder = embedder if embedder is not None else CachedEmbedder(ChromaDefaultEmbedder())
+        self._collection = self._client.get_or_create_collection(name="tasks", embedding_function=None)
+        self._dedup_index = TitleDedupIndex()
+        self._creation_order = _CreationOrderIndex()
+        # Aggregate counters, saved to `stats_path` (if given) every `stats_save_every`
+        # writes or `stats_save_interval` seconds, and by `flush`.
+        self._stats = TaskStatsIndex()
+        self._stats_path = stats_path
+        self._stats_save_every = stats_save_every
+        self._stats_save_interval = stats_save_interval
+        self._stats_save_lock = threading.Lock()
+        self._stats_saved = False
+        self._stats_unsaved_writes = 0
+        self._stats_saved_at = time.monotonic()
+        self._write_lock = threading.Lock()
+        self._check_embedding_backend()
+        self._migrate_metadata()
+        self._load_task_stats()
 
     @classmethod
-    def for_production(cls, path: str = "./chroma_db") -> "ChromaTaskStore":
+    def for_production(
+        cls,
+        path: str = "./chroma_db",
+        embedder: Optional[Embedder] = None,
+        stats_save_every: int = 1000,
+        stats_save_interval: float = 30.0,
+    ) -> "ChromaTaskStore":
+        import chromadb
+
         client = chromadb.PersistentClient(path=path)
-        return cls(client=client)
+        return cls(
+            client=client,
+            embedder=embedder,
+            stats_path=os.path.join(path, "task_stats.json"),
+            stats_save_every=stats_save_every,
+            stats_save_interval=stats_save_interval,
+        )
 
     @classmethod
-    def for_testing(cls) -> "ChromaTaskStore":
+    def for_testing(cls, embedder: Optional[Embedder] = None) -> "ChromaTaskStore":
+        import chromadb
+
         client = chromadb.EphemeralClient()
-        return cls(client=client)
+        return cls(client=client, embedder=embedder or HashingEmbedder())
+
+    @property
+    def client(self) -> "ClientAPI":
+        return self._client
+
+    @property
+    def embedder(self) -> Embedder:
+        return self._embedder
+
+    def _check_embedding_backend(self) -> None:
+        """
+        Records the embedding backend on the collection, and refuses to open a
+        collection whose tasks were embedded by a different backend, since their
+        vectors would not be comparable. Collections written before the backend
+        was recorded used Chroma's default model.
+        """
+        collection_metadata = dict(self._collection.metadata or {})
+        stored = collection_metadata.get("embedding_backend")
+        if stored is None and self._collection.count() > 0:
+            stored = "default"
+        if stored is not None and stored != self._embedder.name:
+            raise ValueError(
+                f"The 'tasks' collection was embedded with '{stored}', but the configured "
+                f"embedding backend is '{self._embedder.name}'. Use a fresh database for the new backend."
+            )
+        if collection_metadata.get("embedding_backend") != self._embedder.name:
+            collection_metadata["embedding_backend"] = self._embedder.name
+            self._collection.modify(metadata=collection_metadata)
+
+    def _migrate_metadata(self) -> None:
+        """
+        Backfills the numeric date fields used by range filters on tasks written
+        before they existed. The schema version is recorded on the collection,
+        so this scan only ever runs once per database.
+        """
+        collection_metadata = dict(self._collection.metadata or {})
+        if collection_metadata.get("schema_version", 1) >= SCHEMA_VERSION:
+            return
+        results = self._collection.get(include=["metadatas"])
+        ids = results["ids"]
+        if ids:
+            metadatas = [
+                self._task_to_metadata(self._metadata_to_task(cast(Dict[str, Any], meta)))
+                for meta in results.get('metadatas') or []
+            ]
+            self._collection.update(ids=ids, metadatas=metadatas)
+        collection_metadata["schema_version"] = SCHEMA_VERSION
+        self._collection.modify(metadata=collection_metadata)
+
+    def warm_dedup_index(self) -> None:
+        """
+        Loads every stored title into the in-memory dedup index. This is a single
+        metadata scan; afterwards the index is kept in sync by the write methods.
+        It runs automatically on the first duplicate check.
+        """
+        with self._write_lock:
+            if self._dedup_index.is_warm:
+                return
+            results = self._collection.get(include=["metadatas"])
+            titles = [cast(Dict[str, Any], meta)["title"] for meta in results.get('metadatas') or [] if meta]
+            self._dedup_index.warm(titles)
+
+    def _stats_write_version(self) -> int:
+        return int((self._collection.metadata or {}).get("stats_write_version", 0))
+
+    def _load_task_stats(self) -> None:
+        """
+        Loads the aggregate counters saved next to the collection. The collection
+        records a write version, bumped by the first write after each save, so a
+        file that missed writes (e.g. after a crash) is deleted, and the counters
+        are rebuilt from a scan on the first stats query instead.
+        """
+        if self._stats_path is None or not os.path.exists(self._stats_path):
+            return
+        if self._stats.load(self._stats_path, write_version=self._stats_write_version()):
+            self._stats_saved = True
+        else:
+            logger.warning("Discarding stale task stats at %s; they will be rebuilt.", self._stats_path)
+            os.remove(self._stats_path)
+
+    def _record_write(self) -> None:
+        """
+        Marks the saved counters as stale before the collection is changed. Only
+        the first write after a save bumps the collection's write version. Must
+        be called with the write lock held.
+        """
+        if self._stats_path is None or not self._stats.is_warm:
+            return
+        self._stats_unsaved_writes += 1
+        if self._stats_saved:
+            collection_metadata = dict(self._collection.metadata or {})
+            collection_metadata["stats_write_version"] = self._stats_write_version() + 1
+            self._collection.modify(metadata=collection_metadata)
+            self._stats_saved = False
+
+    def _after_write(self) -> None:
+        """Saves the counters once `stats_save_every` writes or `stats_save_interval` seconds have passed."""
+        if self._stats_path is None or not self._stats.is_warm:
+            return
+        if (
+            self._stats_unsaved_writes >= self._stats_save_every
+            or time.monotonic() - self._stats_saved_at >= self._stats_save_interval
+        ):
+            self._save_task_stats()
+
+    def _save_task_stats(self, wait: bool = False) -> None:
+        """
+        Saves the aggregate counters if they changed since the last save. The file
+        is written outside the write lock; unless `wait` is set, a save already in
+        progress on another thread makes this one a no-op.
+        """
+        if self._stats_path is None or not self._stats_save_lock.acquire(blocking=wait):
+            return
+        try:
+            with self._write_lock:
+                if self._stats_saved or not self._stats.is_warm:
+                    return
+                write_version = self._stats_write_version()
+                # Writes from here on bump the version, so the file is never newer than it claims.
+                self._stats_saved = True
+                self._stats_unsaved_writes = 0
+                self._stats_saved_at = time.monotonic()
+            self._stats.save(self._stats_path, write_version)
+        except OSError:
+            logger.warning("Could not save task stats to %s.", self._stats_path, exc_info=True)
+        finally:
+            self._stats_save_lock.release()
 
-    # --- NEW METHOD ---
+    def flush(self) -> None:
+        """Saves the aggregate counters if they changed since the last save, e.g. on shutdown."""
+        self._save_task_stats(wait=True)
+
+    def rebuild_task_stats(self) -> None:
+        """
+        Recomputes the aggregate counters from a full metadata scan and saves
+        them. This runs automatically on the first stats query when no saved
+        counters could be loaded; afterwards the write methods keep them in sync.
+        """
+        with self._write_lock:
+            results = self._collection.get(include=["metadatas"])
+            self._stats.warm(
+                self._metadata_to_task(cast(Dict[str, Any], meta)) for meta in results.get('metadatas') or [] if meta
+            )
+            self._stats_saved = False
+        self._save_task_stats(wait=True)
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="task_stats")
+    def task_stats(self, now: Optional[datetime] = None, due_soon_days: float = 7) -> TaskStats:
+        """
+        Reads the aggregate counts from the in-memory counters, which the write
+        methods keep up to date, so no tasks are read.
+        """
+        if not self._stats.is_warm:
+            self.rebuild_task_stats()
+        return self._stats.snapshot(now, due_soon_days)
+
+    def warm_creation_order(self) -> None:
+        """
+        Loads every task's creation time into the in-memory order index used to
+        cut pages. It runs automatically on the first paginated listing.
+        """
+        with self._write_lock:
+            if self._creation_order.is_warm:
+                return
+            results = self._collection.get(include=["metadatas"])
+            self._creation_order.warm(
+                (task_id, _created_at_key(cast(Dict[str, Any], meta)))
+                for task_id, meta in zip(results["ids"], results.get('metadatas') or [])
+                if meta
+            )
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="task_exists_by_title")
     def task_exists_by_title(self, title: str) -> bool:
         """
-        Efficiently checks if a task with the exact same title already exists
-        in the database using a metadata filter.
+        Checks if a task with the same title already exists, using the in-memory
+        dedup index instead of querying the database. Titles are compared after
+        case-folding and collapsing whitespace.
         
         Args:
             title: The title of the task to check for.
@@ -32,30 +313,280 @@ class ChromaTaskStore(BaseTaskStore):
         Returns:
             True if a task with the same title exists, False otherwise.
         """
-        # ChromaDB's 'where' filter is the key to this efficient check.
-        # We search for any documents where the metadata 'title' field is an exact match.
-        results = self._collection.get(where={"title": title})
-        # If the 'ids' list in the result is not empty, a match was found.
-        return len(results['ids']) > 0
+        self.warm_dedup_index()
+        return self._dedup_index.contains(title)
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="titles_exist")
+    def titles_exist(self, titles: List[str]) -> Dict[str, bool]:
+        """
+        Bulk version of `task_exists_by_title`.
+
+        Returns:
+            A mapping from each candidate title (as given) to whether it exists.
+        """
+        self.warm_dedup_index()
+        return self._dedup_index.contains_many(titles)
+
+    def _query_similar(
+        self, texts: List[str], k: int, where: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Embeds all texts in one batch and returns, for each, the metadata of its
+        `k` nearest tasks with their cosine similarity, most similar first.
+
+        Similarity is computed from the returned embeddings, so it does not
+        depend on the collection's distance metric.
+        """
+        if not texts:
+            return []
+        count = self._collection.count()
+        if count == 0:
+            return [[] for _ in texts]
+
+        query_embeddings = list(self._embedder.embed(texts))
+        results = self._collection.query(
+            query_embeddings=query_embeddings,
+            n_results=min(k, count),
+            where=where,
+            include=["metadatas", "embeddings"],
+        )
+        metadatas_lists = results.get("metadatas")
+        embeddings_lists = results.get("embeddings")
+        if metadatas_lists is None or embeddings_lists is None:
+            return [[] for _ in texts]
+
+        matches: List[List[Tuple[Dict[str, Any], float]]] = []
+        for query_embedding, metadatas, embeddings in zip(query_embeddings, metadatas_lists, embeddings_lists):
+            scored: List[Tuple[Dict[str, Any], float]] = []
+            for meta, embedding in zip(metadatas, embeddings):
+                if meta is None:
+                    continue
+                stored = np.asarray(embedding, dtype=np.float32)
+                norm = float(np.linalg.norm(query_embedding) * np.linalg.norm(stored)) or 1.0
+                similarity = min(float(np.dot(query_embedding, stored)) / norm, 1.0)
+                scored.append((cast(Dict[str, Any], meta), similarity))
+            matches.append(sorted(scored, key=lambda match: match[1], reverse=True))
+        return matches
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="find_near_duplicates")
+    def find_near_duplicates(
+        self, texts: List[str], threshold: float = 0.9, k: int = 3
+    ) -> List[List[Tuple[Task, float]]]:
+        """
+        Finds stored tasks whose embeddings are close to each candidate text.
+
+        Args:
+            texts: Candidate texts, e.g. the titles of tasks about to be added.
+            threshold: Minimum cosine similarity for a task to count as a near duplicate.
+            k: Number of nearest neighbours to inspect per candidate.
+
+        Returns:
+            For each candidate, the matching tasks and their similarity, most similar first.
+        """
+        return [
+            [(self._metadata_to_task(meta), similarity) for meta, similarity in matches if similarity >= threshold]
+            for matches in self._query_similar(texts, k)
+        ]
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="search_tasks_batch")
+    def search_tasks_batch(
+        self, queries: List[str], k: int = 5, filters: Optional[TaskFilter] = None
+    ) -> List[List[TaskSearchResult]]:
+        """
+        Ranks tasks by vector similarity to each query, restricted by optional
+        metadata filters. All queries are embedded and searched in one round-trip.
+        """
+        return [
+            [TaskSearchResult(task=self._metadata_to_task(meta), score=similarity) for meta, similarity in matches]
+            for matches in self._query_similar(queries, k, where=self._filters_to_where(filters))
+        ]
 
     # ... (all other methods remain exactly the same) ...
     def _task_to_metadata(self, task: Task) -> Dict[str, Any]:
         metadata = task.model_dump(exclude_none=True)
         for key, value in metadata.items():
             if hasattr(value, 'isoformat'): metadata[key] = value.isoformat()
+        # Numeric copies of the dates make range filters possible in `where` clauses.
+        metadata["created_at_ts"] = timestamp(task.created_at)
+        if task.due_date is not None:
+            metadata["due_date_ts"] = timestamp(task.due_date)
         return metadata
 
     def _metadata_to_task(self, metadata: Dict[str, Any]) -> Task:
         return Task.model_validate(metadata)
 
+    def _task_to_document(self, task: Task) -> str:
+        return task.title + " " + (task.description or "")
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="add_task")
     def add_task(self, task: Task):
-        self._collection.add(
-            ids=[task.id],
-            documents=[task.title + " " + (task.description or "")],
-            metadatas=[self._task_to_metadata(task)]
-        )
-        print(f"Task '{task.title}' added to ChromaDB.")
+        with self._write_lock:
+            document = self._task_to_document(task)
+            self._record_write()
+            self._collection.add(
+                ids=[task.id],
+                documents=[document],
+                metadatas=[self._task_to_metadata(task)],
+                embeddings=list(self._embedder.embed([document])),
+            )
+            if self._dedup_index.is_warm:
+                self._dedup_index.add(task.title)
+            if self._creation_order.is_warm:
+                self._creation_order.add(task.id, timestamp(task.created_at))
+            if self._stats.is_warm:
+                self._stats.add(task)
+        self._after_write()
+        logger.debug("Task '%s' added to ChromaDB.", task.title)
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="add_tasks")
+    def add_tasks(
+        self,
+        tasks: Iterable[Task],
+        chunk_size: int = 500,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Upserts tasks in chunks. Each chunk's metadata is converted in bulk, its
+        documents are embedded in one batch, and it is written with a single
+        `collection.upsert`, so existing ids are replaced instead of failing.
+        """
+        chunk_size = max(1, min(chunk_size, self._client.get_max_batch_size()))
+        iterator = iter(tasks)
+        written = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            self._upsert_chunk(chunk)
+            written += len(chunk)
+            if on_progress is not None:
+                on_progress(len(chunk))
+        if written:
+            logger.debug("%d tasks written to ChromaDB.", written)
+        return written
+
+    def _upsert_chunk(self, tasks: List[Task]) -> None:
+        ids = [task.id for task in tasks]
+        documents = [self._task_to_document(task) for task in tasks]
+        metadatas = [self._task_to_metadata(task) for task in tasks]
+        embeddings = self._embed_documents(ids, documents)
+        with self._write_lock:
+            replaced: List[Dict[str, Any]] = []
+            if self._dedup_index.is_warm or self._stats.is_warm:
+                # Replaced tasks drop their previous version from the indexes.
+                previous = self._collection.get(ids=ids, include=["metadatas"])
+                replaced = [cast(Dict[str, Any], meta) for meta in previous.get('metadatas') or [] if meta]
+            self._record_write()
+            self._collection.upsert(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
+            if self._dedup_index.is_warm:
+                for meta in replaced:
+                    self._dedup_index.discard(meta["title"])
+                for task in tasks:
+                    self._dedup_index.add(task.title)
+            if self._creation_order.is_warm:
+                for task in tasks:
+                    self._creation_order.add(task.id, timestamp(task.created_at))
+            if self._stats.is_warm:
+                for meta in replaced:
+                    self._stats.discard(self._metadata_to_task(meta))
+                for task in tasks:
+                    self._stats.add(task)
+        self._after_write()
+
+    def _embed_documents(self, ids: List[str], documents: List[str]) -> List[np.ndarray]:
+        """
+        Embeds documents for an upsert. Tasks whose stored document (title and
+        description) is unchanged keep their stored embedding; the rest are
+        embedded in one batch.
+        """
+        stored = self._collection.get(ids=ids, include=["documents", "embeddings"])
+        stored_embeddings = stored.get("embeddings")
+        reusable: Dict[str, np.ndarray] = {}
+        if stored_embeddings is not None:
+            for task_id, document, embedding in zip(stored["ids"], stored.get("documents") or [], stored_embeddings):
+                reusable[task_id + "\0" + (document or "")] = np.asarray(embedding, dtype=np.float32)
+
+        keys = [task_id + "\0" + document for task_id, document in zip(ids, documents)]
+        changed = [document for key, document in zip(keys, documents) if key not in reusable]
+        computed = iter(self._embedder.embed(changed))
+        return [reusable[key] if key in reusable else next(computed) for key in keys]
 
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="update_tasks")
+    def update_tasks(self, updates: Dict[str, TaskUpdate]) -> Dict[str, Task]:
+        """
+        Applies partial updates with `collection.update`. Only tasks whose title
+        or description changed are re-embedded; the rest keep their stored
+        embedding and only have their metadata rewritten.
+        """
+        if not updates:
+            return {}
+        with self._write_lock:
+            current = self._collection.get(ids=list(updates), include=["metadatas"])
+            updated: Dict[str, Task] = {}
+            metadatas: Dict[str, Dict[str, Any]] = {}
+            changed_documents: Dict[str, str] = {}
+            for task_id, meta in zip(current["ids"], current.get("metadatas") or []):
+                if meta is None:
+                    continue
+                previous_meta = cast(Dict[str, Any], meta)
+                previous = self._metadata_to_task(previous_meta)
+                task = Task.model_validate({**previous.model_dump(), **updates[task_id].changes()})
+                metadata = self._task_to_metadata(task)
+                # `collection.update` merges metadata, so cleared fields are removed explicitly.
+                metadata.update({key: None for key in previous_meta if key not in metadata})
+                metadatas[task_id] = metadata
+                updated[task_id] = task
+                document = self._task_to_document(task)
+                if document != self._task_to_document(previous):
+                    changed_documents[task_id] = document
+                if self._dedup_index.is_warm and task.title != previous.title:
+                    self._dedup_index.discard(previous.title)
+                    self._dedup_index.add(task.title)
+                if self._stats.is_warm:
+                    self._stats.replace(previous, task)
+
+            if updated:
+                self._record_write()
+            metadata_only = [task_id for task_id in updated if task_id not in changed_documents]
+            if metadata_only:
+                self._collection.update(ids=metadata_only, metadatas=[metadatas[i] for i in metadata_only])
+            if changed_documents:
+                reembed_ids = list(changed_documents)
+                documents = list(changed_documents.values())
+                self._collection.update(
+                    ids=reembed_ids,
+                    metadatas=[metadatas[i] for i in reembed_ids],
+                    documents=documents,
+                    embeddings=list(self._embedder.embed(documents)),
+                )
+        if updated:
+            self._after_write()
+        return updated
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="delete_tasks")
+    def delete_tasks(self, task_ids: List[str]) -> List[str]:
+        if not task_ids:
+            return []
+        with self._write_lock:
+            existing = self._collection.get(ids=task_ids, include=["metadatas"])
+            deleted = existing["ids"]
+            if deleted:
+                self._record_write()
+                self._collection.delete(ids=deleted)
+            for task_id in deleted:
+                self._creation_order.discard(task_id)
+            for meta in existing.get("metadatas") or []:
+                if not meta:
+                    continue
+                if self._dedup_index.is_warm:
+                    self._dedup_index.discard(cast(Dict[str, Any], meta)["title"])
+                if self._stats.is_warm:
+                    self._stats.discard(self._metadata_to_task(cast(Dict[str, Any], meta)))
+        if deleted:
+            self._after_write()
+        return deleted
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="get_task")
     def get_task(self, task_id: str) -> Task | None:
         result = self._collection.get(ids=[task_id])
         metadatas_list = result.get('metadatas')
@@ -64,14 +595,137 @@ class ChromaTaskStore(BaseTaskStore):
         if first_metadata: return self._metadata_to_task(cast(Dict[str, Any], first_metadata))
         return None
 
-    def list_tasks(self) -> List[Task]:
-        results = self._collection.get()
-        tasks: List[Task] = []
-        metadatas_list = results.get('metadatas')
-        if not metadatas_list: return []
-        for meta in metadatas_list:
-            if meta is not None: tasks.append(self._metadata_to_task(cast(Dict[str, Any], meta)))
-        return sorted(tasks, key=lambda t: t.created_at, reverse=True)
+    def _filters_to_where(self, filters: Optional[TaskFilter]) -> Optional[Dict[str, Any]]:
+        """Translates task filters into a ChromaDB `where` clause."""
+        if filters is None:
+            return None
+        conditions: List[Dict[str, Any]] = []
+        for field in ("category", "priority", "is_completed"):
+            value = getattr(filters, field)
+            if value is not None:
+                conditions.append({field: value})
+        for bound, field, operator in (
+            (filters.due_after, "due_date_ts", "$gte"),
+            (filters.due_before, "due_date_ts", "$lte"),
+            (filters.created_after, "created_at_ts", "$gte"),
+            (filters.created_before, "created_at_ts", "$lte"),
+        ):
+            if bound is not None:
+                conditions.append({field: {operator: timestamp(bound)}})
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+    def _get_page(
+        self, limit: Optional[int], offset: int, filters: Optional[TaskFilter]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches the metadata of one page of matching tasks, newest first.
+
+        Pages are cut from the creation-order index (the matching ids of a
+        filtered listing are fetched without metadata), so only the requested
+        page's metadata is fetched and validated.
+        """
+        where = self._filters_to_where(filters)
+        if limit is None and offset == 0:
+            results = self._collection.get(where=where, include=["metadatas"])
+            metadatas_list = [cast(Dict[str, Any], meta) for meta in results.get('metadatas') or [] if meta is not None]
+            return sorted(metadatas_list, key=_created_at_key, reverse=True)
+
+        self.warm_creation_order()
+        ordered = self._creation_order.newest_first()
+        if where is not None:
+            matching = set(self._collection.get(where=where, include=[])["ids"])
+            ordered = [task_id for task_id in ordered if task_id in matching]
+        page = ordered[offset:None if limit is None else offset + limit]
+        if not page:
+            return []
+        results = self._collection.get(ids=page, include=["metadatas"])
+        by_id = {
+            task_id: cast(Dict[str, Any], meta)
+            for task_id, meta in zip(results["ids"], results.get('metadatas') or [])
+            if meta is not None
+        }
+        return [by_id[task_id] for task_id in page if task_id in by_id]
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="list_tasks")
+    def list_tasks(
+        self, limit: Optional[int] = None, offset: int = 0, filters: Optional[TaskFilter] = None
+    ) -> List[Task]:
+        return [self._metadata_to_task(meta) for meta in self._get_page(limit, offset, filters)]
+
+    def iter_tasks(
+        self, batch_size: int = 500, filters: Optional[TaskFilter] = None, start: int = 0
+    ) -> Iterator[Task]:
+        where = self._filters_to_where(filters)
+        offset = start
+        while True:
+            results = self._collection.get(where=where, limit=batch_size, offset=offset, include=["metadatas"])
+            metadatas_list = results.get('metadatas') or []
+            for meta in metadatas_list:
+                if meta is not None:
+                    yield self._metadata_to_task(cast(Dict[str, Any], meta))
+            if len(results["ids"]) < batch_size:
+                return
+            offset += batch_size
+
+    @timed(STORE_OPERATION_SECONDS, backend="chroma", operation="project_tasks")
+    def project_tasks(
+        self,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns only the requested fields, read straight from the stored metadata
+        without building `Task` objects. Dates are returned as ISO 8601 strings,
+        formatted as in full `Task` JSON.
+        """
+        validate_fields(fields)
+        return [
+            json_dates({field: meta.get(field) for field in fields})
+            for meta in self._get_page(limit, offset, filters)
+        ]
+
+
+def _created_at_key(metadata: Dict[str, Any]) -> float:
+    if "created_at_ts" in metadata:
+        return float(metadata["created_at_ts"])
+    return timestamp(datetime.fromisoformat(metadata["created_at"]))
+
 
+# --- Lazily created singletons ---
+@lru_cache(maxsize=1)
+def get_chroma_store() -> ChromaTaskStore:
+    """
+    Returns the production ChromaDB store. Its client and embedder are shared
+    with the agent's semantic extraction cache.
+    """
+    storage_settings = get_settings().storage
+    return ChromaTaskStore.for_production(
+        storage_settings.chroma_path,
+        embedder=create_embedder(storage_settings.embedding),
+        stats_save_every=storage_settings.stats.save_every_writes,
+        stats_save_interval=storage_settings.stats.save_interval_seconds,
+    )
 
-task_store = ChromaTaskStore.for_production()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_task_store() -> BaseTaskStore:
+    """
+    Returns the production task store, opening the database on first use. The
+    backend is chosen by `storage.backend`; reads are served through a
+    `CachingTaskStore` unless the read cache is disabled.
+    """
+    storage_settings = get_settings().storage
+    chroma_store = get_chroma_store()
+    store: BaseTaskStore = chroma_store
+    if storage_settings.backend == "sqlite":
+        store = SQLiteTaskStore(storage_settings.sqlite_path, vector_index=chroma_store)
+    if not storage_settings.read_cache.enabled:
+        return store
+    return CachingTaskStore(
+        store,
+        max_entries=storage_settings.read_cache.max_entries,
+        max_listed_tasks=storage_settings.read_cache.max_listed_tasks,
+    )
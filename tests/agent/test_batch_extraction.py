@@ -0,0 +1,69 @@
+import asyncio
+import re
+from typing import Any, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import PrivateAttr
+
+from src.agent.main_agent import TaskManagerAgent
+from src.llm.fake import FakeChatModel, FakeLLMError
+from src.models.task import Task
+
+_ITEM = re.compile(r"item-\d+")
+
+
+class EchoChatModel(FakeChatModel):
+    """Answers with a task titled after the `item-N` marker in the query, and fails queries marked `boom`."""
+    latency_seconds: float = 0.01
+
+    _in_flight: int = PrivateAttr(default=0)
+    _peak: int = PrivateAttr(default=0)
+
+    @property
+    def peak_concurrency(self) -> int:
+        return self._peak
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt = str(messages[-1].content)
+        self._in_flight += 1
+        self._peak = max(self._peak, self._in_flight)
+        try:
+            await asyncio.sleep(self.latency_seconds)
+        finally:
+            self._in_flight -= 1
+        if "boom" in prompt:
+            raise FakeLLMError("The model rejected the request", 400)
+        title = _ITEM.findall(prompt)[-1]
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f'{{"title": "{title}"}}'))])
+
+
+def test_batch_results_keep_input_order_and_isolate_failures():
+    agent = TaskManagerAgent(llm=EchoChatModel(), stream_llm_output=False)
+    queries = [f"plan item-{i}" for i in range(5)]
+    queries[2] = "boom item-2"
+
+    outcomes = asyncio.run(agent.create_tasks_from_texts(queries))
+
+    assert [outcome.title if isinstance(outcome, Task) else None for outcome in outcomes] == [
+        "item-0", "item-1", None, "item-3", "item-4"
+    ]
+    assert isinstance(outcomes[2], FakeLLMError)
+    assert asyncio.run(agent.create_tasks_from_texts([])) == []
+
+
+def test_batch_caps_concurrent_llm_calls():
+    llm = EchoChatModel()
+    agent = TaskManagerAgent(llm=llm, stream_llm_output=False, batch_max_concurrency=4)
+
+    asyncio.run(agent.create_tasks_from_texts([f"plan item-{i}" for i in range(8)], max_concurrency=2))
+    assert llm.peak_concurrency == 2
+
+    asyncio.run(agent.create_tasks_from_texts([f"plan item-{i}" for i in range(8)]))
+    assert llm.peak_concurrency == 4
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+import chromadb
+from chromadb.config import Settings
+
+from src.agent.extraction_cache import InMemoryExtractionCache, SemanticExtractionCache, date_terms, normalize_query
+from src.agent.main_agent import current_prompt_fingerprint
+from src.llm.fake import FakeChatModel
+from src.models.task import LLMTaskSchema
+from src.storage.embeddings import HashingEmbedder
+
+NOW = datetime(2025, 11, 8, 9, 30, tzinfo=timezone.utc)
+
+
+def test_normalize_query_ignores_case_and_punctuation():
+    assert normalize_query("  Buy groceries, TOMORROW! ") == "buy groceries tomorrow"
+
+
+def test_exact_hit_is_scoped_to_date_bucket():
+    """A cached extraction is only reused for queries resolved on the same day."""
+    cache = InMemoryExtractionCache(fingerprint="v1")
+    cache.put("Buy groceries tomorrow", NOW, LLMTaskSchema(title="Buy groceries"))
+
+    hit = cache.get("buy groceries tomorrow!", NOW + timedelta(hours=2))
+    miss = cache.get("buy groceries tomorrow", NOW + timedelta(days=1))
+
+    assert hit is not None and hit.title == "Buy groceries"
+    assert miss is None
+    assert cache.stats.exact_hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_lru_eviction_and_fingerprint_invalidation():
+    cache = InMemoryExtractionCache(fingerprint="v1", max_entries=2)
+    for title in ("first", "second", "third"):
+        cache.put(title, NOW, LLMTaskSchema(title=title))
+
+    assert cache.get("first", NOW) is None
+    assert cache.get("third", NOW) is not None
+    assert cache.stats.evictions == 1
+
+    cache.set_fingerprint("v2")
+    assert len(cache) == 0
+
+
+def test_time_of_day_queries_are_not_cached():
+    cache = InMemoryExtractionCache(fingerprint="v1")
+    cache.put("call mom in 2 hours", NOW, LLMTaskSchema(title="Call mom"))
+
+    assert cache.get("call mom in 2 hours", NOW) is None
+
+
+def test_date_terms_keep_the_words_that_select_a_due_date():
+    assert date_terms("Call mom TOMORROW at 5") == "tomorrow 5"
+    assert date_terms("Renew gym membership next Friday") == "next friday"
+    assert date_terms("Buy groceries") == ""
+
+
+def test_semantic_hits_use_the_shared_embedder_and_keep_date_words():
+    client = chromadb.EphemeralClient(Settings(allow_reset=True))
+    try:
+        cache = SemanticExtractionCache(client, HashingEmbedder(), fingerprint="v1", similarity_threshold=0.7)
+        cache.put("Buy groceries for the party tomorrow", NOW, LLMTaskSchema(title="Buy groceries"))
+
+        hit = cache.get("please buy the groceries for the party tomorrow", NOW)
+        other_day = cache.get("please buy the groceries for the party today", NOW)
+
+        assert hit is not None and hit.title == "Buy groceries"
+        assert other_day is None
+        assert cache.stats.semantic_hits == 1
+
+        # Vectors from a different embedder are not comparable, so the collection starts over.
+        reopened = SemanticExtractionCache(client, HashingEmbedder(dimensions=64), fingerprint="v1")
+        assert reopened.get("please buy the groceries for the party tomorrow", NOW) is None
+    finally:
+        client.reset()
+
+
+def test_prompt_fingerprint_depends_on_json_mode():
+    llm = FakeChatModel(responses=["{}"])
+    assert current_prompt_fingerprint(llm, "compact", json_mode=True) != current_prompt_fingerprint(llm, "compact")
@@ -0,0 +1,99 @@
+import asyncio
+
+import httpx
+
+from src.agent.job_runner import TaskJobRunner
+from src.agent.main_agent import TaskManagerAgent
+from src.api import endpoints
+from src.llm.fake import FakeChatModel
+from src.llm.gateway import LLMGateway, ModelRoute
+from src.llm.resilience import RetryPolicy
+from src.storage.async_store import AsyncTaskStore
+from src.storage.job_queue import SQLiteJobQueue
+from src.storage.sqlite_store import SQLiteTaskStore
+
+
+def make_runner(llm) -> TaskJobRunner:
+    queue = SQLiteJobQueue()
+    agent = TaskManagerAgent(llm=llm, stream_llm_output=False)
+    store = AsyncTaskStore(SQLiteTaskStore.for_testing(), max_workers=2)
+    return TaskJobRunner(lambda: queue, lambda: agent, lambda: store, workers=2, poll_interval_seconds=0.05, retry_delay_seconds=0)
+
+
+def test_async_create_returns_job_that_can_be_long_polled():
+    runner = make_runner(FakeChatModel(responses=['{"title": "Email Bob", "category": "Work"}']))
+    endpoints.app.dependency_overrides[endpoints.get_job_runner] = lambda: runner
+    endpoints.app.dependency_overrides[endpoints.job_runner_provider] = lambda: lambda: runner
+    endpoints.app.dependency_overrides[endpoints.get_task_agent] = runner._agent_provider
+    endpoints.app.dependency_overrides[endpoints.get_async_task_store] = runner._store_provider
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=endpoints.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            queued = await client.post("/task/create?async=true&priority=2", json={"query": "email bob"})
+            polled = await client.get(f"/jobs/{queued.json()['id']}", params={"wait": 5})
+            missing = await client.get("/jobs/unknown")
+        stored = await runner._store_provider().list_tasks()
+        await runner.stop()
+        return queued, polled, missing, stored
+
+    try:
+        queued, polled, missing, stored = asyncio.run(scenario())
+    finally:
+        endpoints.app.dependency_overrides.clear()
+
+    assert queued.status_code == 202 and queued.headers["location"] == f"/jobs/{queued.json()['id']}"
+    assert queued.json()["status"] == "queued" and queued.json()["priority"] == 2
+    assert polled.json()["status"] == "succeeded" and polled.json()["task"]["title"] == "Email Bob"
+    assert [task.title for task in stored] == ["Email Bob"]
+    assert missing.status_code == 404
+
+
+def test_jobs_are_retried_while_the_llm_is_unavailable():
+    # The gateway gives up on the first call; the job is queued again and succeeds on its next attempt.
+    flaky = FakeChatModel(failures=1, responses=['{"title": "Book flights"}'])
+    runner = make_runner(LLMGateway(routes=[ModelRoute(flaky)], retry=RetryPolicy(max_attempts=1)))
+
+    async def scenario():
+        await runner.start()
+        job, _ = await runner.submit("book flights")
+        finished = await runner.wait(job.id, timeout=5)
+        await runner.stop()
+        return finished
+
+    finished = asyncio.run(scenario())
+
+    assert finished.status == "succeeded" and finished.attempts == 2
+    assert flaky.calls == 2
+
+
+def test_duplicates_fail_and_workers_survive_queue_errors():
+    runner = make_runner(FakeChatModel(responses=['{"title": "Water plants"}']))
+    queue = runner.queue
+    complete = queue.complete
+    calls = []
+
+    def flaky_complete(job_id, task):
+        # The first outcome cannot be recorded, as if the database were locked.
+        calls.append(job_id)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        complete(job_id, task)
+
+    queue.complete = flaky_complete
+
+    async def scenario():
+        await runner.start()
+        first, _ = await runner.submit("water plants")
+        await asyncio.sleep(0.2)
+        second, _ = await runner.submit("please water the plants")
+        finished = await runner.wait(second.id, timeout=5)
+        alive = all(not worker.done() for worker in runner._worker_tasks)
+        await runner.stop()
+        return first, finished, alive
+
+    first, finished, alive = asyncio.run(scenario())
+
+    assert alive
+    assert queue.get(first.id).status == "running"
+    assert finished.status == "failed" and "already exists" in finished.error
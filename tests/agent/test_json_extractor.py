@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agent.json_extractor import IncrementalJSONExtractor, extract_json_object
+from src.agent.main_agent import TaskManagerAgent, validate_task_json
+
+
+def test_extracts_first_balanced_object_across_chunks():
+    """Tests braces, quotes and escapes inside strings are handled across chunk boundaries."""
+    text = 'Sure! {"title": "Fix {the} \\"parser\\\\", "description": "a}b"} and {"title": "second"}'
+    expected = '{"title": "Fix {the} \\"parser\\\\", "description": "a}b"}'
+
+    for size in (1, 2, 3, 7, len(text)):
+        extractor = IncrementalJSONExtractor()
+        results = [extractor.feed(text[i:i + size]) for i in range(0, len(text), size)]
+        completed = next(i for i, result in enumerate(results) if result is not None)
+
+        assert results[completed] == expected
+        # The object is reported as soon as its closing brace has been fed.
+        assert completed == (len(expected) + len("Sure! ") - 1) // size
+
+
+def test_extract_json_object_requires_a_complete_object():
+    assert extract_json_object('```json\n{"title": "x"}\n```') == '{"title": "x"}'
+    with pytest.raises(ValueError):
+        extract_json_object('{"title": "truncated')
+    with pytest.raises(ValueError):
+        extract_json_object("No task here.")
+
+
+def test_validate_task_json_ignores_application_controlled_fields():
+    task = validate_task_json('{"title": "Call mom", "priority": "High", "id": "forged", "is_completed": true}')
+
+    assert task.title == "Call mom" and task.priority == "High"
+    assert task.id != "forged" and not task.is_completed
+    with pytest.raises(ValueError):
+        validate_task_json('{"title": "Call mom", "priority": "Whenever"}')
+
+
+@pytest.mark.parametrize("stream_llm_output", [True, False])
+def test_agent_ignores_chatter_after_the_json_object(stream_llm_output):
+    """Tests trailing text with braces does not break extraction, streamed or not."""
+    llm = FakeListChatModel(responses=['{"title": "Go for a run", "category": "Fitness"} Let me know {if} needed!'])
+    agent = TaskManagerAgent(llm=llm, stream_llm_output=stream_llm_output)
+
+    task = agent.create_task_from_text("I should go for a run")
+    async_task = asyncio.run(agent.acreate_task_from_text("I should go for a run"))
+
+    assert task.title == async_task.title == "Go for a run"
+    assert task.category == "Fitness" and task.priority == "Medium"
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agent.main_agent import TaskManagerAgent, validate_task_list_json
+
+MULTI_TASK_OUTPUT = (
+    'Here are the tasks:\n```json\n{"tasks": ['
+    '{"title": "Email Bob", "category": "Work"}, '
+    '{"title": "Book flights", "priority": "High", "due_date": "2025-11-14T09:00:00Z"}, '
+    '{"title": "Renew gym membership", "category": "Gym"}, '
+    '"not a task"'
+    ']}\n```'
+)
+
+
+def test_invalid_items_are_dropped_and_valid_ones_kept():
+    extraction = validate_task_list_json(MULTI_TASK_OUTPUT[MULTI_TASK_OUTPUT.index("{"):MULTI_TASK_OUTPUT.rindex("}") + 1])
+
+    assert [task.title for task in extraction.tasks] == ["Email Bob", "Book flights"]
+    assert extraction.tasks[1].due_date is not None
+    assert len(extraction.rejected) == 2
+    assert extraction.rejected[0].startswith("Item 2: category")
+
+    with pytest.raises(ValueError):
+        validate_task_list_json('{"title": "Email Bob"}')
+
+
+@pytest.mark.parametrize("stream_llm_output", [True, False])
+def test_agent_extracts_many_tasks_with_one_llm_call(stream_llm_output):
+    llm = FakeListChatModel(responses=[MULTI_TASK_OUTPUT, '{"tasks": []}'])
+    agent = TaskManagerAgent(llm=llm, stream_llm_output=stream_llm_output)
+
+    extraction = agent.extract_tasks_from_text("email Bob, book flights for Friday, and renew gym membership")
+    empty = asyncio.run(agent.aextract_tasks_from_text("nothing to do"))
+
+    assert len(extraction.tasks) == 2 and len(extraction.rejected) == 2
+    assert empty.tasks == [] and empty.rejected == []
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.agent.main_agent import TaskManagerAgent
+from src.agent.prompt_templates import PROMPT_STYLES
+from src.llm.fake import FakeChatModel
+
+
+def test_compact_prompt_keeps_a_static_prefix_within_a_day():
+    """Tests the compact prompt changes only at its end, and only daily apart from the query."""
+    agent = TaskManagerAgent(llm=FakeChatModel(), prompt_style="compact")
+    morning = agent._format_prompt(agent.prompts.task, "Buy milk", datetime(2025, 11, 8, 9, 15, tzinfo=timezone.utc))
+    evening = agent._format_prompt(agent.prompts.task, "Call mom", datetime(2025, 11, 8, 21, 40, tzinfo=timezone.utc))
+
+    morning_text, evening_text = morning.to_string(), evening.to_string()
+    assert morning_text.endswith("Today: 2025-11-08 (Saturday)\nQuery: Buy milk")
+    assert morning_text.rsplit("Query:", 1)[0] == evening_text.rsplit("Query:", 1)[0]
+    # The compact prompt is a fraction of the verbose one, which inlines the JSON schema.
+    verbose = PROMPT_STYLES["verbose"].task.format(query="Buy milk", current_date="2025-11-08")
+    assert len(morning_text) < len(verbose) / 3
+
+
+@pytest.mark.parametrize("stream_llm_output", [True, False])
+def test_json_mode_passes_the_task_schema_to_the_llm(stream_llm_output):
+    llm = FakeChatModel(responses=['{"title": "Buy milk", "category": "Personal"}', '{"tasks": [{"title": "Call mom"}]}'])
+    agent = TaskManagerAgent(llm=llm, prompt_style="compact", json_mode=True, stream_llm_output=stream_llm_output)
+
+    task = agent.create_task_from_text("buy milk")
+    extraction = agent.extract_tasks_from_text("call mom")
+
+    assert task.title == "Buy milk" and [t.title for t in extraction.tasks] == ["Call mom"]
+    assert agent._task_llm.kwargs["response_mime_type"] == "application/json"
+    assert "tasks" in agent._task_list_llm.kwargs["response_json_schema"]["properties"]
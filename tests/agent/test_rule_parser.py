@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+
+from src.agent.rule_parser import RuleBasedTaskParser
+
+# A Saturday afternoon, so weekday and "tomorrow" resolution is easy to follow.
+NOW = datetime(2025, 11, 8, 17, 0, tzinfo=timezone.utc)
+
+
+def test_parses_formulaic_query_with_high_confidence():
+    result = RuleBasedTaskParser().parse("urgent: call dentist tomorrow 3pm", NOW)
+
+    assert result is not None
+    assert result.confidence >= 0.8
+    assert result.task.title == "Call dentist"
+    assert result.task.priority == "Urgent"
+    assert result.task.category == "Personal"
+    assert result.task.due_date == datetime(2025, 11, 9, 15, 0, tzinfo=timezone.utc)
+
+
+def test_resolves_weekday_and_absolute_dates():
+    parser = RuleBasedTaskParser()
+
+    weekday = parser.parse("Finish the quarterly report by friday", NOW)
+    absolute = parser.parse("submit assignment 2025-11-20 at 9am", NOW)
+
+    assert weekday is not None and weekday.task.due_date == datetime(2025, 11, 14, 23, 59, 59, tzinfo=timezone.utc)
+    assert weekday.task.category == "Work"
+    assert absolute is not None and absolute.task.due_date == datetime(2025, 11, 20, 9, 0, tzinfo=timezone.utc)
+
+
+def test_complex_queries_get_low_confidence():
+    parser = RuleBasedTaskParser(max_words=12)
+
+    multi_task = parser.parse("email Bob, book flights for Friday, and renew gym membership", NOW)
+    recurring = parser.parse("every monday gym", NOW)
+    too_long = parser.parse(" ".join(["word"] * 13), NOW)
+
+    assert multi_task is not None and multi_task.confidence < 0.8
+    assert recurring is not None and recurring.confidence < 0.8
+    assert too_long is None
@@ -0,0 +1,177 @@
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, Optional
+
+import chromadb
+import pytest
+from chromadb.config import Settings
+from fastapi.testclient import TestClient
+
+from src.agent.main_agent import TaskManagerAgent
+from src.api.endpoints import app, get_async_task_store, get_task_agent, job_runner_provider
+from src.models.task import Task
+from src.storage.async_store import AsyncTaskStore
+from src.storage.base_store import BaseTaskStore
+from src.storage.caching_store import CachingTaskStore
+from src.storage.embeddings import HashingEmbedder
+from src.storage.sqlite_store import SQLiteTaskStore
+from src.storage.vector_store import ChromaTaskStore
+from tests.agent.test_batch_extraction import EchoChatModel
+
+
+class FailingWriteStore(SQLiteTaskStore):
+    """Refuses to write any batch that contains a task titled `item-1`."""
+    def add_tasks(
+        self, tasks: Iterable[Task], chunk_size: int = 500, on_progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        tasks = list(tasks)
+        if any(task.title == "item-1" for task in tasks):
+            raise OSError("disk full")
+        return super().add_tasks(tasks, chunk_size=chunk_size, on_progress=on_progress)
+
+
+@contextmanager
+def api_client(store: BaseTaskStore) -> Iterator[TestClient]:
+    """A client for the app, with the echo model behind the agent and `store` behind the API."""
+    async_store = AsyncTaskStore(store, max_workers=2)
+    agent = TaskManagerAgent(llm=EchoChatModel(), stream_llm_output=False)
+    app.dependency_overrides[get_async_task_store] = lambda: async_store
+    app.dependency_overrides[get_task_agent] = lambda: agent
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        async_store.shutdown()
+
+
+@pytest.fixture
+def store() -> Iterator[CachingTaskStore]:
+    """The production layering: the read cache over SQLite, with an in-memory ChromaDB vector index."""
+    client = chromadb.EphemeralClient(settings=Settings(allow_reset=True))
+    yield CachingTaskStore(SQLiteTaskStore.for_testing(vector_index=ChromaTaskStore(client=client, embedder=HashingEmbedder())))
+    client.reset()
+
+
+def _tasks() -> list[Task]:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        Task(title="Email Bob", category="Work", created_at=base, due_date=base + timedelta(days=1)),
+        Task(title="Book flights", category="Personal", created_at=base + timedelta(hours=1)),
+        Task(title="Renew gym membership", category="Fitness", created_at=base + timedelta(hours=2), is_completed=True),
+    ]
+
+
+def test_create_task_never_builds_the_job_runner_for_synchronous_requests(store: CachingTaskStore):
+    def no_runner():
+        raise AssertionError("The job runner was built for a synchronous request")
+
+    with api_client(store) as client:
+        app.dependency_overrides[job_runner_provider] = lambda: no_runner
+        response = client.post("/task/create", json={"query": "plan item-7"})
+
+    assert response.status_code == 200 and response.json()["title"] == "item-7"
+    assert [task.title for task in store.list_tasks()] == ["item-7"]
+
+
+def test_list_tasks_pages_filters_and_projects(store: CachingTaskStore):
+    tasks = _tasks()
+    store.add_tasks(tasks)
+    with api_client(store) as client:
+        page = client.get("/tasks", params={"limit": 2, "offset": 1})
+        everything = client.get("/tasks")
+        work = client.get("/tasks", params={"category": "Work"})
+        projected = client.get("/tasks", params={"fields": "id,title", "limit": 1})
+        unknown_field = client.get("/tasks", params={"fields": "id,colour"})
+
+    assert page.headers["content-type"] == "application/json"
+    assert [task["title"] for task in page.json()] == ["Book flights", "Email Bob"]
+    assert [Task.model_validate(task) for task in everything.json()] == list(reversed(tasks))
+    assert [task["id"] for task in work.json()] == [tasks[0].id]
+    assert projected.json() == [{"id": tasks[2].id, "title": "Renew gym membership"}]
+    assert unknown_field.status_code == 400
+
+
+def test_stats_search_and_duplicates(store: CachingTaskStore):
+    store.add_tasks(_tasks())
+    with api_client(store) as client:
+        stats = client.get("/tasks/stats", params={"due_soon_days": 3})
+        bad_window = client.get("/tasks/stats", params={"due_soon_days": 0})
+        search = client.get("/tasks/search", params=[("q", "email bob"), ("q", "gym"), ("k", 1)])
+        duplicates = client.post("/tasks/duplicates", json={"titles": ["email bob", "Walk the dog"]})
+
+    assert stats.status_code == 200
+    assert (stats.json()["total"], stats.json()["completed"], stats.json()["due_soon_days"]) == (3, 1, 3)
+    assert bad_window.status_code == 422
+    assert [result["query"] for result in search.json()] == ["email bob", "gym"]
+    assert search.json()[0]["results"][0]["task"]["title"] == "Email Bob"
+    assert [result["exists"] for result in duplicates.json()] == [True, False]
+
+
+def test_export_streams_ndjson_and_resumes_sse(store: CachingTaskStore):
+    tasks = _tasks()
+    store.add_tasks(tasks)
+    with api_client(store) as client:
+        ndjson = client.get("/tasks/export", params={"cursor": 1})
+        sse = client.get("/tasks/export", params={"format": "sse"}, headers={"Last-Event-ID": "2"})
+
+    assert ndjson.headers["x-export-cursor"] == "1"
+    assert [json.loads(line)["title"] for line in ndjson.text.splitlines()] == ["Book flights", "Renew gym membership"]
+    events = [event for event in sse.text.split("\n\n") if event]
+    assert events[0].startswith("id: 3\nevent: task") and events[-1] == 'id: 3\nevent: end\ndata: {"cursor": 3}'
+
+
+def test_update_and_delete_routes(store: CachingTaskStore):
+    tasks = _tasks()
+    store.add_tasks(tasks)
+    with api_client(store) as client:
+        renamed = client.patch(f"/tasks/{tasks[0].id}", json={"title": "Email Alice"})
+        missing = client.patch("/tasks/unknown", json={"title": "Nobody"})
+        completed = client.patch("/tasks", json={"ids": [tasks[1].id, "unknown"]})
+        deleted = client.delete(f"/tasks/{tasks[2].id}")
+        deleted_again = client.delete(f"/tasks/{tasks[2].id}")
+        bulk = client.delete("/tasks", params=[("id", tasks[0].id), ("id", "unknown")])
+
+    assert renamed.json()["title"] == "Email Alice" and missing.status_code == 404
+    assert completed.json() == {"updated": [tasks[1].id], "missing": ["unknown"]}
+    assert (deleted.status_code, deleted_again.status_code) == (204, 404)
+    assert bulk.json() == {"deleted": [tasks[0].id], "missing": ["unknown"]}
+    assert [task.id for task in store.list_tasks()] == [tasks[1].id]
+
+
+def test_metrics_and_store_stats(store: CachingTaskStore):
+    with api_client(store) as client:
+        client.get("/tasks/stats")
+        store_stats = client.get("/store/stats")
+        metrics = client.get("/metrics")
+
+    assert store_stats.json()["read_cache"] is not None
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert 'route="/tasks/stats"' in metrics.text and "store_operation_duration_seconds" in metrics.text
+
+
+def test_batch_create_reports_each_query_in_order():
+    store = SQLiteTaskStore.for_testing()
+    with api_client(store) as client:
+        response = client.post("/tasks/batch", json={"queries": ["plan item-0", "boom item-1", "plan item-2"]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert [result["success"] for result in body["results"]] == [True, False, True]
+    assert body["results"][2]["task"]["title"] == "item-2" and body["results"][1]["error"]
+    assert sorted(task.title for task in store.list_tasks()) == ["item-0", "item-2"]
+
+
+def test_batch_create_reports_write_failures_per_task():
+    store = FailingWriteStore.for_testing()
+    with api_client(store) as client:
+        response = client.post("/tasks/batch", json={"queries": [f"plan item-{i}" for i in range(3)]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    failed = body["results"][1]
+    assert not failed["success"] and failed["task"]["title"] == "item-1"
+    assert failed["error"] == "Could not save the task: disk full"
+    assert sorted(task.title for task in store.list_tasks()) == ["item-0", "item-2"]
@@ -0,0 +1,46 @@
+import json
+import logging
+import queue
+
+from src.core.logging_config import (
+    CorrelationIdFilter,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    reset_correlation_id,
+    set_correlation_id,
+)
+
+
+def test_queued_records_are_formatted_as_json_with_correlation_id():
+    """Tests records keep their correlation id, arguments and extra fields across the queue."""
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(CorrelationIdFilter())
+    logger = logging.getLogger("tests.logging_config")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    token = set_correlation_id("req-123")
+    try:
+        logger.info("Processing query: '%s'", "Call mom", extra={"source": "llm"})
+    finally:
+        reset_correlation_id(token)
+        logger.removeHandler(handler)
+
+    entry = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+    assert entry["message"] == "Processing query: 'Call mom'"
+    assert entry["level"] == "INFO"
+    assert entry["correlation_id"] == "req-123"
+    assert entry["source"] == "llm"
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.makeLogRecord({"msg": "hello"})
+
+    handler.handle(record)
+    handler.handle(record)
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
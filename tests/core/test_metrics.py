@@ -0,0 +1,84 @@
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.agent.main_agent import TaskManagerAgent
+from src.core.metrics import (
+    AGENT_PARSE_FAILURES,
+    AGENT_STAGE_SECONDS,
+    LLM_TOKENS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    timed,
+)
+
+
+def sample_value(metric, suffix: str, **labels: str) -> float:
+    for sample_suffix, sample_labels, value in metric.samples():
+        if sample_suffix == suffix and sample_labels == labels:
+            return value
+    return 0.0
+
+
+def test_render_prometheus_text_format():
+    """Tests counters, histograms and collectors are rendered in the exposition format."""
+    registry = MetricsRegistry()
+    requests = Counter("requests", "Handled requests.", ["route"])
+    latency = Histogram("latency_seconds", "Request latency.", buckets=(0.1, 1.0))
+    registry.register(requests)
+    registry.register(latency)
+    registry.register_collector("cache_lookups", "counter", "Cache lookups.", lambda: [("_total", {"result": "hit"}, 3)])
+
+    requests.labels(route='/tasks/{task_id}').inc()
+    requests.labels(route='/tasks/{task_id}').inc(2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    with latency.time():
+        pass
+
+    lines = registry.render().splitlines()
+    assert "# TYPE requests counter" in lines
+    assert 'requests_total{route="/tasks/{task_id}"} 3' in lines
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines
+    assert 'cache_lookups_total{result="hit"} 3' in lines
+
+
+def test_labelled_metric_requires_labels_and_timed_records_calls():
+    histogram = Histogram("operation_seconds", "Operation latency.", ["operation"])
+    with pytest.raises(ValueError):
+        histogram.observe(1.0)
+
+    @timed(histogram, operation="noop")
+    def noop(value: int) -> int:
+        return value
+
+    assert noop(7) == 7
+    assert sample_value(histogram, "_count", operation="noop") == 1
+
+
+def test_agent_records_stages_tokens_and_parse_failures():
+    """Tests the agent times each stage, counts LLM tokens and labels parse failures."""
+    llm = GenericFakeChatModel(messages=iter([
+        AIMessage(
+            content='{"title": "Write the report", "category": "Work", "priority": "High"}',
+            usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150},
+        ),
+        AIMessage(content="I could not find a task in that."),
+    ]))
+    agent = TaskManagerAgent(llm=llm, stream_llm_output=False)
+    llm_calls = sample_value(AGENT_STAGE_SECONDS, "_count", stage="llm_call")
+    input_tokens = sample_value(LLM_TOKENS, "_total", type="input")
+    sanitize_failures = sample_value(AGENT_PARSE_FAILURES, "_total", stage="sanitize")
+
+    assert agent.create_task_from_text("Write the report").title == "Write the report"
+    with pytest.raises(ValueError):
+        agent.create_task_from_text("Hmm")
+
+    assert sample_value(AGENT_STAGE_SECONDS, "_count", stage="llm_call") == llm_calls + 2
+    assert sample_value(LLM_TOKENS, "_total", type="input") == input_tokens + 120
+    assert sample_value(AGENT_PARSE_FAILURES, "_total", stage="sanitize") == sanitize_failures + 1
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from src.agent.main_agent import TaskManagerAgent
+from src.llm.fake import FakeChatModel
+from src.llm.gateway import LLMGateway, ModelRoute
+from src.llm.resilience import CircuitBreaker, LLMUnavailableError, RetryPolicy, TokenBucket
+
+NO_BACKOFF = RetryPolicy(max_attempts=2, base_delay_seconds=0.0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_and_circuit_breaker():
+    """Tests the bucket allows bursts then paces callers, and the breaker opens, half-opens and closes."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    assert bucket._reserve(None) == 0 and bucket._reserve(None) == 0
+    assert bucket._reserve(None) == pytest.approx(0.5)
+    with pytest.raises(TimeoutError):
+        bucket._reserve(timeout=0.1)
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    clock.now += 10
+    assert breaker.allow() and not breaker.allow()  # A single trial call.
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize("stream_llm_output", [True, False])
+def test_gateway_retries_then_fails_over_to_fallback_model(stream_llm_output):
+    """Tests rate-limited calls are retried on the primary model, then served by the fallback."""
+    primary = FakeChatModel(model="primary", failures=10, failure_status=429)
+    fallback = FakeChatModel(model="fallback", responses=['{"tasks": [{"title": "Email Bob"}, {"title": "Book flights"}]}'])
+    gateway = LLMGateway(routes=[ModelRoute(primary), ModelRoute(fallback)], retry=NO_BACKOFF)
+    agent = TaskManagerAgent(llm=gateway, stream_llm_output=stream_llm_output)
+
+    extraction = agent.extract_tasks_from_text("email Bob and book flights")
+
+    assert [task.title for task in extraction.tasks] == ["Email Bob", "Book flights"]
+    assert primary.calls == 2 and fallback.calls == 1
+
+
+def test_gateway_raises_non_retryable_errors_and_reports_outages():
+    """Tests invalid requests are not retried, and an open circuit fails fast with a retry hint."""
+    bad_request = FakeChatModel(model="primary", failures=1, failure_status=400)
+    fallback = FakeChatModel(model="fallback")
+    gateway = LLMGateway(routes=[ModelRoute(bad_request), ModelRoute(fallback)], retry=NO_BACKOFF)
+    with pytest.raises(Exception) as info:
+        gateway.invoke("hello")
+    assert getattr(info.value, "status_code", None) == 400 and fallback.calls == 0
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    down = FakeChatModel(model="primary", failures=10)
+    gateway = LLMGateway(routes=[ModelRoute(down, breaker=breaker)], retry=NO_BACKOFF)
+    with pytest.raises(LLMUnavailableError):
+        gateway.invoke("hello")
+    # The open circuit now rejects calls without reaching the model.
+    with pytest.raises(LLMUnavailableError) as info:
+        asyncio.run(gateway.ainvoke("hello"))
+    assert down.calls == 1 and info.value.retry_after > 0
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_gateway_times_out_slow_models(use_async):
+    """Tests a slow model is abandoned after the per-attempt timeout, and the deadline bounds the whole call."""
+    slow = FakeChatModel(model="slow", latency_seconds=1.0)
+    fast = FakeChatModel(model="fast")
+    gateway = LLMGateway(routes=[ModelRoute(slow), ModelRoute(fast)], retry=RetryPolicy(max_attempts=1), timeout_seconds=0.05)
+
+    message = asyncio.run(gateway.ainvoke("hello")) if use_async else gateway.invoke("hello")
+
+    assert message.content and fast.calls == 1
+
+    gateway = LLMGateway(routes=[ModelRoute(slow)], retry=NO_BACKOFF, deadline_seconds=0.05)
+    with pytest.raises(LLMUnavailableError):
+        asyncio.run(gateway.ainvoke("hello")) if use_async else gateway.invoke("hello")
+
+
+def test_gateway_gives_back_a_cancelled_half_open_trial():
+    """Tests a half-open trial that is cancelled re-opens the circuit, so the next call can make the trial."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 30
+    slow = FakeChatModel(model="slow", latency_seconds=1.0)
+    gateway = LLMGateway(routes=[ModelRoute(slow, breaker=breaker)], retry=NO_BACKOFF, timeout_seconds=None)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(gateway.ainvoke("hello"), timeout=0.05))
+
+    assert breaker.state == CircuitBreaker.OPEN and breaker.allow()
@@ -0,0 +1,39 @@
+import asyncio
+
+import chromadb
+import pytest
+from collections.abc import Iterator
+from chromadb.config import Settings
+
+from src.storage.async_store import AsyncTaskStore
+from src.storage.embeddings import HashingEmbedder
+from src.storage.vector_store import ChromaTaskStore
+from src.models.task import Task
+
+@pytest.fixture
+def async_store() -> Iterator[AsyncTaskStore]:
+    """Wraps an isolated, in-memory ChromaTaskStore in the async facade."""
+    ephemeral_client = chromadb.EphemeralClient(settings=Settings(allow_reset=True))
+    store = AsyncTaskStore(ChromaTaskStore(client=ephemeral_client, embedder=HashingEmbedder()), max_workers=2)
+
+    yield store
+
+    store.shutdown()
+    ephemeral_client.reset()
+
+
+def test_async_add_get_and_list(async_store: AsyncTaskStore):
+    """Tests that concurrent calls through the facade reach the wrapped store."""
+    tasks = [Task(title=f"Async Task {i}", description=None, due_date=None) for i in range(4)]
+
+    async def scenario():
+        await asyncio.gather(*(async_store.add_task(task) for task in tasks))
+        retrieved = await async_store.get_task(tasks[0].id)
+        listed = await async_store.list_tasks()
+        return retrieved, listed
+
+    retrieved, listed = asyncio.run(scenario())
+
+    assert retrieved is not None
+    assert retrieved.id == tasks[0].id
+    assert {t.id for t in listed} == {t.id for t in tasks}
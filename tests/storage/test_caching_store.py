@@ -0,0 +1,130 @@
+import chromadb
+import pytest
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from chromadb.config import Settings
+from pydantic import TypeAdapter
+
+from src.storage.caching_store import CachingTaskStore
+from src.storage.embeddings import HashingEmbedder
+from src.storage.vector_store import ChromaTaskStore
+from src.models.task import Task, TaskFilter
+
+@pytest.fixture
+def caching_store() -> Iterator[CachingTaskStore]:
+    """Wraps an isolated, in-memory ChromaTaskStore in the read cache."""
+    ephemeral_client = chromadb.EphemeralClient(settings=Settings(allow_reset=True))
+    yield CachingTaskStore(ChromaTaskStore(client=ephemeral_client, embedder=HashingEmbedder()), max_entries=16)
+    ephemeral_client.reset()
+
+
+def _tasks(count: int) -> list[Task]:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        Task(title=f"Cached Task {i}", description=None, due_date=None, created_at=base + timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+
+def test_repeated_reads_are_served_from_cache(caching_store: CachingTaskStore):
+    """Tests that only the first get and list reach the wrapped store."""
+    tasks = _tasks(3)
+    caching_store.add_tasks(tasks)
+    caching_store.invalidate()
+
+    first = caching_store.list_tasks()
+    second = caching_store.list_tasks(limit=2, offset=1)
+    assert [t.id for t in first] == [t.id for t in reversed(tasks)]
+    assert [t.id for t in second] == [tasks[1].id, tasks[0].id]
+
+    assert caching_store.get_task(tasks[0].id).title == "Cached Task 0"
+    assert caching_store.get_task("missing") is None
+
+    stats = caching_store.stats
+    assert stats.list_misses == 1 and stats.list_hits == 1
+    assert stats.task_hits == 2 and stats.task_misses == 0
+
+
+def test_writes_patch_the_snapshot_in_place(caching_store: CachingTaskStore):
+    """Tests that adds and replacements keep cached listings consistent with the store."""
+    tasks = _tasks(3)
+    caching_store.add_tasks(tasks[:2])
+    caching_store.list_tasks()
+
+    caching_store.add_task(tasks[2])
+    replaced = tasks[0].model_copy(update={"title": "Renamed Task"})
+    caching_store.add_task(replaced)
+
+    cached = caching_store.list_tasks()
+    assert [t.id for t in cached] == [tasks[2].id, tasks[1].id, tasks[0].id]
+    assert cached[-1].title == "Renamed Task"
+    assert caching_store.get_task(tasks[0].id).title == "Renamed Task"
+    assert caching_store.stats.list_misses == 1
+    assert [t.id for t in caching_store.store.list_tasks()] == [t.id for t in cached]
+
+
+def test_filtered_reads_bypass_cache(caching_store: CachingTaskStore):
+    """Tests that filtered listings and backend-specific methods go to the wrapped store."""
+    tasks = _tasks(2)
+    tasks[0].category = "Work"
+    caching_store.add_tasks(tasks)
+
+    work = caching_store.list_tasks(filters=TaskFilter(category="Work"))
+    assert [t.id for t in work] == [tasks[0].id]
+    assert caching_store.stats.list_misses == 0
+    assert caching_store.find_near_duplicates(["Cached Task 1"], threshold=0.99)[0]
+
+
+def test_updates_and_deletes_keep_cache_in_sync(caching_store: CachingTaskStore):
+    """Tests that cached reads reflect updates and deletions without a reload."""
+    tasks = _tasks(3)
+    caching_store.add_tasks(tasks)
+    caching_store.list_tasks()
+
+    caching_store.complete_tasks([tasks[0].id])
+    caching_store.delete_tasks([tasks[1].id])
+
+    cached = caching_store.list_tasks()
+    assert [t.id for t in cached] == [tasks[2].id, tasks[0].id]
+    assert caching_store.get_task(tasks[0].id).is_completed
+    assert caching_store.get_task(tasks[1].id) is None
+    assert caching_store.stats.list_misses == 1
+
+
+def test_json_listings_reuse_encoded_tasks_and_follow_writes(caching_store: CachingTaskStore):
+    """Tests that JSON listings match `list_tasks` before and after writes replace encoded tasks."""
+    tasks = _tasks(3)
+    caching_store.add_tasks(tasks)
+
+    def decoded(**kwargs) -> list[Task]:
+        return TypeAdapter(list[Task]).validate_json(caching_store.list_tasks_json(**kwargs))
+
+    assert decoded() == caching_store.list_tasks()
+    assert decoded(limit=1, offset=1) == [caching_store.get_task(tasks[1].id)]
+
+    caching_store.complete_tasks([tasks[0].id])
+    caching_store.delete_tasks([tasks[2].id])
+    assert decoded() == caching_store.list_tasks()
+    assert decoded()[-1].is_completed
+    assert decoded(filters=TaskFilter(is_completed=True)) == [caching_store.get_task(tasks[0].id)]
+
+
+def test_pages_are_read_from_the_store_and_the_snapshot_is_bounded(caching_store: CachingTaskStore):
+    """Tests that pages never load the snapshot, and listings larger than `max_listed_tasks` are not kept."""
+    tasks = _tasks(3)
+    caching_store.add_tasks(tasks)
+
+    assert [t.id for t in caching_store.list_tasks(limit=2)] == [tasks[2].id, tasks[1].id]
+    assert caching_store.list_tasks_json(limit=1, offset=2) == caching_store.store.list_tasks_json(limit=1, offset=2)
+    assert caching_store._snapshot is None
+
+    bounded = CachingTaskStore(caching_store.store, max_listed_tasks=2)
+    assert len(bounded.list_tasks()) == 3
+    assert bounded._snapshot is None and bounded.stats.list_misses == 1
+
+    small = CachingTaskStore(caching_store.store, max_listed_tasks=4)
+    small.list_tasks()
+    small.add_task(Task(title="Fourth"))
+    assert small._snapshot is not None
+    small.add_task(Task(title="Fifth"))
+    assert small._snapshot is None and len(small.list_tasks(limit=10)) == 5
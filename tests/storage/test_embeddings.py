@@ -0,0 +1,68 @@
+from typing import List
+
+import chromadb
+import numpy as np
+from chromadb.config import Settings
+
+from src.storage.embeddings import CachedEmbedder, HashingEmbedder
+from src.storage.vector_store import ChromaTaskStore
+from src.models.task import Task, TaskUpdate
+
+
+class CountingEmbedder(HashingEmbedder):
+    """Hashing embedder that records every text it is asked to embed."""
+    def __init__(self):
+        super().__init__(dimensions=64)
+        self.embedded: List[str] = []
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        self.embedded.extend(texts)
+        return super()._embed_batch(texts)
+
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    """Tests that the hashing backend returns unit vectors in batches of any size."""
+    embedder = HashingEmbedder(dimensions=32, batch_size=2)
+    texts = ["Call the dentist", "call the DENTIST", "Buy groceries", ""]
+
+    embeddings = embedder.embed(texts)
+
+    assert embeddings.shape == (4, 32)
+    assert np.allclose(embeddings[0], embeddings[1])
+    assert np.allclose(np.linalg.norm(embeddings[:3], axis=1), 1.0)
+    assert not embeddings[3].any()
+
+
+def test_cached_embedder_only_embeds_new_texts():
+    """Tests that repeated texts are served from the cache in input order."""
+    counting = CountingEmbedder()
+    embedder = CachedEmbedder(counting, max_entries=10)
+
+    first = embedder.embed(["a b", "c d"])
+    second = embedder.embed(["c d", "e f", "a b", "e f"])
+
+    assert counting.embedded == ["a b", "c d", "e f"]
+    assert np.allclose(second[0], first[1]) and np.allclose(second[2], first[0])
+    assert embedder.stats.hits == 2 and embedder.stats.misses == 3
+
+
+def test_upsert_reuses_embeddings_of_unchanged_documents():
+    """Tests that re-writing a task only re-embeds it when its title or description changed."""
+    ephemeral_client = chromadb.EphemeralClient(settings=Settings(allow_reset=True))
+    counting = CountingEmbedder()
+    store = ChromaTaskStore(client=ephemeral_client, embedder=counting)
+    tasks = [Task(title=f"Embedded Task {i}", description=None, due_date=None) for i in range(3)]
+    store.add_tasks(tasks)
+    counting.embedded.clear()
+
+    tasks[0].is_completed = True
+    tasks[1].description = "Now with a description"
+    store.add_tasks(tasks)
+
+    assert counting.embedded == ["Embedded Task 1 Now with a description"]
+    assert store.get_task(tasks[0].id).is_completed
+
+    counting.embedded.clear()
+    store.update_tasks({tasks[0].id: TaskUpdate(priority="High"), tasks[2].id: TaskUpdate(title="Retitled")})
+    assert counting.embedded == ["Retitled "]
+    ephemeral_client.reset()
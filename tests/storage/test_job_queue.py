@@ -0,0 +1,39 @@
+from src.models.task import Task
+from src.storage.job_queue import SQLiteJobQueue
+
+
+def test_jobs_are_claimed_by_priority_and_deduplicated():
+    queue = SQLiteJobQueue()
+    first, created = queue.enqueue("Buy milk")
+    duplicate, duplicate_created = queue.enqueue("  buy MILK! ", priority=5)
+    urgent, _ = queue.enqueue("Call the bank", priority=1)
+
+    assert created and not duplicate_created and duplicate.id == first.id
+    # The duplicate submission raised the pending job's priority.
+    assert [queue.claim().id, queue.claim().id] == [first.id, urgent.id]
+    assert queue.claim() is None
+
+    queue.complete(first.id, Task(title="Buy milk"))
+    failed = queue.fail(urgent.id, "Invalid task")
+    assert queue.get(first.id).task.title == "Buy milk"
+    assert failed.status == "failed" and failed.finished_at is not None
+    # Finished jobs no longer block a new job for the same query.
+    assert queue.enqueue("Buy milk")[1]
+
+
+def test_jobs_survive_a_restart_and_abandoned_jobs_are_retried(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    queue = SQLiteJobQueue(path, lease_seconds=0, max_attempts=2)
+    job, _ = queue.enqueue("Renew gym membership")
+    assert queue.claim().id == job.id
+    queue.close()
+
+    # The worker "died": its lease has run out, so the job is handed out again after a restart.
+    restarted = SQLiteJobQueue(path, lease_seconds=0, max_attempts=2)
+    retried = restarted.claim()
+    assert retried.id == job.id and retried.attempts == 2
+
+    # Out of attempts: the job is failed instead of being handed out a third time.
+    assert restarted.claim() is None
+    assert restarted.get(job.id).status == "failed"
+    assert restarted.counts() == {"failed": 1}
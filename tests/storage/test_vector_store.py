@@ -1,15 +1,25 @@
 import pytest
 from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 import chromadb
 from chromadb.config import Settings
 
+from src.storage.base_store import BaseTaskStore
+from src.storage.embeddings import HashingEmbedder
+from src.storage.sqlite_store import SQLiteTaskStore
+from src.storage.task_stats import TaskStatsIndex
 from src.storage.vector_store import ChromaTaskStore
-from src.models.task import Task
+from src.models.task import Task, TaskFilter, TaskUpdate
 
-@pytest.fixture
-def in_memory_chroma_store() -> Iterator[ChromaTaskStore]:
+
+@pytest.fixture(params=["chroma", "sqlite"])
+def task_store(request: pytest.FixtureRequest) -> Iterator[BaseTaskStore]:
     """
-    Pytest fixture that creates an isolated, in-memory ChromaTaskStore for each test.
+    Pytest fixture that creates an isolated, in-memory task store for each test.
+
+    Every test in this module runs against each storage backend, so this module
+    is the conformance suite for `BaseTaskStore` implementations. The SQLite
+    store uses a ChromaTaskStore as its vector index.
     
     It now creates a client with a special configuration that explicitly allows
     the `reset()` command, which is required for guaranteeing test isolation in
@@ -21,7 +31,9 @@ def in_memory_chroma_store() -> Iterator[ChromaTaskStore]:
     # Create the client using these specific settings.
     ephemeral_client = chromadb.EphemeralClient(settings=settings)
     
-    store = ChromaTaskStore(client=ephemeral_client)
+    store: BaseTaskStore = ChromaTaskStore(client=ephemeral_client, embedder=HashingEmbedder())
+    if request.param == "sqlite":
+        store = SQLiteTaskStore.for_testing(vector_index=store)
     
     yield store
     
@@ -29,31 +41,303 @@ def in_memory_chroma_store() -> Iterator[ChromaTaskStore]:
     ephemeral_client.reset()
 
 
-def test_add_and_get_task(in_memory_chroma_store: ChromaTaskStore):
+def test_add_and_get_task(task_store: BaseTaskStore):
     """Tests the basic add and retrieve functionality."""
     new_task = Task(title="Test Task", category="Work", priority="High", description=None, due_date=None)
     
-    in_memory_chroma_store.add_task(new_task)
-    retrieved_task = in_memory_chroma_store.get_task(new_task.id)
+    task_store.add_task(new_task)
+    retrieved_task = task_store.get_task(new_task.id)
     
     assert retrieved_task is not None
     assert retrieved_task.id == new_task.id
     assert retrieved_task.title == "Test Task"
 
-def test_list_tasks(in_memory_chroma_store: ChromaTaskStore):
+
+def test_list_tasks(task_store: BaseTaskStore):
     """Tests the listing functionality in a perfectly clean, isolated environment."""
     # This assertion will now pass because the teardown from the previous test worked.
-    assert len(in_memory_chroma_store.list_tasks()) == 0
+    assert len(task_store.list_tasks()) == 0
     
     task1 = Task(title="Task 1", description=None, due_date=None)
     task2 = Task(title="Task 2", description=None, due_date=None)
     
-    in_memory_chroma_store.add_task(task1)
-    in_memory_chroma_store.add_task(task2)
+    task_store.add_task(task1)
+    task_store.add_task(task2)
     
-    all_tasks = in_memory_chroma_store.list_tasks()
+    all_tasks = task_store.list_tasks()
     
     assert len(all_tasks) == 2
     task_titles = {t.title for t in all_tasks}
     assert "Task 1" in task_titles
-    assert "Task 2" in task_titles
\ No newline at end of file
+    assert "Task 2" in task_titles
+
+
+def test_add_tasks_bulk(task_store: BaseTaskStore):
+    """Tests that a batch of tasks is written in one call and can be read back."""
+    tasks = [Task(title=f"Bulk Task {i}", description=None, due_date=None) for i in range(5)]
+
+    task_store.add_tasks(tasks)
+    task_store.add_tasks([])
+
+    all_tasks = task_store.list_tasks()
+    assert len(all_tasks) == 5
+    assert {t.id for t in all_tasks} == {t.id for t in tasks}
+
+
+def test_task_exists_by_title_uses_normalized_index(task_store: BaseTaskStore):
+    """Tests exact and bulk duplicate checks, including tasks added after the index warmed up."""
+    task_store.add_task(Task(title="Buy Groceries", description=None, due_date=None))
+
+    assert task_store.task_exists_by_title("buy  groceries")
+    assert not task_store.task_exists_by_title("Walk the dog")
+
+    task_store.add_tasks([Task(title="Walk the dog", description=None, due_date=None)])
+
+    assert task_store.titles_exist(["Walk the dog", "Buy groceries", "Call mom"]) == {
+        "Walk the dog": True,
+        "Buy groceries": True,
+        "Call mom": False,
+    }
+
+
+def test_find_near_duplicates(task_store: BaseTaskStore):
+    """Tests that an identical text is reported as a near duplicate with similarity ~1."""
+    task = Task(title="Renew gym membership", description=None, due_date=None)
+    task_store.add_task(task)
+
+    matches = task_store.find_near_duplicates([task.title + " ", "Completely unrelated"], threshold=0.99)
+
+    assert [match_task.id for match_task, _ in matches[0]] == [task.id]
+    assert matches[0][0][1] >= 0.99
+    assert matches[1] == []
+
+
+def test_list_tasks_pagination_filters_and_projection(task_store: BaseTaskStore):
+    """Tests newest-first pages, server-side filters and field projection."""
+    base = datetime(2025, 11, 1, tzinfo=timezone.utc)
+    tasks = [
+        Task(
+            title=f"Task {i}",
+            category="Work" if i % 2 == 0 else "Personal",
+            created_at=base + timedelta(minutes=i),
+            due_date=base + timedelta(days=i),
+        )
+        for i in range(6)
+    ]
+    task_store.add_tasks(tasks)
+
+    first_page = task_store.list_tasks(limit=4)
+    second_page = task_store.list_tasks(limit=4, offset=4)
+    assert [t.title for t in first_page] == ["Task 5", "Task 4", "Task 3", "Task 2"]
+    assert [t.title for t in second_page] == ["Task 1", "Task 0"]
+
+    work_due_soon = task_store.list_tasks(
+        filters=TaskFilter(category="Work", due_before=base + timedelta(days=3))
+    )
+    assert [t.title for t in work_due_soon] == ["Task 2", "Task 0"]
+
+    projected = task_store.project_tasks(["id", "title"], limit=1)
+    assert projected == [{"id": tasks[5].id, "title": "Task 5"}]
+    with pytest.raises(ValueError):
+        task_store.project_tasks(["not_a_field"])
+
+
+def test_pages_are_newest_first_when_tasks_arrive_out_of_order(task_store: BaseTaskStore):
+    """Tests that pages follow `created_at`, not insertion order, and that projected dates match full JSON."""
+    now = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    recent = [Task(title=f"Recent {i}", created_at=now - timedelta(minutes=i)) for i in range(3)]
+    backdated = [Task(title=f"Backdated {i}", created_at=now - timedelta(days=100 + i)) for i in range(3)]
+    task_store.add_tasks(recent[:1])
+    task_store.add_tasks(backdated)
+    task_store.add_tasks(recent[1:])
+
+    assert [t.title for t in task_store.list_tasks(limit=3)] == ["Recent 0", "Recent 1", "Recent 2"]
+    assert [t.title for t in task_store.list_tasks(limit=2, offset=3)] == ["Backdated 0", "Backdated 1"]
+    task_store.add_task(Task(title="Newest", created_at=now + timedelta(minutes=1)))
+    assert [t.title for t in task_store.list_tasks(limit=2)] == ["Newest", "Recent 0"]
+    filtered = task_store.list_tasks(limit=1, offset=1, filters=TaskFilter(created_before=now - timedelta(days=1)))
+    assert [t.title for t in filtered] == ["Backdated 1"]
+
+    projected = task_store.project_tasks(["created_at"], limit=1)
+    assert projected == [{"created_at": "2026-05-01T00:01:00Z"}]
+
+
+def test_search_tasks_ranks_by_similarity(task_store: BaseTaskStore):
+    """Tests single and batched semantic search, with and without metadata filters."""
+    gym = Task(title="Renew gym membership", category="Fitness", description=None, due_date=None)
+    report = Task(title="Write quarterly report", category="Work", description=None, due_date=None)
+    task_store.add_tasks([gym, report])
+
+    results = task_store.search_tasks("Renew gym membership", k=2)
+    assert [r.task.id for r in results] == [gym.id, report.id]
+    assert results[0].score > results[1].score
+
+    batched = task_store.search_tasks_batch(
+        ["Write quarterly report", "Renew gym membership"], k=1, filters=TaskFilter(category="Work")
+    )
+    assert [[r.task.id for r in matches] for matches in batched] == [[report.id], [report.id]]
+
+
+def test_iter_tasks_pages_in_storage_order_and_resumes(task_store: BaseTaskStore):
+    """Tests that iteration spans several batches and that `start` resumes mid-stream."""
+    tasks = [Task(title=f"Task {i}", description=None, due_date=None) for i in range(5)]
+    task_store.add_tasks(tasks)
+
+    streamed = list(task_store.iter_tasks(batch_size=2))
+    resumed = list(task_store.iter_tasks(batch_size=2, start=3))
+
+    assert [t.id for t in streamed] == [t.id for t in tasks]
+    assert [t.id for t in resumed] == [t.id for t in tasks[3:]]
+
+
+def test_add_tasks_chunks_and_upserts(task_store: BaseTaskStore):
+    """Tests chunked writes, progress reporting, and replacing tasks with existing ids."""
+    tasks = [Task(title=f"Chunked {i}", description=None, due_date=None) for i in range(5)]
+    progress: list[int] = []
+
+    written = task_store.add_tasks(tasks, chunk_size=2, on_progress=progress.append)
+    assert written == 5
+    assert progress == [2, 2, 1]
+
+    assert task_store.task_exists_by_title("Chunked 0")
+    renamed = tasks[0].model_copy(update={"title": "Renamed"})
+    task_store.add_tasks([renamed])
+
+    assert len(task_store.list_tasks()) == 5
+    assert task_store.get_task(renamed.id).title == "Renamed"
+    assert task_store.task_exists_by_title("Renamed")
+    assert not task_store.task_exists_by_title("Chunked 0")
+
+
+def test_update_complete_and_delete_tasks(task_store: BaseTaskStore):
+    """Tests partial updates, bulk completion and deletion, and that the dedup index follows them."""
+    tasks = [
+        Task(title=f"Mutable Task {i}", description="Some details", due_date=datetime(2026, 5, 1, tzinfo=timezone.utc))
+        for i in range(3)
+    ]
+    task_store.add_tasks(tasks)
+    assert task_store.task_exists_by_title("Mutable Task 0")
+
+    updated = task_store.update_task(
+        tasks[0].id, TaskUpdate(title="Renamed Task", description=None, due_date=None)
+    )
+    assert updated is not None and updated.title == "Renamed Task" and updated.description is None
+    stored = task_store.get_task(tasks[0].id)
+    assert stored.title == "Renamed Task" and stored.due_date is None and stored.priority == "Medium"
+    assert task_store.task_exists_by_title("Renamed Task")
+    assert not task_store.task_exists_by_title("Mutable Task 0")
+    # Cleared fields must not match old filter values.
+    assert len(task_store.list_tasks(filters=TaskFilter(due_after=datetime(2026, 1, 1)))) == 2
+    assert task_store.update_task("missing", TaskUpdate(priority="High")) is None
+
+    assert task_store.complete_tasks([tasks[1].id, "missing"]) == [tasks[1].id]
+    assert [t.id for t in task_store.list_tasks(filters=TaskFilter(is_completed=True))] == [tasks[1].id]
+
+    assert task_store.delete_tasks([tasks[2].id, "missing"]) == [tasks[2].id]
+    assert task_store.get_task(tasks[2].id) is None
+    assert not task_store.task_exists_by_title("Mutable Task 2")
+    assert len(task_store.list_tasks()) == 2
+
+
+def test_task_stats_follow_writes(task_store: BaseTaskStore):
+    """Tests that the aggregate counts track adds, upserts, updates and deletes."""
+    now = datetime(2026, 5, 1, 12, tzinfo=timezone.utc)
+    assert task_store.task_stats(now).total == 0
+
+    overdue = Task(title="Overdue", category="Work", priority="High", due_date=now - timedelta(days=1))
+    soon = Task(title="Soon", category="Work", due_date=now + timedelta(days=2))
+    later = Task(title="Later", category="Study", due_date=now + timedelta(days=30))
+    task_store.add_tasks([overdue, soon, later, Task(title="Someday")])
+    stats = task_store.task_stats(now)
+    assert (stats.total, stats.open, stats.overdue, stats.due_soon, stats.no_due_date) == (4, 4, 1, 1, 1)
+    assert stats.by_category["Work"] == 2 and stats.by_category["Fitness"] == 0
+    assert task_store.task_stats(now, due_soon_days=60).due_soon == 2
+
+    task_store.complete_tasks([overdue.id])
+    task_store.update_task(soon.id, TaskUpdate(category="Personal", due_date=None))
+    task_store.add_tasks([later.model_copy(update={"priority": "Urgent"})])
+    task_store.delete_tasks([later.id])
+    stats = task_store.task_stats(now)
+    assert (stats.total, stats.completed, stats.overdue, stats.due_soon, stats.no_due_date) == (3, 1, 0, 0, 2)
+    assert stats.by_category == {"Work": 1, "Personal": 1, "Study": 0, "Fitness": 0, "Other": 1}
+    assert stats.by_priority == {"Low": 0, "Medium": 2, "High": 1, "Urgent": 0}
+
+
+def test_task_stats_count_due_dates_at_the_window_edges(task_store: BaseTaskStore):
+    """Tests that tasks due exactly at `now` or at the end of the window are due soon, not overdue."""
+    now = datetime(2026, 5, 1, 12, tzinfo=timezone.utc)
+    just_missed = Task(title="Just missed", due_date=now - timedelta(seconds=1))
+    task_store.add_tasks([
+        just_missed,
+        Task(title="Due now", due_date=now),
+        Task(title="Due at the end", due_date=now + timedelta(days=3)),
+        Task(title="Due after the end", due_date=now + timedelta(days=3, seconds=1)),
+        Task(title="Done", due_date=now - timedelta(days=1), is_completed=True),
+    ])
+    stats = task_store.task_stats(now, due_soon_days=3)
+    assert (stats.overdue, stats.due_soon) == (1, 2)
+
+    task_store.delete_tasks([just_missed.id])
+    assert task_store.task_stats(now, due_soon_days=3).overdue == 0
+
+
+def test_task_stats_index_counts_due_dates_across_many_days():
+    """Tests the day tree against a direct count, including the earliest and latest representable days."""
+    now = datetime(2026, 5, 1, 12, tzinfo=timezone.utc)
+    tasks = [Task(title=f"Task {n}", due_date=now + timedelta(days=n * 7 % 200 - 100, hours=n)) for n in range(300)]
+    tasks += [
+        Task(title="Ancient", due_date=datetime(1, 1, 1, tzinfo=timezone.utc)),
+        Task(title="Far off", due_date=datetime(9999, 12, 30, tzinfo=timezone.utc)),
+    ]
+    index = TaskStatsIndex()
+    index.warm(tasks)
+    for task in tasks[::3]:
+        index.discard(task)
+    remaining = [task for position, task in enumerate(tasks) if position % 3]
+
+    for offset in (-150, -3, 0, 5, 120):
+        at = now + timedelta(days=offset)
+        stats = index.snapshot(at, due_soon_days=10)
+        assert stats.overdue == sum(task.due_date < at for task in remaining)
+        assert stats.due_soon == sum(at <= task.due_date <= at + timedelta(days=10) for task in remaining)
+
+
+def test_chroma_task_stats_are_persisted_and_rebuilt(tmp_path):
+    """Tests that saved counters are reused on reopen, and rebuilt when writes were made after the last save."""
+    path = str(tmp_path / "chroma")
+    store = ChromaTaskStore.for_production(path, embedder=HashingEmbedder())
+    store.add_task(Task(title="Before warm-up"))
+    assert store.task_stats().total == 1
+    store.add_task(Task(title="After warm-up", is_completed=True))
+    store.flush()
+
+    reopened = ChromaTaskStore.for_production(path, embedder=HashingEmbedder(), stats_save_every=2)
+    assert reopened._stats.is_warm
+    assert (reopened.task_stats().total, reopened.task_stats().completed) == (2, 1)
+
+    # Every second write saves the counters.
+    reopened.add_task(Task(title="Third"))
+    reopened.add_task(Task(title="Fourth"))
+    assert ChromaTaskStore.for_production(path, embedder=HashingEmbedder())._stats.is_warm
+
+    # A write that was never saved (e.g. the process crashed) leaves a stale file behind, which is discarded.
+    reopened.add_task(Task(title="Unsaved"))
+    stale = ChromaTaskStore.for_production(path, embedder=HashingEmbedder())
+    assert not stale._stats.is_warm
+    assert stale.task_stats().total == 5
+
+
+def test_sqlite_task_counts_are_backfilled_for_existing_databases(tmp_path):
+    """Tests that a database from before the counts table gets it filled from the stored tasks."""
+    path = str(tmp_path / "tasks.db")
+    store = SQLiteTaskStore(path)
+    store.add_tasks([Task(title="Done", is_completed=True), Task(title="Open", category="Work")])
+    with store._transaction() as conn:
+        conn.execute("DROP TABLE task_counts")
+    store.close()
+
+    reopened = SQLiteTaskStore(path)
+    stats = reopened.task_stats()
+    assert (stats.total, stats.completed, stats.by_category["Work"], stats.no_due_date) == (2, 1, 1, 1)
+    reopened.delete_tasks([task.id for task in reopened.list_tasks()])
+    assert reopened.task_stats().total == 0
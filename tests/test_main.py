@@ -0,0 +1,29 @@
+import pytest
+
+from src.main import TaskView, parse_list_command
+from src.models.task import Task, TaskFilter
+
+
+def test_view_pages_newest_first_and_is_updated_in_place():
+    # The store lists tasks newest first.
+    view = TaskView.from_store([Task(title=f"Task {i}", category="Work" if i % 2 else "Personal") for i in range(5, 0, -1)], page_size=2)
+    view.add(Task(title="Task 6", category="Work", is_completed=True))
+
+    rows, total = view.page(1)
+    assert total == 6 and [(position, task.title) for position, task in rows] == [(6, "Task 6"), (5, "Task 5")]
+    rows, _ = view.page(3)
+    assert [task.title for _, task in rows] == ["Task 2", "Task 1"]
+
+    rows, total = view.page(1, TaskFilter(category="Work", is_completed=False))
+    assert total == 3 and [task.title for _, task in rows] == ["Task 5", "Task 3"]
+    assert "page 1/2, 3 tasks" in view.render(1, TaskFilter(category="Work", is_completed=False)).title
+
+
+def test_parse_list_command():
+    assert parse_list_command("") == (1, TaskFilter())
+    page, filters = parse_list_command("--page 3 --category Work --priority High --open")
+    assert page == 3 and filters == TaskFilter(category="Work", priority="High", is_completed=False)
+
+    for invalid in ("--page 0", "--category Chores", "--done --open", "--color red"):
+        with pytest.raises(ValueError):
+            parse_list_command(invalid)